@@ -1,9 +1,13 @@
-from typing import Optional
+from typing import Any, AsyncIterable, List, Optional
 
-from livekit import agents
-from livekit.agents import llm
+from livekit import agents, rtc
+from livekit.agents import ModelSettings, llm
 
+from core.context import SessionContext
+from core.endpointing import record_word_pauses
 from core.logging import get_logger
+from core.prompt import PromptAssembler
+from core.recorder import SessionRecorder
 
 logger = get_logger("agents.base_agent")
 
@@ -15,9 +19,15 @@ class BaseAgent(agents.Agent):
         instructions: str,
         greeting: Optional[str] = None,
         chat_ctx: Optional[llm.ChatContext] = None,
+        prompt_assembler: Optional[PromptAssembler] = None,
+        recorder: Optional[SessionRecorder] = None,
     ):
+        if prompt_assembler is not None:
+            instructions = prompt_assembler.instructions(instructions)
         super().__init__(instructions=instructions, chat_ctx=chat_ctx)
         self._greeting = greeting
+        self._prompt_assembler = prompt_assembler
+        self._recorder = recorder
 
     @property
     def greeting(self) -> Optional[str]:
@@ -44,3 +54,55 @@ class BaseAgent(agents.Agent):
             )
         except Exception as e:
             logger.error(f"Error logging user turn: {e}")
+
+        session_ctx = self._session_context()
+        if self._prompt_assembler and session_ctx:
+            self._prompt_assembler.inject_session_state(turn_ctx, session_ctx)
+
+    # Pipeline nodes: unchanged unless the session is being recorded (and,
+    # for STT, unless endpointing learns from the word timings)
+
+    def stt_node(
+        self, audio: AsyncIterable[rtc.AudioFrame], model_settings: ModelSettings
+    ) -> AsyncIterable[Any]:
+        default = agents.Agent.default.stt_node
+        if self._recorder is not None:
+            audio = self._recorder.record_audio_in(audio)
+        events = default(self, audio, model_settings)
+        if self._recorder is not None:
+            events = self._recorder.record_stt(events)
+
+        session_ctx = self._session_context()
+        if session_ctx and session_ctx.endpointing:
+            events = record_word_pauses(events, session_ctx.endpointing)
+        return events
+
+    def llm_node(
+        self,
+        chat_ctx: llm.ChatContext,
+        tools: List[Any],
+        model_settings: ModelSettings,
+    ) -> AsyncIterable[Any]:
+        default = agents.Agent.default.llm_node
+        if self._recorder is None:
+            return default(self, chat_ctx, tools, model_settings)
+        return self._recorder.record_llm(
+            chat_ctx, default(self, chat_ctx, tools, model_settings)
+        )
+
+    def tts_node(
+        self, text: AsyncIterable[str], model_settings: ModelSettings
+    ) -> AsyncIterable[rtc.AudioFrame]:
+        default = agents.Agent.default.tts_node
+        if self._recorder is None:
+            return default(self, text, model_settings)
+        text = self._recorder.record_tts_text(text)
+        return self._recorder.record_tts(default(self, text, model_settings))
+
+    def _session_context(self) -> Optional[SessionContext]:
+        try:
+            userdata = self.session.userdata
+        except ValueError:
+            # No userdata was passed to the AgentSession
+            return None
+        return userdata if isinstance(userdata, SessionContext) else None
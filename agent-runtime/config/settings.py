@@ -8,6 +8,15 @@ class RuntimeSettings(BaseSettings):
     PLATFORM_API_URL: str = "http://localhost:8000"
     LOG_LEVEL: str = "INFO"
     WORKER_NUM_IDLE_PROCESSES: int = 3
+    # Empty = automatic dispatch to every new room
+    AGENT_NAME: str = ""
+
+    # Drain & Migration (the node drains while the flag file exists; live
+    # sessions are checkpointed to a directory every worker can read)
+    DRAIN_FLAG_FILE: str = ""
+    DRAIN_POLL_INTERVAL_SECONDS: float = 2.0
+    SESSION_CHECKPOINT_DIR: str = ""
+    MIGRATION_HANDOFF_TIMEOUT_SECONDS: float = 30.0
 
     # STT (Deepgram)
     DEEPGRAM_API_KEY: str
@@ -18,6 +27,9 @@ class RuntimeSettings(BaseSettings):
     OPENAI_API_KEY: str
     OPENAI_BASE_URL: str = "https://api.openai.com/v1"
     LLM_MODEL: str = "gpt-4.1-mini"
+    # Fast model for acknowledgements and small talk (empty = always LLM_MODEL)
+    LLM_FAST_MODEL: str = ""
+    LLM_FAST_MAX_WORDS: int = 12
 
     # TTS (Cartesia)
     CARTESIA_API_KEY: str
@@ -25,6 +37,84 @@ class RuntimeSettings(BaseSettings):
     TTS_MODEL: str = "sonic"
     TTS_VOICE_ID: str
 
+    # TTS Segmentation (characters of LLM text per chunk sent to Cartesia; the
+    # first chunk ends at the first clause so audio starts early)
+    TTS_SEGMENTER_ENABLED: bool = True
+    TTS_FIRST_CHUNK_MIN_CHARS: int = 20
+    TTS_CHUNK_MIN_CHARS: int = 80
+    TTS_CHUNK_MAX_CHARS: int = 300
+
+    # VAD (directory with weights exported by utils/vad_weights.py; empty =
+    # load the bundled model privately in each process)
+    VAD_SHARED_MODEL_DIR: str = ""
+
+    # Turn Detector Sidecar (empty socket path = in-worker inference)
+    TURN_DETECTOR_SOCKET_PATH: str = ""
+    TURN_DETECTOR_BATCH_WINDOW_MS: float = 5.0
+    TURN_DETECTOR_MAX_BATCH_SIZE: int = 16
+
+    # Endpointing (seconds of silence before the user's turn is committed)
+    ENDPOINTING_MIN_DELAY: float = 0.5
+    ENDPOINTING_MAX_DELAY: float = 3.0
+    ADAPTIVE_ENDPOINTING_ENABLED: bool = True
+    ADAPTIVE_ENDPOINTING_MIN_DELAY_FLOOR: float = 0.3
+    ADAPTIVE_ENDPOINTING_MIN_DELAY_CEILING: float = 1.2
+    ADAPTIVE_ENDPOINTING_MAX_DELAY_FLOOR: float = 1.5
+    ADAPTIVE_ENDPOINTING_MAX_DELAY_CEILING: float = 6.0
+
+    # CPU Governor (fractions of total node CPU)
+    CPU_GOVERNOR_ENABLED: bool = True
+    CPU_GOVERNOR_HIGH_WATERMARK: float = 0.85
+    CPU_GOVERNOR_LOW_WATERMARK: float = 0.65
+    CPU_GOVERNOR_INTERVAL_SECONDS: float = 2.0
+    # Under load, noise cancellation is skipped only for users whose
+    # microphone noise floor (probed at session start) is below this level
+    CPU_GOVERNOR_NOISE_PROBE_SECONDS: float = 1.0
+    CPU_GOVERNOR_CLEAN_NOISE_FLOOR_DBFS: float = -60.0
+
+    # Chat History Spill (directory for per-session segment files; empty =
+    # keep the whole history in memory)
+    CHAT_SPILL_DIR: str = ""
+    CHAT_SPILL_KEEP_ITEMS: int = 40
+    CHAT_SPILL_MAX_INLINE_CHARS: int = 2000
+
+    # Observer (background extraction of observations and flags per turn)
+    OBSERVER_ENABLED: bool = True
+    OBSERVER_MODEL: str = "gpt-4.1-nano"
+    OBSERVER_QUEUE_SIZE: int = 4
+    OBSERVER_MAX_OBSERVATIONS: int = 20
+
+    # Event Loop Monitor
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL_MS: float = 100.0
+    LOOP_MONITOR_SLOW_CALLBACK_MS: float = 100.0
+
+    # Sampling Profiler (room patterns to profile at start and participant
+    # identities allowed to trigger it over RPC, both comma-separated)
+    PROFILER_OUTPUT_DIR: str = "/tmp/agent-profiles"
+    PROFILER_DURATION_SECONDS: float = 30.0
+    PROFILER_INTERVAL_MS: float = 5.0
+    PROFILER_ROOMS: str = ""
+    PROFILER_RPC_IDENTITIES: str = ""
+
+    # Session Recording (rooms matching these comma-separated patterns are
+    # recorded for offline replay)
+    SESSION_RECORDING_ROOMS: str = ""
+    SESSION_RECORDING_DIR: str = "/tmp/agent-recordings"
+
+    # Runtime Metrics (the worker serves /metrics on this port, aggregated
+    # from every job process through the multiprocess directory; 0 = off)
+    PROMETHEUS_PORT: int = 9464
+    PROMETHEUS_MULTIPROC_DIR: str = "/tmp/agent-prometheus"
+
+    # Prompt (prepended to every agent's instructions; keep it fixed so the
+    # provider can cache the prompt prefix)
+    PLATFORM_PREAMBLE: str = (
+        "You are an AI agent on a live interactive platform. Your replies are "
+        "spoken aloud unless the session is text-only, so avoid markdown, "
+        "lists and emoji."
+    )
+
     # Agent Defaults
     DEFAULT_AGENT_INSTRUCTIONS: str = (
         "You are a helpful voice assistant. Be concise and friendly."
@@ -1,18 +1,22 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional
 
+from core.endpointing import AdaptiveEndpointing
+
 
 @dataclass
 class SessionContext:
     user_id: Optional[str] = None
     user_name: Optional[str] = None
     session_template_id: Optional[str] = None
+    modality_profile: Optional[str] = None
     observations: List[str] = field(default_factory=list)
     session_flags: Dict[str, Any] = field(default_factory=dict)
     modality_state: Dict[str, bool] = field(
         default_factory=lambda: {"camera": False, "screenshare": False}
     )
     panel_state: Dict[str, Any] = field(default_factory=dict)
+    endpointing: Optional[AdaptiveEndpointing] = None
 
     def add_observation(self, observation: str) -> None:
         """Add a new observation to the session context."""
@@ -25,3 +29,17 @@ class SessionContext:
     def get_flag(self, key: str, default: Any = None) -> Any:
         """Get a session flag."""
         return self.session_flags.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable snapshot of the session state, without the controller."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name != "endpointing"
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionContext":
+        """Rebuild a SessionContext from `to_dict()` output."""
+        names = {f.name for f in fields(cls) if f.name != "endpointing"}
+        return cls(**{k: v for k, v in data.items() if k in names})
@@ -0,0 +1,244 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from livekit import api, rtc
+from livekit.agents import AgentSession, JobContext, llm
+from livekit.agents.worker import _DefaultLoadCalc
+
+from config.settings import RuntimeSettings
+from core.context import SessionContext
+from core.history import ChatHistorySpill
+
+logger = logging.getLogger("core.drain")
+
+# Agent states in which the session can be handed over without cutting a reply
+IDLE_AGENT_STATES = ("idle", "listening")
+
+
+def is_draining(flag_file: str) -> bool:
+    """The node is draining while the flag file exists."""
+    return bool(flag_file) and os.path.exists(flag_file)
+
+
+def create_load_fnc(flag_file: str) -> Callable[[Any], float]:
+    """
+    Wrap the SDK's default load function so the worker reports itself as
+    full while draining, which stops LiveKit from assigning it new jobs.
+    """
+
+    def load_fnc(worker: Any) -> float:
+        if is_draining(flag_file):
+            return 1.0
+        return _DefaultLoadCalc.get_load(worker)
+
+    return load_fnc
+
+
+@dataclass
+class SessionCheckpoint:
+    """Everything a fresh worker needs to carry on a live session."""
+
+    room: str
+    session_ctx: Dict[str, Any]
+    chat_ctx: Dict[str, Any]
+    endpointing_delays: Optional[Tuple[float, float]] = None
+    created_at: float = field(default_factory=time.time)
+
+    def save(self, directory: str) -> str:
+        """Write the checkpoint atomically and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.room}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "SessionCheckpoint":
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def restore_chat_ctx(self) -> llm.ChatContext:
+        return llm.ChatContext.from_dict(self.chat_ctx)
+
+
+def load_job_checkpoint(job_metadata: Optional[str]) -> Optional[SessionCheckpoint]:
+    """
+    Load the checkpoint referenced by a migration dispatch, if any, and
+    remove it so it is only restored once.
+    """
+    if not job_metadata:
+        return None
+    try:
+        path = json.loads(job_metadata).get("checkpoint")
+    except (ValueError, AttributeError):
+        return None
+    if not path:
+        return None
+
+    try:
+        checkpoint = SessionCheckpoint.load(path)
+    except (OSError, ValueError, TypeError) as e:
+        logger.error(f"Failed to load session checkpoint {path}: {e}")
+        return None
+
+    os.unlink(path)
+    logger.info(
+        f"Restoring session for room {checkpoint.room} from checkpoint taken "
+        f"{time.time() - checkpoint.created_at:.1f}s ago"
+    )
+    return checkpoint
+
+
+class SessionMigrator:
+    """
+    Moves a live session to a fresh worker when the node starts draining.
+
+    Once the drain flag appears, the migrator waits for a pause in the
+    conversation, checkpoints the SessionContext and chat history, stops
+    listening, dispatches a new agent to the same room with a reference to
+    the checkpoint, and shuts this job down as soon as the new agent joins.
+    """
+
+    def __init__(
+        self,
+        ctx: JobContext,
+        session: AgentSession,
+        session_ctx: SessionContext,
+        *,
+        settings: RuntimeSettings,
+        history_spill: Optional[ChatHistorySpill] = None,
+    ):
+        self._ctx = ctx
+        self._session = session
+        self._session_ctx = session_ctx
+        self._settings = settings
+        self._history_spill = history_spill
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        interval = self._settings.DRAIN_POLL_INTERVAL_SECONDS
+        while not is_draining(self._settings.DRAIN_FLAG_FILE):
+            await asyncio.sleep(interval)
+
+        logger.info(f"Node draining; migrating session in room {self._ctx.room.name}")
+        try:
+            await self.migrate()
+        except Exception as e:
+            # The session keeps running here until it ends on its own
+            logger.error(f"Session migration failed: {e}")
+
+    async def migrate(self) -> None:
+        await self._wait_until_idle()
+
+        path = self.checkpoint().save(self._settings.SESSION_CHECKPOINT_DIR)
+        if self._session.input.audio is not None:
+            self._session.input.set_audio_enabled(False)
+
+        agent_joined = asyncio.Event()
+
+        def on_participant_connected(participant: rtc.RemoteParticipant):
+            if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_AGENT:
+                agent_joined.set()
+
+        self._ctx.room.on("participant_connected", on_participant_connected)
+        started = time.monotonic()
+        await self._dispatch(path)
+
+        try:
+            await asyncio.wait_for(
+                agent_joined.wait(),
+                self._settings.MIGRATION_HANDOFF_TIMEOUT_SECONDS,
+            )
+            logger.info(
+                f"Session handed over in {time.monotonic() - started:.1f}s; "
+                "shutting down"
+            )
+        except asyncio.TimeoutError:
+            logger.warning("New agent did not join in time; shutting down anyway")
+        finally:
+            self._ctx.room.off("participant_connected", on_participant_connected)
+
+        self._ctx.shutdown(reason="session migrated to a new worker")
+
+    def checkpoint(self) -> SessionCheckpoint:
+        history = self._session.history
+        if self._history_spill:
+            history = self._history_spill.export(history)
+
+        endpointing = self._session_ctx.endpointing
+        return SessionCheckpoint(
+            room=self._ctx.room.name,
+            session_ctx=self._session_ctx.to_dict(),
+            chat_ctx=history.to_dict(exclude_timestamp=False),
+            endpointing_delays=(
+                (endpointing.min_delay, endpointing.max_delay) if endpointing else None
+            ),
+        )
+
+    async def _wait_until_idle(self) -> None:
+        deadline = time.monotonic() + self._settings.MIGRATION_HANDOFF_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if (
+                self._session.agent_state in IDLE_AGENT_STATES
+                and self._session.user_state != "speaking"
+            ):
+                return
+            await asyncio.sleep(0.1)
+
+    async def _dispatch(self, checkpoint_path: str) -> None:
+        lkapi = api.LiveKitAPI(
+            self._settings.LIVEKIT_URL,
+            self._settings.LIVEKIT_API_KEY,
+            self._settings.LIVEKIT_API_SECRET,
+        )
+        try:
+            await lkapi.agent_dispatch.create_dispatch(
+                api.CreateAgentDispatchRequest(
+                    agent_name=self._settings.AGENT_NAME,
+                    room=self._ctx.room.name,
+                    metadata=json.dumps({"checkpoint": checkpoint_path}),
+                )
+            )
+        finally:
+            await lkapi.aclose()
+
+
+def create_session_migrator(
+    settings: RuntimeSettings,
+    ctx: JobContext,
+    session: AgentSession,
+    session_ctx: SessionContext,
+    history_spill: Optional[ChatHistorySpill] = None,
+) -> Optional[SessionMigrator]:
+    """
+    Creates a SessionMigrator if draining and checkpoints are configured.
+    """
+    if not (settings.DRAIN_FLAG_FILE and settings.SESSION_CHECKPOINT_DIR):
+        return None
+    return SessionMigrator(
+        ctx,
+        session,
+        session_ctx,
+        settings=settings,
+        history_spill=history_spill,
+    )
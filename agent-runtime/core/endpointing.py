@@ -0,0 +1,220 @@
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, Deque, Optional, Sequence, Tuple
+
+from livekit.agents import AgentSession, metrics, stt
+from livekit.agents.utils import is_given
+
+from config.settings import RuntimeSettings
+
+logger = logging.getLogger("core.endpointing")
+
+# Minimum change (seconds) before a new delay is pushed to the session
+ADJUSTMENT_HYSTERESIS = 0.05
+
+# Silero's default min_silence_duration: a silence this long ends the VAD's
+# speech segment, so it is a pause between sentences, not between words
+VAD_MIN_SILENCE_DURATION = 0.55
+
+
+def _percentile(samples: Deque[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _clamp(value: float, bounds: Tuple[float, float]) -> float:
+    low, high = bounds
+    return max(low, min(high, value))
+
+
+@dataclass
+class AdaptiveEndpointing:
+    """
+    Learns a user's pause lengths during a session and derives endpointing
+    delays from them.
+
+    Inter-word pauses are the gaps between the STT's word timestamps, up to
+    the VAD's minimum silence; inter-sentence pauses are the silences after
+    which the user resumed speaking before the turn was committed. The
+    minimum delay tracks the long tail of inter-word pauses and the maximum
+    delay the long tail of inter-sentence pauses, both clamped to the
+    configured bounds.
+    """
+
+    min_delay: float = 0.5
+    max_delay: float = 3.0
+    min_delay_bounds: Tuple[float, float] = (0.3, 1.2)
+    max_delay_bounds: Tuple[float, float] = (1.5, 6.0)
+    max_word_pause: float = VAD_MIN_SILENCE_DURATION
+    window_size: int = 50
+    min_samples: int = 5
+    word_pauses: Deque[float] = field(default_factory=deque)
+    sentence_pauses: Deque[float] = field(default_factory=deque)
+    eou_delays: Deque[float] = field(default_factory=deque)
+
+    _last_word_end: Optional[float] = field(default=None, init=False, repr=False)
+    _speech_ended_at: Optional[float] = field(default=None, init=False, repr=False)
+    _previous_eou_mean: Optional[float] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.word_pauses = deque(self.word_pauses, maxlen=self.window_size)
+        self.sentence_pauses = deque(self.sentence_pauses, maxlen=self.window_size)
+        self.eou_delays = deque(self.eou_delays, maxlen=self.window_size)
+
+    def on_final_words(self, words: Sequence[Tuple[float, float]]) -> None:
+        """
+        Record the gaps before each (start, end) word of a final transcript.
+
+        Word times are audio-stream seconds, so the gap to the previous
+        final's last word is measured too; the STT splits finals at short
+        pauses. Gaps the VAD would treat as end of speech are skipped.
+        """
+        for start, end in words:
+            if self._last_word_end is not None:
+                gap = max(0.0, start - self._last_word_end)
+                if gap < self.max_word_pause:
+                    self.word_pauses.append(gap)
+            self._last_word_end = end
+
+    def on_speech_started(self, now: float) -> None:
+        """Record an inter-sentence pause if the user resumed mid-turn."""
+        if self._speech_ended_at is not None:
+            self.sentence_pauses.append(now - self._speech_ended_at)
+        self._speech_ended_at = None
+
+    def on_speech_ended(self, now: float) -> None:
+        self._speech_ended_at = now
+
+    def on_turn_committed(self) -> None:
+        """Reset per-turn timers once the user's turn has been committed."""
+        self._last_word_end = None
+        self._speech_ended_at = None
+
+    def record_eou_delay(self, delay: float) -> None:
+        self.eou_delays.append(delay)
+
+    def recompute(self) -> Optional[Tuple[float, float]]:
+        """
+        Derive new (min, max) endpointing delays from the observed pauses.
+
+        Returns:
+            The new delays if they moved by more than the hysteresis,
+            otherwise None.
+        """
+        if len(self.word_pauses) < self.min_samples:
+            return None
+
+        new_min = _clamp(
+            _percentile(self.word_pauses, 0.9) * 1.2, self.min_delay_bounds
+        )
+        new_max = self.max_delay
+        if len(self.sentence_pauses) >= self.min_samples:
+            new_max = _percentile(self.sentence_pauses, 0.9) * 1.2
+        new_max = _clamp(max(new_max, new_min), self.max_delay_bounds)
+
+        if (
+            abs(new_min - self.min_delay) < ADJUSTMENT_HYSTERESIS
+            and abs(new_max - self.max_delay) < ADJUSTMENT_HYSTERESIS
+        ):
+            return None
+
+        self._log_adjustment(new_min, new_max)
+        self.min_delay, self.max_delay = new_min, new_max
+        return new_min, new_max
+
+    def _log_adjustment(self, new_min: float, new_max: float) -> None:
+        eou_mean = (
+            sum(self.eou_delays) / len(self.eou_delays) if self.eou_delays else None
+        )
+        latency_note = "no end-of-utterance samples yet"
+        if eou_mean is not None and self._previous_eou_mean is not None:
+            latency_note = (
+                f"mean end-of-utterance delay {self._previous_eou_mean:.3f}s -> "
+                f"{eou_mean:.3f}s ({eou_mean - self._previous_eou_mean:+.3f}s)"
+            )
+        elif eou_mean is not None:
+            latency_note = f"mean end-of-utterance delay {eou_mean:.3f}s"
+
+        logger.info(
+            f"Endpointing adjusted: min {self.min_delay:.2f}s -> {new_min:.2f}s, "
+            f"max {self.max_delay:.2f}s -> {new_max:.2f}s "
+            f"(word pauses: {len(self.word_pauses)}, "
+            f"sentence pauses: {len(self.sentence_pauses)}; {latency_note})"
+        )
+
+        if eou_mean is not None:
+            self._previous_eou_mean = eou_mean
+        self.eou_delays.clear()
+
+
+def create_endpointing_controller(settings: RuntimeSettings) -> AdaptiveEndpointing:
+    """
+    Creates an AdaptiveEndpointing controller seeded with the configured
+    delays and bounds.
+    """
+    return AdaptiveEndpointing(
+        min_delay=settings.ENDPOINTING_MIN_DELAY,
+        max_delay=settings.ENDPOINTING_MAX_DELAY,
+        min_delay_bounds=(
+            settings.ADAPTIVE_ENDPOINTING_MIN_DELAY_FLOOR,
+            settings.ADAPTIVE_ENDPOINTING_MIN_DELAY_CEILING,
+        ),
+        max_delay_bounds=(
+            settings.ADAPTIVE_ENDPOINTING_MAX_DELAY_FLOOR,
+            settings.ADAPTIVE_ENDPOINTING_MAX_DELAY_CEILING,
+        ),
+    )
+
+
+async def record_word_pauses(
+    events: AsyncIterable[Any], controller: AdaptiveEndpointing
+) -> AsyncIterable[Any]:
+    """Pass STT events through, feeding final word timings to the controller."""
+    async for ev in events:
+        if (
+            isinstance(ev, stt.SpeechEvent)
+            and ev.type == stt.SpeechEventType.FINAL_TRANSCRIPT
+            and ev.alternatives
+        ):
+            controller.on_final_words(
+                [
+                    (word.start_time, word.end_time)
+                    for word in ev.alternatives[0].words or []
+                    if is_given(word.start_time) and is_given(word.end_time)
+                ]
+            )
+        yield ev
+
+
+def register_endpointing_handlers(
+    session: AgentSession, controller: AdaptiveEndpointing
+) -> None:
+    """Feed session events into the controller and apply its adjustments."""
+
+    @session.on("user_state_changed")
+    def on_user_state_changed(ev: Any):
+        if ev.new_state == "speaking":
+            controller.on_speech_started(time.monotonic())
+        elif ev.old_state == "speaking":
+            controller.on_speech_ended(time.monotonic())
+
+    @session.on("metrics_collected")
+    def on_metrics_collected(ev: Any):
+        if isinstance(ev.metrics, metrics.EOUMetrics):
+            controller.record_eou_delay(ev.metrics.end_of_utterance_delay)
+
+    @session.on("conversation_item_added")
+    def on_conversation_item_added(ev: Any):
+        if getattr(ev.item, "role", None) != "user":
+            return
+
+        controller.on_turn_committed()
+        adjusted = controller.recompute()
+        if adjusted:
+            min_delay, max_delay = adjusted
+            session.update_options(
+                min_endpointing_delay=min_delay, max_endpointing_delay=max_delay
+            )
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import RuntimeSettings
+
+logger = logging.getLogger("core.governor")
+
+
+@dataclass
+class DegradableStage:
+    """An optional processing stage that can be switched to a cheaper mode."""
+
+    name: str
+    degrade: Callable[[], None]
+    restore: Callable[[], None]
+
+
+def _read_cpu_times() -> Optional[Tuple[int, int]]:
+    """Return (busy, total) jiffies for the whole node from /proc/stat."""
+    try:
+        with open("/proc/stat") as f:
+            fields = [int(v) for v in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+    total = sum(fields)
+    return total - idle, total
+
+
+def _load_average_utilization() -> float:
+    """Node utilization estimate from the 1-minute load average."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return 0.0
+
+
+class CpuGovernor:
+    """
+    Per-process CPU governor.
+
+    Samples node CPU utilization and this process's own CPU time (one job per
+    process, so this is the session's processing cost). When the node crosses
+    the high watermark, registered stages are switched to their cheaper mode;
+    once it falls below the low watermark they are switched back.
+    """
+
+    def __init__(
+        self,
+        *,
+        high_watermark: float = 0.85,
+        low_watermark: float = 0.65,
+        interval: float = 2.0,
+    ):
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._interval = interval
+        self._stages: Dict[str, DegradableStage] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self._last_cpu_times = _read_cpu_times()
+        self._last_process_time = time.process_time()
+        self._last_sample_at = time.monotonic()
+
+        self.node_utilization = _load_average_utilization()
+        self.session_cost = 0.0  # CPU cores used by this process
+
+        self._degraded_since: Optional[float] = None
+        self._degraded_total = 0.0
+        self._episodes = 0
+
+    @property
+    def degraded(self) -> bool:
+        return self._degraded_since is not None
+
+    def is_saturated(self) -> bool:
+        return self.node_utilization >= self._high_watermark
+
+    def register_stage(
+        self, name: str, degrade: Callable[[], None], restore: Callable[[], None]
+    ) -> None:
+        """Register an optional stage; it is degraded at once if under load."""
+        stage = DegradableStage(name=name, degrade=degrade, restore=restore)
+        self._stages[name] = stage
+        if self.degraded:
+            self._apply(stage.name, stage.degrade)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.degraded:
+            self._degraded_total += time.monotonic() - self._degraded_since
+        logger.info(
+            f"CPU governor summary: degraded {self._episodes} time(s) "
+            f"for {self._degraded_total:.1f}s in total"
+        )
+
+    def sample(self) -> None:
+        """Update node utilization and session cost since the last sample."""
+        now = time.monotonic()
+        process_time = time.process_time()
+        elapsed = now - self._last_sample_at
+        if elapsed > 0:
+            self.session_cost = (process_time - self._last_process_time) / elapsed
+        self._last_process_time = process_time
+        self._last_sample_at = now
+
+        cpu_times = _read_cpu_times()
+        if cpu_times and self._last_cpu_times:
+            busy = cpu_times[0] - self._last_cpu_times[0]
+            total = cpu_times[1] - self._last_cpu_times[1]
+            if total > 0:
+                self.node_utilization = busy / total
+        else:
+            self.node_utilization = _load_average_utilization()
+        self._last_cpu_times = cpu_times
+
+    def evaluate(self) -> None:
+        """Degrade or restore the registered stages based on the last sample."""
+        if not self.degraded and self.node_utilization >= self._high_watermark:
+            self._degraded_since = time.monotonic()
+            self._episodes += 1
+            logger.warning(
+                f"Node CPU at {self.node_utilization:.0%} "
+                f"(session cost {self.session_cost:.2f} cores); "
+                f"degrading stages: {self._stage_names()}"
+            )
+            for stage in self._stages.values():
+                self._apply(stage.name, stage.degrade)
+
+        elif self.degraded and self.node_utilization <= self._low_watermark:
+            duration = time.monotonic() - self._degraded_since
+            self._degraded_total += duration
+            self._degraded_since = None
+            logger.info(
+                f"Node CPU back to {self.node_utilization:.0%}; restoring stages "
+                f"{self._stage_names()} after {duration:.1f}s degraded"
+            )
+            for stage in self._stages.values():
+                self._apply(stage.name, stage.restore)
+
+    def _stage_names(self) -> List[str]:
+        return list(self._stages)
+
+    def _apply(self, name: str, action: Callable[[], None]) -> None:
+        try:
+            action()
+        except Exception as e:
+            logger.error(f"Failed to switch stage '{name}': {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            self.sample()
+            self.evaluate()
+
+
+def create_cpu_governor(settings: RuntimeSettings) -> CpuGovernor:
+    """
+    Creates a CpuGovernor configured from the runtime settings.
+    """
+    return CpuGovernor(
+        high_watermark=settings.CPU_GOVERNOR_HIGH_WATERMARK,
+        low_watermark=settings.CPU_GOVERNOR_LOW_WATERMARK,
+        interval=settings.CPU_GOVERNOR_INTERVAL_SECONDS,
+    )
@@ -0,0 +1,234 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from livekit.agents import Agent, AgentSession, llm
+
+from config.settings import RuntimeSettings
+from core.metrics import CHAT_ITEMS_SPILLED
+from utils.framing import encode_frame, iter_frames
+
+logger = logging.getLogger("core.history")
+
+SPILL_FILE_SUFFIX = ".chat"
+
+
+def _serialize_item(item: llm.ChatItem) -> bytes:
+    options = dict(exclude_audio=False, exclude_timestamp=False)
+    try:
+        data = llm.ChatContext(items=[item]).to_dict(exclude_image=False, **options)
+    except Exception:
+        # Images backed by live video frames can't be serialized
+        data = llm.ChatContext(items=[item]).to_dict(exclude_image=True, **options)
+    return json.dumps(data["items"][0]).encode()
+
+
+def _deserialize_item(payload: bytes) -> llm.ChatItem:
+    return llm.ChatContext.from_dict({"items": [json.loads(payload)]}).items[0]
+
+
+@dataclass
+class SpillResult:
+    """Items removed from memory and in-memory replacements from one spill."""
+
+    evicted_ids: Set[str] = field(default_factory=set)
+    replacements: Dict[str, llm.ChatItem] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.evicted_ids or self.replacements)
+
+
+class ChatHistorySpill:
+    """
+    Keeps a session's chat history in memory only up to a fixed window.
+
+    Items older than the last `keep_items` are appended to a per-session
+    segment file of length-prefixed JSON records and removed from memory.
+    Within the window, images and long tool outputs of all but the newest
+    `keep_full_items` are written out in full and replaced in memory by a
+    short placeholder. Spilled items are read back lazily, in order, for
+    compaction or a transcript export.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        keep_items: int = 40,
+        keep_full_items: int = 4,
+        max_inline_chars: int = 2000,
+    ):
+        self._path = path
+        self._keep_items = keep_items
+        self._keep_full_items = keep_full_items
+        self._max_inline_chars = max_inline_chars
+        # Ids of in-memory items whose full version is already on disk
+        self._stripped_ids: Set[str] = set()
+        self.spilled_items = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def spill(self, chat_ctx: llm.ChatContext) -> SpillResult:
+        """Move old items and large parts of `chat_ctx` to disk, in place."""
+        result = SpillResult()
+        candidates = [
+            item
+            for item in chat_ctx.items
+            if not (item.type == "message" and item.role == "system")
+        ]
+        split = max(0, len(candidates) - self._keep_items)
+        # Never leave a tool output in memory without the call that made it
+        while (
+            split < len(candidates) and candidates[split].type == "function_call_output"
+        ):
+            split += 1
+        evict, window = candidates[:split], candidates[split:]
+        strip = window[: max(0, len(window) - self._keep_full_items)]
+
+        records = []
+        for item in evict:
+            result.evicted_ids.add(item.id)
+            if item.id in self._stripped_ids:
+                self._stripped_ids.discard(item.id)
+            else:
+                records.append(_serialize_item(item))
+
+        for item in strip:
+            if item.id in self._stripped_ids:
+                continue
+            replacement = self._strip(item)
+            if replacement is not None:
+                records.append(_serialize_item(item))
+                self._stripped_ids.add(item.id)
+                result.replacements[item.id] = replacement
+
+        if records:
+            with open(self._path, "ab") as f:
+                f.write(b"".join(encode_frame(record) for record in records))
+            self.spilled_items += len(records)
+            CHAT_ITEMS_SPILLED.inc(len(records))
+
+        self.apply(chat_ctx, result)
+        return result
+
+    @staticmethod
+    def apply(chat_ctx: llm.ChatContext, result: SpillResult) -> None:
+        """Mirror a spill onto another copy of the same history."""
+        if not result:
+            return
+        chat_ctx.items = [
+            result.replacements.get(item.id, item)
+            for item in chat_ctx.items
+            if item.id not in result.evicted_ids
+        ]
+
+    def iter_spilled_items(self) -> Iterator[llm.ChatItem]:
+        """Lazily read back every spilled item, oldest first."""
+        if not os.path.exists(self._path):
+            return
+        with open(self._path, "rb") as f:
+            for payload in iter_frames(f):
+                yield _deserialize_item(payload)
+
+    def export(self, chat_ctx: llm.ChatContext) -> llm.ChatContext:
+        """
+        Rebuild the full history: spilled items followed by the in-memory
+        window, with stripped items restored to their full version.
+        """
+        in_memory_ids = {item.id for item in chat_ctx.items}
+        evicted: List[llm.ChatItem] = []
+        originals: Dict[str, llm.ChatItem] = {}
+        for item in self.iter_spilled_items():
+            if item.id in in_memory_ids:
+                originals[item.id] = item
+            else:
+                evicted.append(item)
+
+        items = evicted + [originals.get(item.id, item) for item in chat_ctx.items]
+        return llm.ChatContext(items=items)
+
+    async def aclose(self) -> None:
+        """Remove the segment file once the session is over."""
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    def _strip(self, item: llm.ChatItem) -> Optional[llm.ChatItem]:
+        if item.type == "function_call_output":
+            if len(item.output) <= self._max_inline_chars:
+                return None
+            output = (
+                f"{item.output[: self._max_inline_chars]}... "
+                f"[{len(item.output) - self._max_inline_chars} characters omitted]"
+            )
+            return item.model_copy(update={"output": output})
+
+        if item.type == "message" and any(
+            not isinstance(part, str) for part in item.content
+        ):
+            content = [
+                part if isinstance(part, str) else "[attachment omitted]"
+                for part in item.content
+            ]
+            return item.model_copy(update={"content": content})
+        return None
+
+
+def create_history_spill(
+    settings: RuntimeSettings, session_id: str
+) -> Optional[ChatHistorySpill]:
+    """
+    Creates a ChatHistorySpill for the session if a spill directory is
+    configured.
+    """
+    if not settings.CHAT_SPILL_DIR:
+        return None
+    os.makedirs(settings.CHAT_SPILL_DIR, exist_ok=True)
+    return ChatHistorySpill(
+        os.path.join(settings.CHAT_SPILL_DIR, f"{session_id}{SPILL_FILE_SUFFIX}"),
+        keep_items=settings.CHAT_SPILL_KEEP_ITEMS,
+        max_inline_chars=settings.CHAT_SPILL_MAX_INLINE_CHARS,
+    )
+
+
+def register_history_spill_handlers(
+    session: AgentSession, agent: Agent, spill: ChatHistorySpill
+) -> None:
+    """
+    Spill the session history after every agent reply and mirror the result
+    onto the agent's chat context.
+    """
+    tasks: Set[asyncio.Task] = set()
+    lock = asyncio.Lock()
+
+    async def spill_history() -> None:
+        async with lock:
+            try:
+                result = spill.spill(session.history)
+                if not result:
+                    return
+                chat_ctx = agent.chat_ctx.copy()
+                spill.apply(chat_ctx, result)
+                await agent.update_chat_ctx(chat_ctx)
+            except Exception as e:
+                logger.error(f"Failed to spill chat history: {e}")
+                return
+
+        logger.debug(
+            f"Spilled {len(result.evicted_ids)} chat item(s) and stripped "
+            f"{len(result.replacements)} to {spill.path}"
+        )
+
+    @session.on("conversation_item_added")
+    def on_conversation_item_added(ev: Any):
+        if getattr(ev.item, "role", None) != "assistant":
+            return
+        task = asyncio.create_task(spill_history())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
@@ -0,0 +1,172 @@
+import functools
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from livekit.agents import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    APIConnectOptions,
+    llm,
+    metrics,
+)
+
+from config.settings import RuntimeSettings
+from core.metrics import (
+    LLM_COMPLETION_TOKENS,
+    LLM_DURATION_SECONDS,
+    LLM_ROUTE_SECONDS,
+    LLM_ROUTES,
+    LLM_TTFT_SECONDS,
+)
+from core.plugins import create_llm
+
+logger = logging.getLogger("core.llm_router")
+
+TIER_FAST = "fast"
+TIER_STRONG = "strong"
+
+# Acknowledgements and small talk the fast model handles well
+SMALL_TALK = re.compile(
+    r"^\W*(ok(ay)?|yes|yeah|yep|no|nope|sure|thanks?|thank you|cool|great|nice|"
+    r"perfect|got it|sounds good|alright|right|hi|hello|hey|good (morning|"
+    r"afternoon|evening)|bye|goodbye|see you|mm+|uh[- ]?huh)\b",
+    re.IGNORECASE,
+)
+
+# Phrasing that asks for reasoning, explanation or planning
+REASONING_MARKERS = re.compile(
+    r"\b(why|how|explain|compare|difference|calculate|analy[sz]e|plan|"
+    r"recommend|summari[sz]e|should i|what if|step by step|pros and cons)\b",
+    re.IGNORECASE,
+)
+
+
+def _last_message(chat_ctx: llm.ChatContext, role: str) -> Optional[str]:
+    for item in reversed(chat_ctx.items):
+        if item.type == "message" and item.role == role:
+            return item.text_content or ""
+    return None
+
+
+def _current_user_message(chat_ctx: llm.ChatContext) -> Optional[llm.ChatMessage]:
+    """
+    The user message being answered, or None if the turn does not end with
+    one (e.g. a tool result). System items after it are skipped: the prompt
+    assembler appends the session state to the turn context after the
+    user's message.
+    """
+    for item in reversed(chat_ctx.items):
+        if item.type == "message" and item.role in ("system", "developer"):
+            continue
+        if item.type == "message" and item.role == "user":
+            return item
+        return None
+    return None
+
+
+def classify_turn(chat_ctx: llm.ChatContext, max_fast_words: int = 12) -> str:
+    """
+    Pick the model tier for the next reply with a local heuristic.
+
+    Short acknowledgements and small talk go to the fast tier. Anything that
+    asks for reasoning, mentions numbers, follows a tool call or answers a
+    question the agent just asked goes to the strong tier.
+    """
+    user_message = _current_user_message(chat_ctx)
+    if user_message is None:
+        return TIER_STRONG
+
+    text = (user_message.text_content or "").strip()
+    words = text.split()
+    if not words or REASONING_MARKERS.search(text) or any(c.isdigit() for c in text):
+        return TIER_STRONG
+
+    # A short reply to a question ("yes, go ahead") needs the strong model to
+    # carry on with whatever was asked
+    previous_reply = _last_message(chat_ctx, "assistant") or ""
+    if previous_reply.rstrip().endswith("?"):
+        return TIER_STRONG
+
+    if len(words) <= 3:
+        return TIER_FAST
+    if len(words) <= max_fast_words and SMALL_TALK.match(text):
+        return TIER_FAST
+    return TIER_STRONG
+
+
+class RouterLLM(llm.LLM):
+    """
+    LLM adapter that routes each request to a fast or a strong model.
+
+    Metrics and errors from both models are re-emitted as this LLM's own, so
+    the AgentSession sees a single LLM. Routing decisions and per-tier
+    latency are exported as Prometheus metrics.
+    """
+
+    def __init__(
+        self,
+        *,
+        fast: llm.LLM,
+        strong: llm.LLM,
+        max_fast_words: int = 12,
+    ):
+        super().__init__()
+        self._tiers: Dict[str, llm.LLM] = {TIER_FAST: fast, TIER_STRONG: strong}
+        self._max_fast_words = max_fast_words
+        for tier, delegate in self._tiers.items():
+            delegate.on("metrics_collected", functools.partial(self._on_metrics, tier))
+            delegate.on("error", lambda ev: self.emit("error", ev))
+
+    @property
+    def model(self) -> str:
+        return self._tiers[TIER_STRONG].model
+
+    def chat(
+        self,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: Optional[List[Any]] = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        **kwargs: Any,
+    ) -> llm.LLMStream:
+        started = time.perf_counter()
+        tier = classify_turn(chat_ctx, self._max_fast_words)
+        LLM_ROUTE_SECONDS.observe(time.perf_counter() - started)
+        LLM_ROUTES.labels(tier=tier).inc()
+
+        delegate = self._tiers[tier]
+        logger.debug(f"Routing turn to {tier} model {delegate.model}")
+        return delegate.chat(
+            chat_ctx=chat_ctx, tools=tools, conn_options=conn_options, **kwargs
+        )
+
+    async def aclose(self) -> None:
+        for delegate in self._tiers.values():
+            await delegate.aclose()
+
+    def _on_metrics(self, tier: str, m: Any) -> None:
+        if isinstance(m, metrics.LLMMetrics):
+            model = self._tiers[tier].model
+            LLM_TTFT_SECONDS.labels(tier=tier, model=model).observe(m.ttft)
+            LLM_DURATION_SECONDS.labels(tier=tier, model=model).observe(m.duration)
+            LLM_COMPLETION_TOKENS.labels(tier=tier, model=model).inc(
+                m.completion_tokens
+            )
+            logger.info(
+                f"LLM {tier} tier ({model}): ttft {m.ttft:.3f}s, "
+                f"duration {m.duration:.3f}s"
+            )
+        self.emit("metrics_collected", m)
+
+
+def create_llm_router(settings: RuntimeSettings) -> RouterLLM:
+    """
+    Creates a RouterLLM with the configured fast model and the agent's
+    configured model as the strong tier.
+    """
+    return RouterLLM(
+        fast=create_llm(model=settings.LLM_FAST_MODEL),
+        strong=create_llm(model=settings.LLM_MODEL),
+        max_fast_words=settings.LLM_FAST_MAX_WORDS,
+    )
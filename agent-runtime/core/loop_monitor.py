@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from config.settings import RuntimeSettings
+from core.metrics import EVENT_LOOP_LAG_SECONDS, EVENT_LOOP_SLOW_CALLBACKS
+
+logger = logging.getLogger("core.loop_monitor")
+
+
+class LoopMonitor:
+    """
+    Measures event-loop lag for a job process and reports blocking callbacks.
+
+    A heartbeat coroutine sleeps for `interval` and records how late it woke
+    up. A watchdog thread checks the heartbeat; when the loop has been stuck
+    for longer than `slow_threshold`, it captures the loop thread's stack
+    while the blocking call is still running, and the stall is logged with
+    that stack and the session id once the loop recovers.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        *,
+        interval: float = 0.1,
+        slow_threshold: float = 0.1,
+    ):
+        self._session_id = session_id
+        self._interval = interval
+        self._slow_threshold = slow_threshold
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._blocked_stack: Optional[str] = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def aclose(self) -> None:
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - scheduled - self._interval)
+            self._last_beat = time.monotonic()
+            stack, self._blocked_stack = self._blocked_stack, None
+            EVENT_LOOP_LAG_SECONDS.observe(lag)
+
+            if lag >= self._slow_threshold:
+                EVENT_LOOP_SLOW_CALLBACKS.inc()
+                logger.warning(
+                    f"Event loop blocked for {lag * 1000:.0f}ms in session "
+                    f"{self._session_id}"
+                    + (f"; blocking call:\n{stack}" if stack else "")
+                )
+
+    def _watch(self) -> None:
+        check_interval = self._slow_threshold / 2
+        while not self._stopped.wait(check_interval):
+            stalled = time.monotonic() - self._last_beat
+            if stalled < self._interval + self._slow_threshold:
+                continue
+            if self._blocked_stack is None:
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is not None:
+                    self._blocked_stack = "".join(traceback.format_stack(frame))
+
+
+def create_loop_monitor(settings: RuntimeSettings, session_id: str) -> LoopMonitor:
+    """
+    Creates a LoopMonitor configured from the runtime settings.
+    """
+    return LoopMonitor(
+        session_id,
+        interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+        slow_threshold=settings.LOOP_MONITOR_SLOW_CALLBACK_MS / 1000,
+    )
@@ -0,0 +1,189 @@
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import prometheus_client
+from livekit.agents import AgentSession, metrics
+
+logger = logging.getLogger("core.metrics")
+
+# Replies awaiting their TTS metrics. Interrupted and tool-only replies never
+# get one, so the oldest are dropped past this many
+MAX_PENDING_SPEECHES = 32
+
+# Runtime metrics are served by the worker's /metrics endpoint
+# (PROMETHEUS_PORT). Job processes write them to PROMETHEUS_MULTIPROC_DIR and
+# the worker aggregates them, so no series is labelled per process.
+
+LLM_ROUTES = prometheus_client.Counter(
+    "agent_runtime_llm_routes_total",
+    "LLM requests routed to each tier",
+    ["tier"],
+)
+
+LLM_ROUTE_SECONDS = prometheus_client.Histogram(
+    "agent_runtime_llm_route_seconds",
+    "Time spent classifying a turn",
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05],
+)
+
+LLM_TTFT_SECONDS = prometheus_client.Histogram(
+    "agent_runtime_llm_ttft_seconds",
+    "LLM time to first token",
+    ["tier", "model"],
+    buckets=[0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 3, 5, 10],
+)
+
+LLM_DURATION_SECONDS = prometheus_client.Histogram(
+    "agent_runtime_llm_duration_seconds",
+    "LLM request duration",
+    ["tier", "model"],
+    buckets=[0.25, 0.5, 1, 2, 3, 5, 10, 20, 30],
+)
+
+LLM_COMPLETION_TOKENS = prometheus_client.Counter(
+    "agent_runtime_llm_completion_tokens_total",
+    "LLM completion tokens",
+    ["tier", "model"],
+)
+
+CHAT_ITEMS_SPILLED = prometheus_client.Counter(
+    "agent_runtime_chat_items_spilled_total",
+    "Chat items moved from memory to the spill file",
+)
+
+OBSERVER_TURNS_MERGED = prometheus_client.Counter(
+    "agent_runtime_observer_turns_merged_total",
+    "Turns merged into a pending one because the observer queue was full",
+)
+
+OBSERVER_EXTRACTIONS = prometheus_client.Counter(
+    "agent_runtime_observer_extractions_total",
+    "Observer extractions by outcome",
+    ["status"],
+)
+
+EVENT_LOOP_LAG_SECONDS = prometheus_client.Histogram(
+    "agent_runtime_event_loop_lag_seconds",
+    "How late the event loop heartbeat woke up",
+    # Audio frames are 10-20ms, so resolve lag well below one frame
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+EVENT_LOOP_SLOW_CALLBACKS = prometheus_client.Counter(
+    "agent_runtime_event_loop_slow_callbacks_total",
+    "Event loop stalls longer than the slow-callback threshold",
+)
+
+
+@dataclass
+class SpeechLatency:
+    """Latency components of one agent reply, keyed by speech id."""
+
+    end_of_utterance_delay: Optional[float] = None
+    llm_ttft: Optional[float] = None
+    tts_ttfb: Optional[float] = None
+    tts_duration: float = 0.0
+    audio_duration: float = 0.0
+
+    @property
+    def first_audio(self) -> Optional[float]:
+        """Time from the end of the user's speech to the first audio frame."""
+        if self.llm_ttft is None or self.tts_ttfb is None:
+            return None
+        return (self.end_of_utterance_delay or 0.0) + self.llm_ttft + self.tts_ttfb
+
+
+@dataclass
+class PromptCacheStats:
+    """Cumulative prompt-cache usage reported by the LLM provider."""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def uncached_tokens(self) -> int:
+        return self.prompt_tokens - self.cached_tokens
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def record(self, prompt_tokens: int, cached_tokens: int) -> None:
+        self.requests += 1
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+
+
+def register_prompt_cache_handlers(session: AgentSession) -> PromptCacheStats:
+    """
+    Record cached versus uncached input tokens for every LLM request of the
+    session.
+    """
+    stats = PromptCacheStats()
+
+    @session.on("metrics_collected")
+    def on_metrics_collected(ev: Any):
+        if not isinstance(ev.metrics, metrics.LLMMetrics):
+            return
+
+        m = ev.metrics
+        stats.record(m.prompt_tokens, m.prompt_cached_tokens)
+        logger.info(
+            f"LLM prompt: {m.prompt_tokens} tokens, {m.prompt_cached_tokens} cached, "
+            f"{m.prompt_tokens - m.prompt_cached_tokens} uncached "
+            f"(session cache hit rate {stats.hit_rate:.0%} "
+            f"over {stats.requests} request(s))"
+        )
+
+    return stats
+
+
+def register_speech_metrics_handlers(session: AgentSession) -> None:
+    """
+    Report time-to-first-audio separately from total synthesis time for
+    every agent reply.
+    """
+    pending: OrderedDict[str, SpeechLatency] = OrderedDict()
+
+    def pending_latency(speech_id: str) -> SpeechLatency:
+        if speech_id not in pending:
+            pending[speech_id] = SpeechLatency()
+            while len(pending) > MAX_PENDING_SPEECHES:
+                pending.popitem(last=False)
+        return pending[speech_id]
+
+    @session.on("metrics_collected")
+    def on_metrics_collected(ev: Any):
+        m = ev.metrics
+        speech_id = getattr(m, "speech_id", None)
+        if not speech_id:
+            return
+
+        if isinstance(m, metrics.EOUMetrics):
+            pending_latency(speech_id).end_of_utterance_delay = m.end_of_utterance_delay
+        elif isinstance(m, metrics.LLMMetrics):
+            pending_latency(speech_id).llm_ttft = m.ttft
+        elif isinstance(m, metrics.TTSMetrics):
+            latency = pending.pop(speech_id, None) or SpeechLatency()
+            latency.tts_ttfb = m.ttfb
+            latency.tts_duration = m.duration
+            latency.audio_duration = m.audio_duration
+            _log_speech_latency(speech_id, latency)
+
+
+def _log_speech_latency(speech_id: str, latency: SpeechLatency) -> None:
+    first_audio = (
+        f"{latency.first_audio:.3f}s" if latency.first_audio is not None else "n/a"
+    )
+    eou = latency.end_of_utterance_delay
+    logger.info(
+        f"Speech {speech_id}: first audio after {first_audio} "
+        f"(eou {eou if eou is not None else 0.0:.3f}s, "
+        f"llm ttft {latency.llm_ttft or 0.0:.3f}s, "
+        f"tts ttfb {latency.tts_ttfb:.3f}s); "
+        f"total synthesis {latency.tts_duration:.3f}s "
+        f"for {latency.audio_duration:.2f}s of audio"
+    )
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+import numpy as np
+from livekit import rtc
+
+from config.settings import RuntimeSettings
+
+logger = logging.getLogger("core.noise_probe")
+
+PROBE_SAMPLE_RATE = 16000
+# Share of frames treated as background; the user may be talking during the
+# probe, but not for every frame of it
+NOISE_FLOOR_PERCENTILE = 10
+
+
+def frame_level_dbfs(frame: rtc.AudioFrame) -> float:
+    """RMS level of a 16-bit PCM frame in dBFS."""
+    samples = np.frombuffer(frame.data, dtype=np.int16).astype(np.float32)
+    if samples.size == 0:
+        return -120.0
+    rms = float(np.sqrt(np.mean(np.square(samples)))) / 32768.0
+    return 20 * float(np.log10(max(rms, 1e-6)))
+
+
+def noise_floor_dbfs(levels: List[float]) -> Optional[float]:
+    """Background level of a run of frame levels, or None if there are none."""
+    if not levels:
+        return None
+    return float(np.percentile(levels, NOISE_FLOOR_PERCENTILE))
+
+
+def _microphone_track(room: rtc.Room) -> Optional[rtc.RemoteAudioTrack]:
+    for participant in room.remote_participants.values():
+        if participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_AGENT:
+            continue
+        for publication in participant.track_publications.values():
+            if publication.source == rtc.TrackSource.SOURCE_MICROPHONE and isinstance(
+                publication.track, rtc.RemoteAudioTrack
+            ):
+                return publication.track
+    return None
+
+
+async def probe_noise_floor(room: rtc.Room, duration: float) -> Optional[float]:
+    """
+    Listen to the user's microphone for `duration` seconds and return its
+    noise floor in dBFS.
+
+    Returns None when the user has no subscribed microphone yet, so the
+    caller can treat the signal as unknown.
+    """
+    track = _microphone_track(room)
+    if track is None:
+        return None
+
+    levels: List[float] = []
+    stream = rtc.AudioStream.from_track(
+        track=track, sample_rate=PROBE_SAMPLE_RATE, num_channels=1
+    )
+
+    async def collect() -> None:
+        async for ev in stream:
+            levels.append(frame_level_dbfs(ev.frame))
+
+    try:
+        await asyncio.wait_for(collect(), duration)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await stream.aclose()
+    return noise_floor_dbfs(levels)
+
+
+async def is_clean_signal(room: rtc.Room, settings: RuntimeSettings) -> bool:
+    """
+    True if the user's microphone is quiet enough to skip noise cancellation.
+    An unknown signal is never treated as clean.
+    """
+    floor = await probe_noise_floor(room, settings.CPU_GOVERNOR_NOISE_PROBE_SECONDS)
+    if floor is None:
+        logger.info("No microphone to probe; keeping noise cancellation")
+        return False
+    clean = floor <= settings.CPU_GOVERNOR_CLEAN_NOISE_FLOOR_DBFS
+    logger.info(
+        f"Microphone noise floor {floor:.1f} dBFS "
+        f"({'clean' if clean else 'noisy'} signal)"
+    )
+    return clean
@@ -0,0 +1,203 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from livekit.agents import AgentSession, llm
+
+from config.settings import RuntimeSettings
+from core.context import SessionContext
+from core.metrics import OBSERVER_EXTRACTIONS, OBSERVER_TURNS_MERGED
+from core.plugins import create_llm
+
+logger = logging.getLogger("core.observer")
+
+EXTRACTION_PROMPT = (
+    "You watch a conversation between a user and an AI agent and record facts "
+    "that will help the agent in later turns: the user's preferences, goals, "
+    "constraints, level of expertise and mood. Reply with JSON only, in the "
+    'form {"observations": ["..."], "flags": {"name": value}}. Each '
+    "observation is one short sentence. Do not repeat known observations. "
+    "Use flags for simple state such as "
+    '"needs_human_handoff" or "language". Return empty values if nothing new '
+    "was learned."
+)
+
+# Upper bound on a merged transcript sent for extraction
+MAX_TRANSCRIPT_CHARS = 4000
+
+
+@dataclass
+class ObservedTurn:
+    """A finished user/agent exchange waiting for extraction."""
+
+    user_text: str
+    agent_text: str = ""
+    merged: int = 1
+
+    def transcript(self) -> str:
+        return f"User: {self.user_text}\nAgent: {self.agent_text}".strip()
+
+    def merge(self, later: "ObservedTurn") -> "ObservedTurn":
+        """Combine with a later turn, keeping the most recent text if too long."""
+        user_text = f"{self.user_text}\n{later.user_text}"
+        agent_text = f"{self.agent_text}\n{later.agent_text}"
+        return ObservedTurn(
+            user_text=user_text[-MAX_TRANSCRIPT_CHARS:],
+            agent_text=agent_text[-MAX_TRANSCRIPT_CHARS:],
+            merged=self.merged + later.merged,
+        )
+
+
+def _parse_extraction(text: str) -> Dict[str, Any]:
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        raise ValueError("No JSON object in observer response")
+    result = json.loads(text[start : end + 1])
+    if not isinstance(result, dict):
+        raise ValueError("Observer response is not a JSON object")
+    return result
+
+
+class SessionObserver:
+    """
+    Background observer that extracts observations and flags from finished
+    turns without blocking the conversation.
+
+    Turns go through a bounded queue. When extraction falls behind, a new
+    turn is merged into the newest queued one instead of growing a backlog,
+    so the observer never lags more than `max_queue_size` calls behind.
+    """
+
+    def __init__(
+        self,
+        session_ctx: SessionContext,
+        observer_llm: llm.LLM,
+        *,
+        max_queue_size: int = 4,
+        max_observations: int = 20,
+        timeout: float = 15.0,
+    ):
+        self._session_ctx = session_ctx
+        self._llm = observer_llm
+        self._max_observations = max_observations
+        self._timeout = timeout
+        self._queue: asyncio.Queue[ObservedTurn] = asyncio.Queue(max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._llm.aclose()
+
+    def submit(self, turn: ObservedTurn) -> None:
+        """Queue a finished turn; never blocks the caller."""
+        if self._queue.full():
+            # Fold the new turn into the newest pending one
+            pending = self._drain()
+            turn = pending.pop().merge(turn)
+            for item in pending:
+                self._queue.put_nowait(item)
+            OBSERVER_TURNS_MERGED.inc()
+            logger.debug(f"Observer queue full; merged {turn.merged} turns")
+        self._queue.put_nowait(turn)
+
+    def _drain(self) -> List[ObservedTurn]:
+        items = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+    async def _run(self) -> None:
+        while True:
+            turn = await self._queue.get()
+            try:
+                result = await asyncio.wait_for(self._extract(turn), self._timeout)
+                self._apply(result)
+                OBSERVER_EXTRACTIONS.labels(status="ok").inc()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                OBSERVER_EXTRACTIONS.labels(status="error").inc()
+                logger.warning(f"Observation extraction failed: {e}")
+
+    async def _extract(self, turn: ObservedTurn) -> Dict[str, Any]:
+        chat_ctx = llm.ChatContext()
+        chat_ctx.add_message(role="system", content=EXTRACTION_PROMPT)
+        known = "\n".join(f"- {o}" for o in self._session_ctx.observations)
+        chat_ctx.add_message(
+            role="user",
+            content=(
+                f"Known observations:\n{known or '(none)'}\n\n"
+                f"Latest exchange:\n{turn.transcript()}"
+            ),
+        )
+
+        text = ""
+        async with self._llm.chat(chat_ctx=chat_ctx) as stream:
+            async for chunk in stream:
+                if chunk.delta and chunk.delta.content:
+                    text += chunk.delta.content
+        return _parse_extraction(text)
+
+    def _apply(self, result: Dict[str, Any]) -> None:
+        observations = self._session_ctx.observations
+        for observation in result.get("observations") or []:
+            observation = str(observation).strip()
+            if observation and observation not in observations:
+                self._session_ctx.add_observation(observation)
+                logger.info(f"New observation: {observation}")
+
+        # Keep the most recent observations so the prompt stays bounded
+        if len(observations) > self._max_observations:
+            del observations[: len(observations) - self._max_observations]
+
+        flags = result.get("flags") or {}
+        if isinstance(flags, dict):
+            for key, value in flags.items():
+                if self._session_ctx.get_flag(key) != value:
+                    self._session_ctx.set_flag(key, value)
+                    logger.info(f"Session flag set: {key}={value}")
+
+
+def create_session_observer(
+    settings: RuntimeSettings, session_ctx: SessionContext
+) -> SessionObserver:
+    """
+    Creates a SessionObserver backed by the configured observer model.
+    """
+    return SessionObserver(
+        session_ctx,
+        create_llm(model=settings.OBSERVER_MODEL),
+        max_queue_size=settings.OBSERVER_QUEUE_SIZE,
+        max_observations=settings.OBSERVER_MAX_OBSERVATIONS,
+    )
+
+
+def register_observer_handlers(
+    session: AgentSession, observer: SessionObserver
+) -> None:
+    """Submit every finished user/agent exchange to the observer."""
+    pending_user_text: List[str] = []
+
+    @session.on("conversation_item_added")
+    def on_conversation_item_added(ev: Any):
+        role = getattr(ev.item, "role", None)
+        text = getattr(ev.item, "text_content", None) or ""
+        if role == "user":
+            pending_user_text.append(text)
+        elif role == "assistant" and pending_user_text:
+            observer.submit(
+                ObservedTurn(user_text=" ".join(pending_user_text), agent_text=text)
+            )
+            pending_user_text.clear()
@@ -1,7 +1,12 @@
+from typing import Optional
+
+from livekit.agents import tokenize
 from livekit.plugins import cartesia, deepgram, openai, silero
 from livekit.plugins.turn_detector import multilingual
 
 from config.settings import settings
+from core.remote_turn_detector import RemoteTurnDetector
+from utils.vad_weights import shared_model_path
 
 
 def create_stt(
@@ -45,6 +50,7 @@ def create_tts(
     base_url: str = settings.CARTESIA_BASE_URL,
     model: str = settings.TTS_MODEL,
     voice_id: str = settings.TTS_VOICE_ID,
+    tokenizer: Optional[tokenize.SentenceTokenizer] = None,
 ) -> cartesia.TTS:
     """
     Creates a configured instance of Cartesia TTS plugin.
@@ -54,15 +60,22 @@ def create_tts(
         base_url: Cartesia API base URL.
         model: Cartesia TTS model.
         voice_id: Cartesia voice ID.
+        tokenizer: Segments streamed LLM text before it is sent to Cartesia.
+            Defaults to the plugin's own sentence tokenizer.
 
     Returns:
         Configured cartesia.TTS instance.
     """
+    kwargs = {}
+    if tokenizer is not None:
+        kwargs["tokenizer"] = tokenizer
+
     return cartesia.TTS(
         model=model,
         api_key=api_key,
         voice=voice_id,
         base_url=base_url,
+        **kwargs,
     )
 
 
@@ -89,15 +102,38 @@ def create_llm(
     )
 
 
-def create_vad() -> silero.VAD:
+def create_vad(shared_model_dir: str = settings.VAD_SHARED_MODEL_DIR) -> silero.VAD:
     """
     Creates a loaded Silero VAD instance.
+
+    Args:
+        shared_model_dir: Directory holding a model exported by
+            `utils/vad_weights.py`. When present, the weights are memory-mapped
+            from it so every process on the node shares one copy.
+
+    Returns:
+        Loaded silero.VAD instance.
     """
-    return silero.VAD.load()
+    model_path = shared_model_path(shared_model_dir) if shared_model_dir else None
+    if not model_path:
+        return silero.VAD.load()
+    return silero.VAD.load(onnx_file_path=model_path)
 
 
-def create_turn_detector() -> multilingual.MultilingualModel:
+def create_turn_detector(
+    socket_path: str = settings.TURN_DETECTOR_SOCKET_PATH,
+) -> multilingual.MultilingualModel:
     """
     Creates a configured LiveKit multilingual turn detector.
+
+    Args:
+        socket_path: Unix socket of the per-node turn-detector sidecar. When
+            set, inference is delegated to the sidecar instead of the
+            worker's own inference process.
+
+    Returns:
+        Configured multilingual.MultilingualModel instance.
     """
+    if socket_path:
+        return RemoteTurnDetector(socket_path)
     return multilingual.MultilingualModel()
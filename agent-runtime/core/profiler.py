@@ -0,0 +1,157 @@
+import asyncio
+import fnmatch
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List
+
+from livekit import rtc
+from livekit.agents import JobContext
+
+from config.settings import RuntimeSettings
+
+logger = logging.getLogger("core.profiler")
+
+RPC_METHOD = "agent.profile"
+MAX_RPC_SECONDS = 600.0
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return (
+        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+class SamplingProfiler:
+    """
+    On-demand sampling profiler for a job process.
+
+    While running, a background thread samples the stack of every other
+    thread every `interval` seconds and counts identical stacks. After the
+    requested duration the counts are written as a collapsed-stack file
+    (one `thread;frame;frame count` line per stack) that flamegraph.pl,
+    speedscope or inferno can render. Nothing runs while it is idle.
+    """
+
+    def __init__(self, output_dir: str, *, interval: float = 0.005):
+        self._output_dir = output_dir
+        self._interval = interval
+        self._running = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self._running.locked()
+
+    def start(self, duration: float, label: str) -> bool:
+        """Start profiling in the background; False if already running."""
+        if not self._running.acquire(blocking=False):
+            return False
+        thread = threading.Thread(
+            target=self._profile,
+            args=(duration, label),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        thread.start()
+        return True
+
+    def _profile(self, duration: float, label: str) -> None:
+        try:
+            logger.info(f"Profiling {label} for {duration:.0f}s")
+            stacks = self._sample(duration)
+            path = self._write(stacks, label)
+            logger.info(f"Profile written to {path} ({sum(stacks.values())} samples)")
+        except Exception as e:
+            logger.error(f"Profiling failed: {e}")
+        finally:
+            self._running.release()
+
+    def _sample(self, duration: float) -> Counter:
+        own_id = threading.get_ident()
+        stacks: Counter = Counter()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                frames = []
+                while frame is not None:
+                    frames.append(_frame_label(frame))
+                    frame = frame.f_back
+                thread_name = names.get(thread_id, str(thread_id))
+                stacks[";".join([thread_name, *reversed(frames)])] += 1
+            time.sleep(self._interval)
+        return stacks
+
+    def _write(self, stacks: Counter, label: str) -> str:
+        os.makedirs(self._output_dir, exist_ok=True)
+        filename = f"{label}-{os.getpid()}-{int(time.time())}.collapsed"
+        path = os.path.join(self._output_dir, filename)
+        with open(path, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+def create_profiler(settings: RuntimeSettings) -> SamplingProfiler:
+    """
+    Creates a SamplingProfiler configured from the runtime settings.
+    """
+    return SamplingProfiler(
+        settings.PROFILER_OUTPUT_DIR,
+        interval=settings.PROFILER_INTERVAL_MS / 1000,
+    )
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def register_profiler_triggers(
+    ctx: JobContext, profiler: SamplingProfiler, settings: RuntimeSettings
+) -> None:
+    """
+    Wire the three ways of profiling this job:
+
+    - `PROFILER_ROOMS`: rooms matching one of these patterns are profiled
+      as soon as the job starts.
+    - `SIGUSR2` sent to the job process.
+    - The `agent.profile` RPC, from a participant listed in
+      `PROFILER_RPC_IDENTITIES`, with an optional `{"seconds": n}` payload.
+    """
+    room = ctx.room.name
+    duration = settings.PROFILER_DURATION_SECONDS
+
+    if any(fnmatch.fnmatch(room, p) for p in _split(settings.PROFILER_ROOMS)):
+        profiler.start(duration, room)
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGUSR2, lambda: profiler.start(duration, room)
+        )
+        logger.info(f"Send SIGUSR2 to pid {os.getpid()} to profile room {room}")
+    except (NotImplementedError, RuntimeError, ValueError) as e:
+        logger.debug(f"Profiler signal trigger unavailable: {e}")
+
+    allowed_identities = set(_split(settings.PROFILER_RPC_IDENTITIES))
+    if not allowed_identities:
+        return
+
+    async def on_profile_rpc(data: rtc.RpcInvocationData) -> str:
+        if data.caller_identity not in allowed_identities:
+            raise rtc.RpcError(rtc.RpcError.ErrorCode.APPLICATION_ERROR, "Forbidden")
+        seconds = duration
+        if data.payload:
+            seconds = float(json.loads(data.payload).get("seconds", duration))
+        seconds = min(max(seconds, 1.0), MAX_RPC_SECONDS)
+        started = profiler.start(seconds, room)
+        return json.dumps({"started": started, "pid": os.getpid()})
+
+    ctx.room.local_participant.register_rpc_method(RPC_METHOD, on_profile_rpc)
@@ -0,0 +1,74 @@
+import json
+from typing import Optional
+
+from livekit.agents import llm
+
+from config.settings import RuntimeSettings
+from core.context import SessionContext
+
+SESSION_STATE_HEADER = "Current session state (may change every turn):"
+
+
+class PromptAssembler:
+    """
+    Lays out the prompt so providers can cache the longest possible prefix.
+
+    The immutable parts come first and never change within a session: the
+    platform preamble followed by the agent instructions (tool schemas are
+    sent ahead of the messages by the provider and stay fixed per agent).
+    Volatile session state is not written into the instructions; it is
+    appended as the last context item of each turn, so earlier history keeps
+    a byte-identical prefix from one turn to the next.
+    """
+
+    def __init__(self, preamble: str = ""):
+        self._preamble = preamble.strip()
+
+    def instructions(self, agent_instructions: str) -> str:
+        """Return the stable system prompt: preamble, then agent instructions."""
+        parts = [self._preamble, agent_instructions.strip()]
+        return "\n\n".join(part for part in parts if part)
+
+    def session_state(self, session_ctx: SessionContext) -> Optional[str]:
+        """Render the volatile parts of the session context, or None if empty."""
+        sections = []
+        if session_ctx.observations:
+            observations = "\n".join(f"- {o}" for o in session_ctx.observations)
+            sections.append(f"Observations:\n{observations}")
+        if session_ctx.session_flags:
+            sections.append(
+                f"Flags: {json.dumps(session_ctx.session_flags, sort_keys=True)}"
+            )
+        active_modalities = [
+            name for name, active in session_ctx.modality_state.items() if active
+        ]
+        if active_modalities:
+            sections.append(f"Active inputs: {', '.join(sorted(active_modalities))}")
+        if session_ctx.panel_state:
+            sections.append(
+                f"Panels: {json.dumps(session_ctx.panel_state, sort_keys=True)}"
+            )
+
+        if not sections:
+            return None
+        return "\n\n".join([SESSION_STATE_HEADER, *sections])
+
+    def inject_session_state(
+        self, turn_ctx: llm.ChatContext, session_ctx: SessionContext
+    ) -> None:
+        """
+        Append the session state to this turn's context.
+
+        `turn_ctx` is a per-turn copy of the chat history, so the state block
+        is not persisted and never ends up in the middle of later prompts.
+        """
+        state = self.session_state(session_ctx)
+        if state:
+            turn_ctx.add_message(role="system", content=state)
+
+
+def create_prompt_assembler(settings: RuntimeSettings) -> PromptAssembler:
+    """
+    Creates a PromptAssembler with the configured platform preamble.
+    """
+    return PromptAssembler(preamble=settings.PLATFORM_PREAMBLE)
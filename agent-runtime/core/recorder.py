@@ -0,0 +1,171 @@
+import fnmatch
+import json
+import logging
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Dict, Iterator, Optional, Tuple
+
+from livekit import rtc
+from livekit.agents import llm, stt
+from livekit.agents.utils import is_given
+
+from config.settings import RuntimeSettings
+from utils.framing import encode_frame, iter_frames
+
+logger = logging.getLogger("core.recorder")
+
+RECORDING_SUFFIX = ".rec"
+
+# Record kinds
+AUDIO_IN = 1
+AUDIO_OUT = 2
+EVENT = 3
+
+# kind, seconds since the start of the recording
+RECORD_HEADER = struct.Struct(">Bd")
+# sample rate, channels; followed by 16-bit PCM
+AUDIO_HEADER = struct.Struct(">IH")
+
+
+@dataclass
+class Record:
+    """One decoded record of a session recording."""
+
+    kind: int
+    timestamp: float
+    event: Optional[Dict[str, Any]] = None
+    audio: Optional[Tuple[int, int, bytes]] = None
+
+
+def _speech_event_to_dict(ev: stt.SpeechEvent) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"event": str(ev.type.value)}
+    if ev.alternatives:
+        alternative = ev.alternatives[0]
+        data.update(
+            text=alternative.text,
+            language=alternative.language,
+            confidence=alternative.confidence,
+            start_time=alternative.start_time,
+            end_time=alternative.end_time,
+            words=[
+                [str(word), word.start_time, word.end_time]
+                for word in alternative.words or []
+                if is_given(word.start_time) and is_given(word.end_time)
+            ],
+        )
+    return data
+
+
+class SessionRecorder:
+    """
+    Writes every input and output of a session to one compact file.
+
+    Each record is a length-prefixed frame holding its kind, a timestamp
+    relative to the start of the recording and either raw 16-bit PCM (inbound
+    audio and synthesized audio) or a JSON event (STT events with their word
+    timings, LLM requests and streamed chunks, TTS input text and the end of
+    each synthesis). The `record_*` wrappers tap the
+    agent's pipeline nodes without changing what flows through them.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, "ab")
+        self._started = time.monotonic()
+        self.event("recording_started", {"wall_time": time.time()})
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def event(self, event_type: str, data: Dict[str, Any]) -> None:
+        self._write(EVENT, json.dumps({"type": event_type, **data}).encode())
+
+    def audio(self, kind: int, frame: rtc.AudioFrame) -> None:
+        header = AUDIO_HEADER.pack(frame.sample_rate, frame.num_channels)
+        self._write(kind, header + bytes(frame.data))
+
+    async def record_audio_in(
+        self, audio: AsyncIterable[rtc.AudioFrame]
+    ) -> AsyncIterable[rtc.AudioFrame]:
+        async for frame in audio:
+            self.audio(AUDIO_IN, frame)
+            yield frame
+
+    async def record_stt(
+        self, events: AsyncIterable[Any]
+    ) -> AsyncIterable[stt.SpeechEvent]:
+        async for ev in events:
+            if isinstance(ev, stt.SpeechEvent):
+                self.event("stt", _speech_event_to_dict(ev))
+            yield ev
+
+    async def record_llm(
+        self, chat_ctx: llm.ChatContext, chunks: AsyncIterable[Any]
+    ) -> AsyncIterable[Any]:
+        self.event("llm_request", {"chat_ctx": chat_ctx.to_dict()})
+        async for chunk in chunks:
+            if isinstance(chunk, llm.ChatChunk):
+                self.event("llm_chunk", {"chunk": chunk.model_dump(mode="json")})
+            elif isinstance(chunk, str):
+                self.event("llm_chunk", {"text": chunk})
+            yield chunk
+        self.event("llm_done", {})
+
+    async def record_tts_text(self, text: AsyncIterable[str]) -> AsyncIterable[str]:
+        async for delta in text:
+            self.event("tts_text", {"text": delta})
+            yield delta
+
+    async def record_tts(
+        self, frames: AsyncIterable[rtc.AudioFrame]
+    ) -> AsyncIterable[rtc.AudioFrame]:
+        async for frame in frames:
+            self.audio(AUDIO_OUT, frame)
+            yield frame
+        self.event("tts_done", {})
+
+    async def aclose(self) -> None:
+        if not self._file.closed:
+            self.event("recording_stopped", {})
+            self._file.close()
+            logger.info(f"Session recording written to {self._path}")
+
+    def _write(self, kind: int, body: bytes) -> None:
+        if self._file.closed:
+            return
+        timestamp = time.monotonic() - self._started
+        self._file.write(encode_frame(RECORD_HEADER.pack(kind, timestamp) + body))
+
+
+def iter_records(path: str) -> Iterator[Record]:
+    """Read a session recording, oldest record first."""
+    with open(path, "rb") as f:
+        for payload in iter_frames(f):
+            kind, timestamp = RECORD_HEADER.unpack_from(payload)
+            body = payload[RECORD_HEADER.size :]
+            if kind == EVENT:
+                yield Record(kind, timestamp, event=json.loads(body))
+            else:
+                sample_rate, channels = AUDIO_HEADER.unpack_from(body)
+                pcm = body[AUDIO_HEADER.size :]
+                yield Record(kind, timestamp, audio=(sample_rate, channels, pcm))
+
+
+def create_session_recorder(
+    settings: RuntimeSettings, room: str
+) -> Optional[SessionRecorder]:
+    """
+    Creates a SessionRecorder if the room matches SESSION_RECORDING_ROOMS.
+    """
+    patterns = [p.strip() for p in settings.SESSION_RECORDING_ROOMS.split(",")]
+    if not any(p and fnmatch.fnmatch(room, p) for p in patterns):
+        return None
+    os.makedirs(settings.SESSION_RECORDING_DIR, exist_ok=True)
+    path = os.path.join(
+        settings.SESSION_RECORDING_DIR, f"{room}-{int(time.time())}{RECORDING_SUFFIX}"
+    )
+    logger.info(f"Recording session to {path}")
+    return SessionRecorder(path)
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from livekit.agents import llm
+from livekit.agents.inference_runner import _InferenceRunner
+from livekit.plugins.turn_detector import multilingual
+
+from utils.framing import encode_frame, read_frame
+
+logger = logging.getLogger("core.remote_turn_detector")
+
+# Matches the history window the SDK sends to the local model
+MAX_HISTORY_TURNS = 6
+
+
+def disable_local_inference() -> None:
+    """
+    Stop the worker from spawning its own inference process for the
+    multilingual model. Must be called before the worker starts.
+    """
+    _InferenceRunner.registered_runners.pop(
+        multilingual._EUORunnerMultilingual.INFERENCE_METHOD, None
+    )
+
+
+class RemoteTurnDetector(multilingual.MultilingualModel):
+    """
+    Multilingual turn detector that delegates inference to the per-node
+    sidecar (`services/turn_detector_server.py`) instead of loading the model
+    in this worker.
+    """
+
+    def __init__(self, socket_path: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._socket_path = socket_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def predict_end_of_turn(
+        self, chat_ctx: llm.ChatContext, *, timeout: Optional[float] = 3
+    ) -> float:
+        request = json.dumps({"chat_ctx": self._history(chat_ctx)}).encode()
+        async with self._lock:
+            try:
+                response = await asyncio.wait_for(self._roundtrip(request), timeout)
+            except Exception:
+                # Drop the connection so the next turn reconnects cleanly
+                await self._close()
+                raise
+
+        result = json.loads(response)
+        if "error" in result:
+            raise RuntimeError(f"Turn detector sidecar error: {result['error']}")
+        return result["eou_probability"]
+
+    def _history(self, chat_ctx: llm.ChatContext) -> List[Dict[str, str]]:
+        messages = []
+        for item in chat_ctx.items:
+            if item.type != "message" or item.role not in ("user", "assistant"):
+                continue
+            text = item.text_content
+            if text:
+                messages.append({"role": item.role, "content": text})
+        return messages[-MAX_HISTORY_TURNS:]
+
+    async def _roundtrip(self, request: bytes) -> bytes:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self._socket_path
+            )
+        self._writer.write(encode_frame(request))
+        await self._writer.drain()
+        return await read_frame(self._reader)
+
+    async def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        self._reader = self._writer = None
@@ -0,0 +1,173 @@
+from typing import List, Optional
+
+from livekit.agents import utils
+from livekit.agents.tokenize import SentenceStream, SentenceTokenizer, TokenData
+
+from config.settings import RuntimeSettings
+
+SENTENCE_ENDINGS = ".!?"
+CLAUSE_ENDINGS = ",;:—"
+CLOSING_CHARS = "\"')]”’"
+
+# Words whose trailing period does not end a sentence
+ABBREVIATIONS = {"dr", "e.g", "etc", "i.e", "jr", "mr", "mrs", "ms", "prof", "sr", "st"}
+
+
+def _is_abbreviation(text: str, period: int) -> bool:
+    word = text[:period].rsplit(None, 1)[-1] if text[:period].strip() else ""
+    word = word.lstrip("\"'([").lower()
+    return len(word) == 1 or word in ABBREVIATIONS
+
+
+def _find_boundary(text: str, punctuation: str, min_chars: int) -> Optional[int]:
+    """
+    Return the end index of the first punctuation boundary at or after
+    `min_chars`, or None.
+
+    A boundary is a punctuation mark (plus any closing quotes or brackets)
+    followed by whitespace, so decimals like "3.5" never split and the
+    boundary is only known once the next token has arrived.
+    """
+    for i in range(len(text)):
+        if text[i] not in punctuation:
+            continue
+        end = i + 1
+        while end < len(text) and text[end] in CLOSING_CHARS:
+            end += 1
+        if end < len(text) and text[end].isspace():
+            if end < min_chars or (text[i] == "." and _is_abbreviation(text, i)):
+                continue
+            return end
+    return None
+
+
+class ClauseFirstSegmenter:
+    """
+    Splits streamed LLM text into TTS chunks.
+
+    The first chunk of each segment is released as soon as a clause or
+    sentence boundary appears after `first_min_chars`, so synthesis can
+    start early. Later chunks wait for a sentence boundary after `min_chars`
+    to give the TTS enough context for natural prosody. Text without
+    punctuation is split at the last space once it exceeds `max_chars`.
+    """
+
+    def __init__(
+        self, *, first_min_chars: int = 20, min_chars: int = 80, max_chars: int = 300
+    ):
+        self._first_min_chars = first_min_chars
+        self._min_chars = min_chars
+        self._max_chars = max_chars
+        self._buffer = ""
+        self._first = True
+
+    def push(self, text: str) -> List[str]:
+        """Add streamed text and return any chunks that are ready."""
+        self._buffer += text
+        chunks = []
+        while True:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return chunks
+
+    def flush(self) -> Optional[str]:
+        """Return the remaining text and start a new segment."""
+        chunk = self._buffer.strip()
+        self._buffer = ""
+        self._first = True
+        return chunk or None
+
+    def _next_chunk(self) -> Optional[str]:
+        if self._first:
+            end = _find_boundary(
+                self._buffer, SENTENCE_ENDINGS + CLAUSE_ENDINGS, self._first_min_chars
+            )
+        else:
+            end = _find_boundary(self._buffer, SENTENCE_ENDINGS, self._min_chars)
+            if end is None and len(self._buffer) > self._max_chars:
+                end = _find_boundary(self._buffer, CLAUSE_ENDINGS, self._min_chars)
+
+        if end is None and len(self._buffer) > self._max_chars:
+            end = self._buffer.rfind(" ", 0, self._max_chars)
+            if end <= 0:
+                end = self._max_chars
+        if end is None:
+            return None
+
+        chunk = self._buffer[:end].strip()
+        self._buffer = self._buffer[end:].lstrip()
+        if not chunk:
+            return None
+        self._first = False
+        return chunk
+
+
+class ClauseFirstTokenizer(SentenceTokenizer):
+    """SentenceTokenizer that segments TTS input with ClauseFirstSegmenter."""
+
+    def __init__(
+        self, *, first_min_chars: int = 20, min_chars: int = 80, max_chars: int = 300
+    ):
+        self._first_min_chars = first_min_chars
+        self._min_chars = min_chars
+        self._max_chars = max_chars
+
+    def tokenize(self, text: str, *, language: Optional[str] = None) -> List[str]:
+        segmenter = self._new_segmenter()
+        chunks = segmenter.push(text)
+        last = segmenter.flush()
+        if last:
+            chunks.append(last)
+        return chunks
+
+    def stream(self, *, language: Optional[str] = None) -> SentenceStream:
+        return _ClauseFirstStream(self._new_segmenter())
+
+    def _new_segmenter(self) -> ClauseFirstSegmenter:
+        return ClauseFirstSegmenter(
+            first_min_chars=self._first_min_chars,
+            min_chars=self._min_chars,
+            max_chars=self._max_chars,
+        )
+
+
+class _ClauseFirstStream(SentenceStream):
+    def __init__(self, segmenter: ClauseFirstSegmenter):
+        super().__init__()
+        self._segmenter = segmenter
+        self._segment_id = utils.shortuuid()
+
+    def push_text(self, text: str) -> None:
+        self._check_not_closed()
+        for chunk in self._segmenter.push(text):
+            self._emit(chunk)
+
+    def flush(self) -> None:
+        self._check_not_closed()
+        chunk = self._segmenter.flush()
+        if chunk:
+            self._emit(chunk)
+        self._segment_id = utils.shortuuid()
+
+    def end_input(self) -> None:
+        self.flush()
+        self._do_close()
+
+    async def aclose(self) -> None:
+        self._do_close()
+
+    def _emit(self, chunk: str) -> None:
+        self._event_ch.send_nowait(TokenData(token=chunk, segment_id=self._segment_id))
+
+
+def create_tts_tokenizer(settings: RuntimeSettings) -> ClauseFirstTokenizer:
+    """
+    Creates a ClauseFirstTokenizer configured from the runtime settings.
+    """
+    return ClauseFirstTokenizer(
+        first_min_chars=settings.TTS_FIRST_CHUNK_MIN_CHARS,
+        min_chars=settings.TTS_CHUNK_MIN_CHARS,
+        max_chars=settings.TTS_CHUNK_MAX_CHARS,
+    )
@@ -2,9 +2,12 @@ import logging
 from typing import Any, Optional
 
 from livekit.agents import AgentSession, room_io
-from livekit.plugins import noise_cancellation
+from livekit.agents.llm import LLM
+from livekit.plugins import noise_cancellation, silero
 
 from config.settings import RuntimeSettings
+from core.governor import CpuGovernor
+from core.llm_router import create_llm_router
 from core.plugins import (
     create_llm,
     create_stt,
@@ -12,29 +15,69 @@ from core.plugins import (
     create_turn_detector,
     create_vad,
 )
+from core.segmenter import create_tts_tokenizer
 
 logger = logging.getLogger("agent-runtime")
 
+# Modality profiles that run without an audio pipeline
+TEXT_MODALITY_PROFILES = {"text_chat"}
+
+
+def is_text_modality(modality_profile: Optional[str]) -> bool:
+    """Return True if the session's modality profile is text-only."""
+    return modality_profile in TEXT_MODALITY_PROFILES
+
+
+def _create_session_llm(settings: RuntimeSettings) -> LLM:
+    # Route between a fast and the configured model when a fast model is set
+    if settings.LLM_FAST_MODEL:
+        return create_llm_router(settings)
+    return create_llm()
+
+
+def _log_llm_models(settings: RuntimeSettings) -> None:
+    if settings.LLM_FAST_MODEL:
+        logger.info(
+            f"LLM Models: {settings.LLM_FAST_MODEL} (fast), "
+            f"{settings.LLM_MODEL} (strong)"
+        )
+    else:
+        logger.info(f"LLM Model: {settings.LLM_MODEL}")
+
 
 def create_agent_session(
-    settings: RuntimeSettings, userdata: Optional[Any] = None
+    settings: RuntimeSettings,
+    userdata: Optional[Any] = None,
+    governor: Optional[CpuGovernor] = None,
+    vad: Optional[silero.VAD] = None,
 ) -> AgentSession:
     """
     Creates a configured AgentSession with all voice pipeline plugins.
+
+    Pass the VAD preloaded in `prewarm` to avoid loading a second copy of the
+    model for the session.
+
+    If a governor is given, the semantic turn detector is registered as an
+    optional stage that falls back to VAD-only endpointing under CPU load.
     """
     logger.info("Initializing AgentSession plugins...")
 
     stt = create_stt()
-    llm = create_llm()
-    tts = create_tts()
-    vad = create_vad()
+    llm = _create_session_llm(settings)
+    tts = create_tts(
+        tokenizer=(
+            create_tts_tokenizer(settings) if settings.TTS_SEGMENTER_ENABLED else None
+        )
+    )
+    if vad is None:
+        vad = create_vad()
     turn_detector = create_turn_detector()
 
     # Log configuration (safe logging, no keys)
     logger.info(f"STT Model: {settings.STT_MODEL}")
-    logger.info(f"LLM Model: {settings.LLM_MODEL}")
+    _log_llm_models(settings)
     logger.info(f"TTS Model: {settings.TTS_MODEL}")
-    logger.info("VAD: Silero VAD loaded")
+    logger.info("VAD: Silero VAD ready")
     logger.info("Turn Detector: LiveKit Multilingual Model initialized")
 
     kwargs = dict(
@@ -43,6 +86,8 @@ def create_agent_session(
         tts=tts,
         vad=vad,
         turn_detection=turn_detector,
+        min_endpointing_delay=settings.ENDPOINTING_MIN_DELAY,
+        max_endpointing_delay=settings.ENDPOINTING_MAX_DELAY,
     )
 
     if userdata is not None:
@@ -50,16 +95,59 @@ def create_agent_session(
 
     session = AgentSession(**kwargs)
 
+    if governor is not None:
+        governor.register_stage(
+            "turn_detector",
+            degrade=lambda: session.update_options(turn_detection="vad"),
+            restore=lambda: session.update_options(turn_detection=turn_detector),
+        )
+
     return session
 
 
-def create_room_options() -> room_io.RoomOptions:
+def create_room_options(noise_cancellation_enabled: bool = True) -> room_io.RoomOptions:
     """
-    Creates a configured RoomOptions instance with noise cancellation.
+    Creates a configured RoomOptions instance, with noise cancellation unless
+    it has been disabled (e.g. by the CPU governor).
     """
     return room_io.RoomOptions(
         audio_input=room_io.AudioInputOptions(
-            noise_cancellation=noise_cancellation.BVC(),
+            noise_cancellation=(
+                noise_cancellation.BVC() if noise_cancellation_enabled else None
+            ),
         ),
         video_input=False,
     )
+
+
+def create_text_session(
+    settings: RuntimeSettings,
+    userdata: Optional[Any] = None,
+    llm: Optional[LLM] = None,
+) -> AgentSession:
+    """
+    Creates an AgentSession for text chat: LLM only, with no STT, TTS, VAD
+    or turn-detector instances.
+    """
+    if llm is None:
+        llm = _create_session_llm(settings)
+        _log_llm_models(settings)
+
+    kwargs = dict(llm=llm)
+    if userdata is not None:
+        kwargs["userdata"] = userdata
+
+    return AgentSession(**kwargs)
+
+
+def create_text_room_options() -> room_io.RoomOptions:
+    """
+    Creates RoomOptions that exchange messages over LiveKit text streams only.
+    """
+    return room_io.RoomOptions(
+        text_input=True,
+        text_output=True,
+        audio_input=False,
+        audio_output=False,
+        video_input=False,
+    )
@@ -0,0 +1,144 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from livekit.agents import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions, llm, utils
+
+# Rough chars-per-token ratio, same estimate as core.chat
+CHARS_PER_TOKEN = 4
+
+
+def _last_user_text(chat_ctx: llm.ChatContext) -> str:
+    for item in reversed(chat_ctx.items):
+        if item.type == "message" and item.role == "user":
+            return item.text_content or ""
+    return ""
+
+
+def _approx_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class ScriptedLLM(llm.LLM):
+    """
+    Local LLM stand-in that answers with a responder function and streams
+    the reply in small chunks, reporting approximate token usage.
+    """
+
+    def __init__(
+        self,
+        responder: Callable[[llm.ChatContext], str],
+        *,
+        model: str = "scripted",
+        chunk_size: int = 16,
+        chunk_delay: float = 0.0,
+    ):
+        super().__init__()
+        self._responder = responder
+        self._model = model
+        self._chunk_size = chunk_size
+        self._chunk_delay = chunk_delay
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def chat(
+        self,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: Optional[List[Any]] = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        **kwargs: Any,
+    ) -> llm.LLMStream:
+        return _ScriptedStream(
+            self,
+            chat_ctx=chat_ctx,
+            tools=tools or [],
+            conn_options=conn_options,
+            text=self._responder(chat_ctx),
+        )
+
+
+class _ScriptedStream(llm.LLMStream):
+    def __init__(
+        self,
+        llm_: ScriptedLLM,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: List[Any],
+        conn_options: APIConnectOptions,
+        text: str,
+    ):
+        super().__init__(
+            llm_, chat_ctx=chat_ctx, tools=tools, conn_options=conn_options
+        )
+        self._scripted = llm_
+        self._text = text
+
+    async def _run(self) -> None:
+        request_id = utils.shortuuid()
+        size = self._scripted._chunk_size
+        for start in range(0, len(self._text), size):
+            if self._scripted._chunk_delay:
+                await asyncio.sleep(self._scripted._chunk_delay)
+            self._event_ch.send_nowait(
+                llm.ChatChunk(
+                    id=request_id,
+                    delta=llm.ChoiceDelta(
+                        role="assistant", content=self._text[start : start + size]
+                    ),
+                )
+            )
+
+        prompt_chars = sum(
+            len(item.text_content or "")
+            for item in self._chat_ctx.items
+            if item.type == "message"
+        )
+        prompt_tokens = max(1, prompt_chars // CHARS_PER_TOKEN)
+        completion_tokens = _approx_tokens(self._text)
+        self._event_ch.send_nowait(
+            llm.ChatChunk(
+                id=request_id,
+                usage=llm.CompletionUsage(
+                    completion_tokens=completion_tokens,
+                    prompt_tokens=prompt_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
+                ),
+            )
+        )
+
+
+class RecordedLLM(ScriptedLLM):
+    """
+    Replays recorded assistant replies keyed by the user's last message.
+
+    The recording is a JSON object mapping user text to the reply; unknown
+    inputs get the fallback reply.
+    """
+
+    def __init__(
+        self,
+        responses: Dict[str, str],
+        *,
+        fallback: str = "",
+        model: str = "recorded",
+        **kwargs: Any,
+    ):
+        self._responses = responses
+        self._fallback = fallback
+        super().__init__(self._lookup, model=model, **kwargs)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> "RecordedLLM":
+        with open(path) as f:
+            return cls(json.load(f), **kwargs)
+
+    def _lookup(self, chat_ctx: llm.ChatContext) -> str:
+        return self._responses.get(_last_user_text(chat_ctx), self._fallback)
+
+
+def echo_responder(chat_ctx: llm.ChatContext) -> str:
+    """Deterministic default reply used when no recording is given."""
+    return f"You said: {_last_user_text(chat_ctx)}"
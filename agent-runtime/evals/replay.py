@@ -0,0 +1,660 @@
+import argparse
+import asyncio
+import os
+import time
+import wave
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from livekit import rtc
+from livekit.agents import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    AgentSession,
+    APIConnectOptions,
+    llm,
+    metrics,
+    stt,
+    tts,
+    utils,
+)
+from livekit.agents.types import TimedString
+from livekit.agents.voice import io
+
+from agents.base_agent import BaseAgent
+from config.settings import settings
+from core.plugins import create_vad
+from core.recorder import AUDIO_IN, AUDIO_OUT, EVENT, Record, iter_records
+
+# Seconds to wait for the agent to finish its last reply after the end of
+# the recording
+SETTLE_TIMEOUT = 30.0
+
+
+class ReplayClock:
+    """
+    Maps recording timestamps onto the replay's wall clock, scaled by `speed`
+    (2.0 = twice as fast).
+    """
+
+    def __init__(self, speed: float = 1.0):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._started = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Recording seconds replayed so far."""
+        return (time.perf_counter() - self._started) * self.speed
+
+    async def wait_until(self, timestamp: float) -> None:
+        delay = (timestamp - self.elapsed()) / self.speed
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class RecordedResponse:
+    """One recorded LLM request and its streamed chunks."""
+
+    user_text: Optional[str]
+    instructions: str
+    # (seconds after the request, chunk event)
+    chunks: List[Tuple[float, Dict[str, Any]]] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def ttft(self) -> float:
+        return self.chunks[0][0] if self.chunks else self.duration
+
+
+@dataclass
+class RecordedSynthesis:
+    """The audio of one recorded TTS request."""
+
+    text: str = ""
+    # (seconds after the first text, sample rate, channels, PCM)
+    frames: List[Tuple[float, int, int, bytes]] = field(default_factory=list)
+
+    @property
+    def ttfb(self) -> float:
+        return self.frames[0][0] if self.frames else 0.0
+
+
+def _last_message(chat_ctx: llm.ChatContext, role: str) -> Optional[str]:
+    for item in reversed(chat_ctx.items):
+        if item.type == "message" and item.role == role:
+            return item.text_content or ""
+    return None
+
+
+def _first_system_message(chat_ctx: llm.ChatContext) -> str:
+    # Later system messages are per-turn session state, not instructions
+    for item in chat_ctx.items:
+        if item.type == "message" and item.role == "system":
+            return item.text_content or ""
+    return ""
+
+
+def _audio_frame(audio: Tuple[int, int, bytes]) -> rtc.AudioFrame:
+    sample_rate, channels, pcm = audio
+    return rtc.AudioFrame(
+        data=pcm,
+        sample_rate=sample_rate,
+        num_channels=channels,
+        samples_per_channel=len(pcm) // (2 * channels),
+    )
+
+
+def load_responses(records: Iterable[Record]) -> List[RecordedResponse]:
+    responses: List[RecordedResponse] = []
+    current: Optional[RecordedResponse] = None
+    requested_at = 0.0
+    for record in records:
+        if record.kind != EVENT:
+            continue
+        event_type = record.event["type"]
+        if event_type == "llm_request":
+            chat_ctx = llm.ChatContext.from_dict(record.event["chat_ctx"])
+            current = RecordedResponse(
+                user_text=_last_message(chat_ctx, "user"),
+                instructions=_first_system_message(chat_ctx),
+            )
+            requested_at = record.timestamp
+            responses.append(current)
+        elif event_type == "llm_chunk" and current:
+            current.chunks.append((record.timestamp - requested_at, record.event))
+        elif event_type == "llm_done" and current:
+            current.duration = record.timestamp - requested_at
+            current = None
+    return responses
+
+
+def load_transcripts(records: Iterable[Record]) -> List[Tuple[float, stt.SpeechEvent]]:
+    """Recorded STT events with their timestamps, usage reports left out."""
+    events = []
+    for record in records:
+        if record.kind != EVENT or record.event["type"] != "stt":
+            continue
+        event_type = stt.SpeechEventType(record.event["event"])
+        if event_type == stt.SpeechEventType.RECOGNITION_USAGE:
+            continue
+        alternatives = []
+        if "text" in record.event:
+            alternatives.append(
+                stt.SpeechData(
+                    language=record.event.get("language") or "",
+                    text=record.event["text"],
+                    confidence=record.event.get("confidence", 0.0),
+                    start_time=record.event.get("start_time", 0.0),
+                    end_time=record.event.get("end_time", 0.0),
+                    words=[
+                        TimedString(text, start_time=start, end_time=end)
+                        for text, start, end in record.event.get("words", [])
+                    ]
+                    or None,
+                )
+            )
+        events.append(
+            (record.timestamp, stt.SpeechEvent(event_type, alternatives=alternatives))
+        )
+    return events
+
+
+def load_syntheses(records: Iterable[Record]) -> List[RecordedSynthesis]:
+    syntheses: List[RecordedSynthesis] = []
+    current: Optional[RecordedSynthesis] = None
+    started_at = 0.0
+    for record in records:
+        if record.kind == EVENT and record.event["type"] == "tts_text":
+            if current is None:
+                current = RecordedSynthesis()
+                started_at = record.timestamp
+                syntheses.append(current)
+            current.text += record.event["text"]
+        elif record.kind == AUDIO_OUT:
+            if current is None:
+                current = RecordedSynthesis()
+                started_at = record.timestamp
+                syntheses.append(current)
+            current.frames.append((record.timestamp - started_at, *record.audio))
+        elif record.kind == EVENT and record.event["type"] == "tts_done":
+            current = None
+    return syntheses
+
+
+def load_audio_in(records: Iterable[Record]) -> List[Tuple[float, rtc.AudioFrame]]:
+    return [
+        (record.timestamp, _audio_frame(record.audio))
+        for record in records
+        if record.kind == AUDIO_IN
+    ]
+
+
+class ReplayLLM(llm.LLM):
+    """
+    Serves recorded LLM responses with the recorded provider timing, scaled
+    by `speed`.
+    """
+
+    def __init__(self, responses: List[RecordedResponse], *, speed: float = 1.0):
+        super().__init__()
+        self._pending = list(responses)
+        self._speed = speed
+        # request id -> the recorded response it was served
+        self.served: Dict[str, RecordedResponse] = {}
+
+    @property
+    def model(self) -> str:
+        return "replay"
+
+    def chat(
+        self,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: Optional[List[Any]] = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        **kwargs: Any,
+    ) -> llm.LLMStream:
+        return _ReplayStream(
+            self,
+            chat_ctx=chat_ctx,
+            tools=tools or [],
+            conn_options=conn_options,
+            response=self._next_response(_last_message(chat_ctx, "user")),
+        )
+
+    def _next_response(self, user_text: Optional[str]) -> RecordedResponse:
+        for index, response in enumerate(self._pending):
+            if response.user_text == user_text:
+                return self._pending.pop(index)
+        if not self._pending:
+            raise RuntimeError("Recording has no more LLM responses")
+        return self._pending.pop(0)
+
+
+class _ReplayStream(llm.LLMStream):
+    def __init__(
+        self,
+        llm_: ReplayLLM,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: List[Any],
+        conn_options: APIConnectOptions,
+        response: RecordedResponse,
+    ):
+        super().__init__(
+            llm_, chat_ctx=chat_ctx, tools=tools, conn_options=conn_options
+        )
+        self._llm_ = llm_
+        self._response = response
+
+    async def _run(self) -> None:
+        request_id = utils.shortuuid()
+        self._llm_.served[request_id] = self._response
+        clock = ReplayClock(self._llm_._speed)
+        for offset, event in self._response.chunks:
+            await clock.wait_until(offset)
+            if "chunk" in event:
+                chunk = llm.ChatChunk.model_validate(event["chunk"])
+                chunk.id = request_id
+            else:
+                chunk = llm.ChatChunk(
+                    id=request_id,
+                    delta=llm.ChoiceDelta(role="assistant", content=event["text"]),
+                )
+            self._event_ch.send_nowait(chunk)
+        await clock.wait_until(self._response.duration)
+
+
+class ReplaySTT(stt.STT):
+    """
+    Streams the recorded STT events at their recorded times on the replay
+    clock. The audio pushed to the stream is consumed but not transcribed.
+    """
+
+    def __init__(
+        self, events: List[Tuple[float, stt.SpeechEvent]], *, clock: ReplayClock
+    ):
+        super().__init__(
+            capabilities=stt.STTCapabilities(
+                streaming=True, interim_results=True, aligned_transcript="word"
+            )
+        )
+        self._pending = list(events)
+        self._clock = clock
+
+    @property
+    def model(self) -> str:
+        return "replay"
+
+    async def _recognize_impl(self, buffer: Any, **kwargs: Any) -> stt.SpeechEvent:
+        raise NotImplementedError("ReplaySTT only supports streaming")
+
+    def stream(
+        self,
+        *,
+        language: Any = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> stt.RecognizeStream:
+        return _ReplaySpeechStream(self, conn_options=conn_options)
+
+
+class _ReplaySpeechStream(stt.RecognizeStream):
+    def __init__(self, stt_: ReplaySTT, *, conn_options: APIConnectOptions):
+        super().__init__(stt=stt_, conn_options=conn_options)
+        self._stt_ = stt_
+
+    async def _run(self) -> None:
+        drain = asyncio.create_task(self._drain_input())
+        try:
+            pending = self._stt_._pending
+            while pending:
+                timestamp, event = pending[0]
+                await self._stt_._clock.wait_until(timestamp)
+                pending.pop(0)
+                self._event_ch.send_nowait(event)
+            await drain
+        finally:
+            await utils.aio.cancel_and_wait(drain)
+
+    async def _drain_input(self) -> None:
+        async for _ in self._input_ch:
+            pass
+
+
+class ReplayTTS(tts.TTS):
+    """
+    Plays back the recorded audio of each TTS request, timed from the first
+    text it receives as in the recording and scaled by `speed`.
+    """
+
+    def __init__(self, syntheses: List[RecordedSynthesis], *, speed: float = 1.0):
+        first_frame = next((s.frames[0] for s in syntheses if s.frames), None)
+        super().__init__(
+            capabilities=tts.TTSCapabilities(streaming=True),
+            sample_rate=first_frame[1] if first_frame else 24000,
+            num_channels=first_frame[2] if first_frame else 1,
+        )
+        self._pending = list(syntheses)
+        self._speed = speed
+        # request id -> the recorded synthesis it was served
+        self.served: Dict[str, RecordedSynthesis] = {}
+
+    @property
+    def model(self) -> str:
+        return "replay"
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> tts.ChunkedStream:
+        return self._synthesize_with_stream(text, conn_options=conn_options)
+
+    def stream(
+        self, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> tts.SynthesizeStream:
+        return _ReplaySynthesizeStream(self, conn_options=conn_options)
+
+    def _next_synthesis(self) -> RecordedSynthesis:
+        if not self._pending:
+            raise RuntimeError("Recording has no more TTS audio")
+        return self._pending.pop(0)
+
+
+class _ReplaySynthesizeStream(tts.SynthesizeStream):
+    def __init__(self, tts_: ReplayTTS, *, conn_options: APIConnectOptions):
+        super().__init__(tts=tts_, conn_options=conn_options)
+        self._tts_ = tts_
+
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        request_id = utils.shortuuid()
+        output_emitter.initialize(
+            request_id=request_id,
+            sample_rate=self._tts_.sample_rate,
+            num_channels=self._tts_.num_channels,
+            mime_type="audio/pcm",
+            stream=True,
+        )
+
+        # The recorded timing starts at the first text, as the provider's did
+        async for data in self._input_ch:
+            if isinstance(data, str):
+                break
+        else:
+            return
+
+        self._mark_started()
+        synthesis = self._tts_._next_synthesis()
+        self._tts_.served[request_id] = synthesis
+        output_emitter.start_segment(segment_id=request_id)
+        drain = asyncio.create_task(self._drain_input())
+        try:
+            clock = ReplayClock(self._tts_._speed)
+            audio_format = (self._tts_.sample_rate, self._tts_.num_channels)
+            for offset, sample_rate, channels, pcm in synthesis.frames:
+                await clock.wait_until(offset)
+                if (sample_rate, channels) != audio_format:
+                    continue
+                # The recorded frames are the ones the provider's emitter
+                # released; flush so each is released when it was recorded
+                # rather than buffered into the next one
+                output_emitter.push(pcm)
+                output_emitter.flush()
+            await drain
+        finally:
+            await utils.aio.cancel_and_wait(drain)
+        output_emitter.end_segment()
+
+    async def _drain_input(self) -> None:
+        async for _ in self._input_ch:
+            pass
+
+
+class ReplayAudioInput(io.AudioInput):
+    """Feeds the recorded inbound audio to the session at its recorded times."""
+
+    def __init__(
+        self, frames: List[Tuple[float, rtc.AudioFrame]], *, clock: ReplayClock
+    ):
+        super().__init__(label="Replay")
+        self._frames = iter(frames)
+        self._clock = clock
+
+    async def __anext__(self) -> rtc.AudioFrame:
+        try:
+            timestamp, frame = next(self._frames)
+        except StopIteration:
+            raise StopAsyncIteration
+        await self._clock.wait_until(timestamp)
+        return frame
+
+
+class ReplayAudioOutput(io.AudioOutput):
+    """
+    Discards the agent's audio but takes as long to "play" it as a listener
+    would, scaled by the clock's speed, so interruptions and turn-taking
+    happen as they did in the session.
+    """
+
+    def __init__(self, *, clock: ReplayClock):
+        super().__init__(
+            label="Replay",
+            capabilities=io.AudioOutputCapabilities(pause=False),
+        )
+        self._clock = clock
+        self._pushed_duration = 0.0
+        self._capture_start = 0.0
+        self._interrupted = asyncio.Event()
+        self._playout_task: Optional[asyncio.Task] = None
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await super().capture_frame(frame)
+        if self._playout_task:
+            await self._playout_task
+        if not self._pushed_duration:
+            self._capture_start = time.perf_counter()
+            self._interrupted.clear()
+            self.on_playback_started(created_at=time.time())
+        self._pushed_duration += frame.duration
+
+    def flush(self) -> None:
+        super().flush()
+        if self._pushed_duration and not self._playout_task:
+            self._playout_task = asyncio.create_task(self._wait_for_playout())
+
+    def clear_buffer(self) -> None:
+        if self._pushed_duration:
+            self._interrupted.set()
+
+    async def _wait_for_playout(self) -> None:
+        remaining = self._pushed_duration / self._clock.speed - (
+            time.perf_counter() - self._capture_start
+        )
+        try:
+            await asyncio.wait_for(self._interrupted.wait(), max(0.0, remaining))
+            interrupted = True
+        except asyncio.TimeoutError:
+            interrupted = False
+
+        played = self._pushed_duration
+        if interrupted:
+            elapsed = (time.perf_counter() - self._capture_start) * self._clock.speed
+            played = min(elapsed, self._pushed_duration)
+        self._pushed_duration = 0.0
+        self._playout_task = None
+        self.on_playback_finished(playback_position=played, interrupted=interrupted)
+
+
+def export_wav(records: Iterable[Record], kind: int, path: str) -> float:
+    """
+    Write the recorded audio of one direction to a WAV file and return its
+    duration in seconds. Frames with a different format than the first are
+    skipped.
+    """
+    audio_format = None
+    samples = 0
+    with wave.open(path, "wb") as wav:
+        for record in records:
+            if record.kind != kind:
+                continue
+            sample_rate, channels, pcm = record.audio
+            if audio_format is None:
+                audio_format = (sample_rate, channels)
+                wav.setnchannels(channels)
+                wav.setsampwidth(2)
+                wav.setframerate(sample_rate)
+            if (sample_rate, channels) != audio_format:
+                continue
+            wav.writeframes(pcm)
+            samples += len(pcm) // (2 * channels)
+        if audio_format is None:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+    return samples / audio_format[0] if audio_format else 0.0
+
+
+async def _wait_until_settled(session: AgentSession) -> None:
+    settled = asyncio.Event()
+
+    def check(*_: Any) -> None:
+        if session.agent_state in ("listening", "idle"):
+            settled.set()
+
+    session.on("agent_state_changed", check)
+    check()
+    try:
+        await asyncio.wait_for(settled.wait(), SETTLE_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        session.off("agent_state_changed", check)
+
+
+async def replay(path: str, speed: float) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Re-run a recorded voice session offline and compare the replayed
+    provider metrics with the recorded timings.
+
+    The recorded inbound audio is fed to the session and runs through the VAD
+    as it did live, while STT events, LLM chunks and TTS audio come from the
+    recording at their recorded times, all scaled by `speed`. Turns are
+    committed on the recorded STT end-of-speech events.
+    """
+    responses = load_responses(iter_records(path))
+    last_timestamp = max((r.timestamp for r in iter_records(path)), default=0.0)
+    instructions = responses[0].instructions if responses else ""
+    greets = bool(responses) and responses[0].user_text is None
+
+    clock = ReplayClock(speed)
+    replay_llm = ReplayLLM(responses, speed=speed)
+    replay_tts = ReplayTTS(load_syntheses(iter_records(path)), speed=speed)
+    session = AgentSession(
+        stt=ReplaySTT(load_transcripts(iter_records(path)), clock=clock),
+        llm=replay_llm,
+        tts=replay_tts,
+        vad=create_vad(),
+        turn_detection="stt",
+        min_endpointing_delay=settings.ENDPOINTING_MIN_DELAY / speed,
+        max_endpointing_delay=settings.ENDPOINTING_MAX_DELAY / speed,
+    )
+    session.input.audio = ReplayAudioInput(
+        load_audio_in(iter_records(path)), clock=clock
+    )
+    session.output.audio = ReplayAudioOutput(clock=clock)
+
+    replayed: List[Any] = []
+
+    @session.on("metrics_collected")
+    def on_metrics_collected(ev: Any):
+        if isinstance(ev.metrics, (metrics.LLMMetrics, metrics.TTSMetrics)):
+            replayed.append(ev.metrics)
+
+    async with session:
+        await session.start(
+            BaseAgent(
+                instructions=instructions,
+                greeting=settings.DEFAULT_AGENT_GREETING if greets else None,
+            )
+        )
+        await clock.wait_until(last_timestamp)
+        await _wait_until_settled(session)
+
+    results: Dict[str, List[Dict[str, Any]]] = {"llm": [], "tts": []}
+    for m in replayed:
+        if isinstance(m, metrics.LLMMetrics) and m.request_id in replay_llm.served:
+            response = replay_llm.served[m.request_id]
+            results["llm"].append(
+                {
+                    "input": response.user_text or "(greeting)",
+                    "recorded_ttft": response.ttft,
+                    "replayed_ttft": m.ttft,
+                    "recorded_duration": response.duration,
+                    "replayed_duration": m.duration,
+                }
+            )
+        elif isinstance(m, metrics.TTSMetrics) and m.request_id in replay_tts.served:
+            synthesis = replay_tts.served[m.request_id]
+            results["tts"].append(
+                {
+                    "input": synthesis.text,
+                    "recorded_ttfb": synthesis.ttfb,
+                    "replayed_ttfb": m.ttfb,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay a session recording offline with recorded timings."
+    )
+    parser.add_argument("recording", help="Path to a .rec session recording")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Timing scale: 2 = twice as fast, 0.5 = half speed",
+    )
+    parser.add_argument(
+        "--export-audio",
+        metavar="DIR",
+        help="Write inbound and synthesized audio as WAV files to DIR",
+    )
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    if args.export_audio:
+        os.makedirs(args.export_audio, exist_ok=True)
+        for kind, name in ((AUDIO_IN, "inbound.wav"), (AUDIO_OUT, "outbound.wav")):
+            wav_path = os.path.join(args.export_audio, name)
+            duration = export_wav(iter_records(args.recording), kind, wav_path)
+            print(f"Wrote {duration:.1f}s of audio to {wav_path}")
+
+    results = asyncio.run(replay(args.recording, args.speed))
+    # Replayed times are in replay seconds; at --speed 2 they should be half
+    # the recorded ones
+    print(
+        f"{'LLM request':<40} {'Rec TTFT':>9} {'Rep TTFT':>9} {'Rec total':>10} "
+        f"{'Rep total':>10}"
+    )
+    for result in results["llm"]:
+        print(
+            f"{result['input'][:40]:<40} {result['recorded_ttft']:>9.3f} "
+            f"{result['replayed_ttft']:>9.3f} "
+            f"{result['recorded_duration']:>10.3f} "
+            f"{result['replayed_duration']:>10.3f}"
+        )
+    print(f"\n{'TTS request':<40} {'Rec TTFB':>9} {'Rep TTFB':>9}")
+    for result in results["tts"]:
+        print(
+            f"{result['input'][:40]:<40} {result['recorded_ttfb']:>9.3f} "
+            f"{result['replayed_ttfb']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+import difflib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from livekit.agents import metrics
+
+from agents.base_agent import BaseAgent
+from config.settings import settings
+from core.prompt import create_prompt_assembler
+from core.session import create_text_session
+from evals.fake_llm import RecordedLLM, ScriptedLLM, echo_responder
+
+
+def _create_llm(agent_def: Dict[str, Any], recording: Optional[str]) -> ScriptedLLM:
+    model = agent_def.get("model", "scripted")
+    if recording:
+        return RecordedLLM.from_file(recording, model=model)
+    return ScriptedLLM(echo_responder, model=model)
+
+
+async def run_conversation(
+    agent_def: Dict[str, Any], script: Dict[str, Any], recording: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Run one scripted conversation against an agent definition in text mode.
+
+    Returns a report with token usage, per-turn latency and the diff of each
+    reply against the expected output (if the script provides one).
+    """
+    session = create_text_session(settings, llm=_create_llm(agent_def, recording))
+    usage = {"prompt_tokens": 0, "completion_tokens": 0}
+
+    @session.on("metrics_collected")
+    def on_metrics_collected(ev: Any):
+        if isinstance(ev.metrics, metrics.LLMMetrics):
+            usage["prompt_tokens"] += ev.metrics.prompt_tokens
+            usage["completion_tokens"] += ev.metrics.completion_tokens
+
+    expected = script.get("expected") or []
+    turns = []
+    async with session:
+        await session.start(
+            BaseAgent(
+                instructions=agent_def["instructions"],
+                prompt_assembler=create_prompt_assembler(settings),
+            )
+        )
+
+        for index, user_input in enumerate(script["turns"]):
+            started = time.perf_counter()
+            result = await session.run(user_input=user_input)
+            latency = time.perf_counter() - started
+
+            output = " ".join(
+                ev.item.text_content or ""
+                for ev in result.events
+                if ev.type == "message" and ev.item.role == "assistant"
+            )
+            turn = {"input": user_input, "output": output, "latency": latency}
+            if index < len(expected):
+                turn["diff"] = list(
+                    difflib.unified_diff(
+                        expected[index].splitlines(),
+                        output.splitlines(),
+                        "expected",
+                        "actual",
+                        lineterm="",
+                    )
+                )
+            turns.append(turn)
+
+    latencies = [turn["latency"] for turn in turns]
+    return {
+        "agent": agent_def["name"],
+        "script": script["id"],
+        "turns": turns,
+        "prompt_tokens": usage["prompt_tokens"],
+        "completion_tokens": usage["completion_tokens"],
+        "mean_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+        "max_latency": max(latencies, default=0.0),
+        "mismatches": sum(1 for turn in turns if turn.get("diff")),
+    }
+
+
+def _run_job(job: tuple) -> Dict[str, Any]:
+    agent_def, script, recording = job
+    try:
+        return asyncio.run(run_conversation(agent_def, script, recording))
+    except Exception as e:
+        return {
+            "agent": agent_def.get("name"),
+            "script": script.get("id"),
+            "error": str(e),
+        }
+
+
+def run_batch(
+    agent_defs: List[Dict[str, Any]],
+    scripts: List[Dict[str, Any]],
+    recording: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Run every script against every agent across a process pool."""
+    jobs = [(agent, script, recording) for agent in agent_defs for script in scripts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_job, jobs))
+
+
+def print_summary(reports: List[Dict[str, Any]], elapsed: float) -> None:
+    print(
+        f"{'Agent':<30} {'Script':<20} {'Prompt':>8} {'Compl.':>8} "
+        f"{'Mean s':>8} {'Max s':>8} {'Diffs':>6}"
+    )
+    for report in reports:
+        if "error" in report:
+            print(
+                f"{report['agent']:<30} {report['script']:<20} ERROR {report['error']}"
+            )
+            continue
+        print(
+            f"{report['agent'][:30]:<30} {report['script'][:20]:<20} "
+            f"{report['prompt_tokens']:>8} {report['completion_tokens']:>8} "
+            f"{report['mean_latency']:>8.3f} {report['max_latency']:>8.3f} "
+            f"{report['mismatches']:>6}"
+        )
+        for turn in report["turns"]:
+            for line in turn.get("diff", []):
+                print(f"    {line}")
+
+    print(f"\n{len(reports)} conversations in {elapsed:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run scripted conversations against agent definitions."
+    )
+    parser.add_argument(
+        "--agents",
+        required=True,
+        help="JSON list of agent definitions (e.g. GET /api/v1/agents/export)",
+    )
+    parser.add_argument(
+        "--scripts",
+        required=True,
+        help='JSON list of {"id", "turns": [...], "expected": [...]} scripts',
+    )
+    parser.add_argument(
+        "--recording",
+        help="JSON object mapping user text to recorded replies "
+        "(default: deterministic echo LLM)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", help="Write the full JSON report to this file")
+    args = parser.parse_args()
+
+    with open(args.agents) as f:
+        agent_defs = json.load(f)
+    with open(args.scripts) as f:
+        scripts = json.load(f)
+
+    started = time.perf_counter()
+    reports = run_batch(agent_defs, scripts, args.recording, args.workers)
+    print_summary(reports, time.perf_counter() - started)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(reports, f, indent=2)
+
+    if any("error" in report or report["mismatches"] for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,38 @@
 import json
 
 from livekit import agents, rtc
-from livekit.plugins import silero
 
 from agents.base_agent import BaseAgent
 from config.settings import settings
 from core.context import SessionContext
+from core.drain import create_load_fnc, create_session_migrator, load_job_checkpoint
+from core.endpointing import (
+    create_endpointing_controller,
+    register_endpointing_handlers,
+)
+from core.governor import create_cpu_governor
+from core.history import create_history_spill, register_history_spill_handlers
 from core.logging import get_logger, setup_logging
-from core.session import create_agent_session, create_room_options
+from core.loop_monitor import create_loop_monitor
+from core.metrics import (
+    register_prompt_cache_handlers,
+    register_speech_metrics_handlers,
+)
+from core.noise_probe import is_clean_signal
+from core.observer import create_session_observer, register_observer_handlers
+from core.plugins import create_vad
+from core.profiler import create_profiler, register_profiler_triggers
+from core.prompt import create_prompt_assembler
+from core.recorder import create_session_recorder
+from core.remote_turn_detector import disable_local_inference
+from core.session import (
+    create_agent_session,
+    create_room_options,
+    create_text_room_options,
+    create_text_session,
+    is_text_modality,
+)
+from utils.memory import private_bytes, read_memory
 
 logger = get_logger("agent_runtime")
 
@@ -18,8 +43,17 @@ async def prewarm(proc: agents.JobProcess):
     """
     logger.info("Agent process prewarming...")
 
-    proc.userdata["vad"] = silero.VAD.load(force_download=False)
-    logger.info("Silero VAD loaded")
+    before = read_memory()
+    proc.userdata["vad"] = create_vad()
+    after = read_memory()
+
+    # Sessions reuse this instance, so this is the VAD's whole per-job cost
+    proc.userdata["vad_rss"] = after["Rss"] - before["Rss"]
+    private_delta = private_bytes(after) - private_bytes(before)
+    logger.info(
+        f"Silero VAD loaded (RSS +{proc.userdata['vad_rss'] / 2**20:.1f} MiB, "
+        f"private +{private_delta / 2**20:.1f} MiB)"
+    )
 
     # Pre-import other plugins implicitly done at top level,
     # but we can force initialize things if needed.
@@ -80,36 +114,130 @@ async def entrypoint(ctx: agents.JobContext):
                     f"Failed to parse metadata for participant {first_p.identity}"
                 )
 
-    session_ctx = SessionContext(
-        user_id=metadata.get("user_id"),
-        session_template_id=metadata.get("session_template_id"),
-    )
+    # A migration dispatch carries the checkpoint of a session that was
+    # running on a draining worker
+    checkpoint = load_job_checkpoint(ctx.job.metadata)
+    if checkpoint:
+        session_ctx = SessionContext.from_dict(checkpoint.session_ctx)
+    else:
+        session_ctx = SessionContext(
+            user_id=metadata.get("user_id"),
+            session_template_id=metadata.get("session_template_id"),
+            modality_profile=metadata.get("modality_profile"),
+        )
+    text_only = is_text_modality(session_ctx.modality_profile)
+
+    if settings.ADAPTIVE_ENDPOINTING_ENABLED and not text_only:
+        session_ctx.endpointing = create_endpointing_controller(settings)
+        if checkpoint and checkpoint.endpointing_delays:
+            # Keep the delays learned on the previous worker
+            min_delay, max_delay = checkpoint.endpointing_delays
+            session_ctx.endpointing.min_delay = min_delay
+            session_ctx.endpointing.max_delay = max_delay
+
+    register_profiler_triggers(ctx, create_profiler(settings), settings)
+
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor = create_loop_monitor(settings, ctx.room.name)
+        loop_monitor.start()
+        ctx.add_shutdown_callback(loop_monitor.aclose)
+
+    governor = None
+    if settings.CPU_GOVERNOR_ENABLED and not text_only:
+        governor = create_cpu_governor(settings)
+        governor.start()
+        ctx.add_shutdown_callback(governor.aclose)
 
     # Task 13.8: Create and start AgentSession (userdata passed to constructor)
-    session = create_agent_session(settings, userdata=session_ctx)
+    if text_only:
+        logger.info("Text-only modality: skipping STT, TTS, VAD and turn detection")
+        session = create_text_session(settings, userdata=session_ctx)
+        room_options = create_text_room_options()
+    else:
+        session = create_agent_session(
+            settings,
+            userdata=session_ctx,
+            governor=governor,
+            vad=ctx.proc.userdata.get("vad"),
+        )
+
+        # Noise cancellation can't be toggled on a live track, so the governor
+        # decides it once at session start, and only drops it for a user whose
+        # microphone is known to be clean
+        noise_cancellation_enabled = True
+        if governor and governor.is_saturated():
+            noise_cancellation_enabled = not await is_clean_signal(ctx.room, settings)
+            if not noise_cancellation_enabled:
+                logger.warning(
+                    f"Node CPU at {governor.node_utilization:.0%}; clean signal, "
+                    "starting session without noise cancellation"
+                )
+        room_options = create_room_options(noise_cancellation_enabled)
 
     # Task 14.6: Register error handlers
     from core.error_handler import register_error_handlers
 
     register_error_handlers(session)
 
-    # Create BaseAgent
+    if session_ctx.endpointing:
+        register_endpointing_handlers(session, session_ctx.endpointing)
+        if checkpoint:
+            session.update_options(
+                min_endpointing_delay=session_ctx.endpointing.min_delay,
+                max_endpointing_delay=session_ctx.endpointing.max_delay,
+            )
+
+    if settings.OBSERVER_ENABLED:
+        observer = create_session_observer(settings, session_ctx)
+        register_observer_handlers(session, observer)
+        observer.start()
+        ctx.add_shutdown_callback(observer.aclose)
+
+    register_prompt_cache_handlers(session)
+    if not text_only:
+        register_speech_metrics_handlers(session)
+
+    recorder = create_session_recorder(settings, ctx.room.name)
+    if recorder:
+        ctx.add_shutdown_callback(recorder.aclose)
+
+    # Create BaseAgent (a migrated session resumes without greeting again)
     agent = BaseAgent(
         instructions=settings.DEFAULT_AGENT_INSTRUCTIONS,
-        greeting=settings.DEFAULT_AGENT_GREETING,
+        greeting=None if checkpoint else settings.DEFAULT_AGENT_GREETING,
+        chat_ctx=checkpoint.restore_chat_ctx() if checkpoint else None,
+        prompt_assembler=create_prompt_assembler(settings),
+        recorder=recorder,
+    )
+
+    history_spill = create_history_spill(settings, ctx.room.name)
+    if history_spill:
+        register_history_spill_handlers(session, agent, history_spill)
+        ctx.add_shutdown_callback(history_spill.aclose)
+
+    migrator = create_session_migrator(
+        settings, ctx, session, session_ctx, history_spill
     )
 
     # Start the session (greeting is handled by BaseAgent.on_enter)
     await session.start(
         agent=agent,
         room=ctx.room,
-        room_options=create_room_options(),
+        room_options=room_options,
     )
 
+    if migrator:
+        migrator.start()
+        ctx.add_shutdown_callback(migrator.aclose)
+
 
 if __name__ == "__main__":
     setup_logging(settings.LOG_LEVEL)
 
+    # The per-node sidecar hosts the turn-detector model instead
+    if settings.TURN_DETECTOR_SOCKET_PATH:
+        disable_local_inference()
+
     agents.cli.run_app(
         agents.WorkerOptions(
             entrypoint_fnc=entrypoint,
@@ -118,5 +246,9 @@ if __name__ == "__main__":
             api_secret=settings.LIVEKIT_API_SECRET,
             ws_url=settings.LIVEKIT_URL,
             num_idle_processes=settings.WORKER_NUM_IDLE_PROCESSES,
+            agent_name=settings.AGENT_NAME,
+            load_fnc=create_load_fnc(settings.DRAIN_FLAG_FILE),
+            prometheus_port=settings.PROMETHEUS_PORT or agents.NOT_GIVEN,
+            prometheus_multiproc_dir=settings.PROMETHEUS_MULTIPROC_DIR or None,
         )
     )
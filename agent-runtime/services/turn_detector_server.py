@@ -0,0 +1,205 @@
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+from livekit.plugins.turn_detector.multilingual import _EUORunnerMultilingual
+
+from config.settings import settings
+from core.logging import get_logger, setup_logging
+from utils.framing import encode_frame, read_frame
+
+logger = get_logger("services.turn_detector_server")
+
+MAX_HISTORY_TOKENS = 128
+
+
+@dataclass
+class _PendingRequest:
+    chat_ctx: List[Dict[str, Any]]
+    future: asyncio.Future = field(repr=False)
+
+
+class TurnDetectorServer:
+    """
+    Per-node turn-detector inference sidecar.
+
+    Loads the multilingual end-of-turn model once and serves every job process
+    on the node over a Unix socket. Requests that arrive within the batch
+    window are batched into a single ONNX run.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        *,
+        batch_window: float = 0.005,
+        max_batch_size: int = 16,
+    ):
+        self._socket_path = socket_path
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[_PendingRequest] = asyncio.Queue()
+        self._runner = _EUORunnerMultilingual()
+        self._batched_runs_supported = True
+
+    def load_model(self) -> None:
+        """Load the ONNX model and tokenizer (done once for the whole node)."""
+        started = time.perf_counter()
+        self._runner.initialize()
+        logger.info(
+            f"Turn detector model loaded in {time.perf_counter() - started:.2f}s"
+        )
+
+    async def serve(self) -> None:
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+
+        server = await asyncio.start_unix_server(
+            self._handle_connection, path=self._socket_path
+        )
+        batcher = asyncio.create_task(self._batch_loop())
+        logger.info(f"Turn detector sidecar listening on {self._socket_path}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                frame = await read_frame(reader)
+                response = await self._predict(frame)
+                writer.write(encode_frame(json.dumps(response).encode()))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass  # Client closed the connection
+        except Exception as e:
+            logger.error(f"Turn detector connection error: {e}")
+        finally:
+            writer.close()
+
+    async def _predict(self, frame: bytes) -> Dict[str, Any]:
+        try:
+            chat_ctx = json.loads(frame)["chat_ctx"]
+        except (ValueError, KeyError) as e:
+            return {"error": f"Invalid request: {e}"}
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(chat_ctx=chat_ctx, future=future))
+        try:
+            return {"eou_probability": await future}
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._batch_window
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                # Inference runs off the event loop so new requests keep queueing
+                probabilities = await loop.run_in_executor(
+                    None, self._infer, [request.chat_ctx for request in batch]
+                )
+            except Exception as e:
+                logger.error(f"Turn detector inference failed: {e}")
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            for request, probability in zip(batch, probabilities):
+                if not request.future.done():
+                    request.future.set_result(probability)
+
+    def _infer(self, chat_ctxs: List[List[Dict[str, Any]]]) -> List[float]:
+        started = time.perf_counter()
+        token_ids = [self._tokenize(chat_ctx) for chat_ctx in chat_ctxs]
+
+        probabilities = None
+        if len(token_ids) > 1 and self._batched_runs_supported:
+            try:
+                probabilities = self._run_batched(token_ids)
+            except Exception as e:
+                # The exported graph may pin the batch dimension to 1
+                logger.warning(f"Batched ONNX run unavailable, running singly: {e}")
+                self._batched_runs_supported = False
+        if probabilities is None:
+            probabilities = [self._run_single(ids) for ids in token_ids]
+
+        logger.debug(
+            f"Turn detector batch of {len(token_ids)} ran in "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return probabilities
+
+    def _tokenize(self, chat_ctx: List[Dict[str, Any]]) -> List[int]:
+        text = self._runner._format_chat_ctx(chat_ctx)
+        inputs = self._runner._tokenizer(
+            text,
+            add_special_tokens=False,
+            max_length=MAX_HISTORY_TOKENS,
+            truncation=True,
+        )
+        return list(inputs["input_ids"])
+
+    def _run_single(self, token_ids: List[int]) -> float:
+        input_ids = np.array([token_ids], dtype=np.int64)
+        outputs = self._runner._session.run(None, {"input_ids": input_ids})
+        return float(outputs[0].flatten()[-1])
+
+    def _run_batched(self, token_ids: List[List[int]]) -> List[float]:
+        """
+        Run one ONNX pass over right-padded sequences.
+
+        The model is causal, so padding after a sequence cannot change the
+        prediction at its last real token, which is where each probability is
+        read from.
+        """
+        pad_id = self._runner._tokenizer.pad_token_id or 0
+        lengths = [len(ids) for ids in token_ids]
+        input_ids = np.full((len(token_ids), max(lengths)), pad_id, dtype=np.int64)
+        for row, ids in enumerate(token_ids):
+            input_ids[row, : len(ids)] = ids
+
+        outputs = self._runner._session.run(None, {"input_ids": input_ids})
+        per_position = outputs[0].reshape(len(token_ids), -1)
+        return [
+            float(per_position[row, length - 1]) for row, length in enumerate(lengths)
+        ]
+
+
+async def main() -> None:
+    server = TurnDetectorServer(
+        settings.TURN_DETECTOR_SOCKET_PATH,
+        batch_window=settings.TURN_DETECTOR_BATCH_WINDOW_MS / 1000,
+        max_batch_size=settings.TURN_DETECTOR_MAX_BATCH_SIZE,
+    )
+    server.load_model()
+    await server.serve()
+
+
+if __name__ == "__main__":
+    setup_logging(settings.LOG_LEVEL)
+    if not settings.TURN_DETECTOR_SOCKET_PATH:
+        raise SystemExit("TURN_DETECTOR_SOCKET_PATH must be set")
+    asyncio.run(main())
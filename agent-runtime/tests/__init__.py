@@ -0,0 +1,13 @@
+import os
+
+# Settings are loaded at import time; unit tests never reach these services
+for _key in (
+    "LIVEKIT_URL",
+    "LIVEKIT_API_KEY",
+    "LIVEKIT_API_SECRET",
+    "DEEPGRAM_API_KEY",
+    "OPENAI_API_KEY",
+    "CARTESIA_API_KEY",
+    "TTS_VOICE_ID",
+):
+    os.environ.setdefault(_key, "test")
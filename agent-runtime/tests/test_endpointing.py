@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+
+from livekit.agents import stt
+from livekit.agents.types import TimedString
+
+from core.endpointing import AdaptiveEndpointing, record_word_pauses
+
+
+def _final(*words: tuple) -> stt.SpeechEvent:
+    return stt.SpeechEvent(
+        type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+        alternatives=[
+            stt.SpeechData(
+                language="en",
+                text=" ".join(text for text, _, _ in words),
+                words=[TimedString(text, start, end) for text, start, end in words],
+            )
+        ],
+    )
+
+
+async def _events(*events):
+    for ev in events:
+        yield ev
+
+
+async def _drain(events):
+    return [ev async for ev in events]
+
+
+class AdaptiveEndpointingTest(unittest.TestCase):
+    def test_records_gaps_between_words_across_finals(self):
+        controller = AdaptiveEndpointing()
+        controller.on_final_words([(0.0, 0.3), (0.35, 0.6)])
+        controller.on_final_words([(0.8, 1.1)])
+
+        self.assertEqual(len(controller.word_pauses), 2)
+        self.assertAlmostEqual(controller.word_pauses[0], 0.05)
+        self.assertAlmostEqual(controller.word_pauses[1], 0.2)
+
+    def test_pause_between_sentences_is_not_a_word_pause(self):
+        controller = AdaptiveEndpointing()
+        controller.on_speech_started(0.0)
+        controller.on_final_words([(0.0, 0.4), (0.5, 1.0)])
+        controller.on_speech_ended(1.6)
+        controller.on_speech_started(2.8)
+        controller.on_final_words([(2.8, 3.2)])
+
+        self.assertEqual(list(controller.word_pauses), [0.5 - 0.4])
+        self.assertEqual(len(controller.sentence_pauses), 1)
+        self.assertAlmostEqual(controller.sentence_pauses[0], 1.2)
+
+    def test_min_delay_follows_word_gaps_not_final_cadence(self):
+        # Finals arrive every second or so (the STT's own segmentation), but
+        # the speaker's words are only 50-250ms apart
+        controller = AdaptiveEndpointing()
+        gaps = [0.0, 0.05, 0.12, 0.08, 0.25, 0.1]
+        t = 0.0
+        for turn in range(3):
+            controller.on_speech_started(t)
+            for _ in range(4):
+                final = []
+                for gap in gaps[:4]:
+                    t += gap
+                    final.append(("word", t, t + 0.3))
+                    t += 0.3
+                asyncio.run(
+                    _drain(record_word_pauses(_events(_final(*final)), controller))
+                )
+                gaps = gaps[1:] + gaps[:1]
+            controller.on_speech_ended(t)
+            controller.on_turn_committed()
+            t += 2.0
+
+        adjusted = controller.recompute()
+        self.assertIsNotNone(adjusted)
+        min_delay, _ = adjusted
+        self.assertLess(min_delay, 0.4)
+        self.assertGreaterEqual(min_delay, controller.min_delay_bounds[0])
+
+    def test_interim_transcripts_are_ignored(self):
+        controller = AdaptiveEndpointing()
+        interim = _final(("hello", 0.0, 0.3), ("there", 0.9, 1.2))
+        interim.type = stt.SpeechEventType.INTERIM_TRANSCRIPT
+        asyncio.run(_drain(record_word_pauses(_events(interim), controller)))
+
+        self.assertEqual(len(controller.word_pauses), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
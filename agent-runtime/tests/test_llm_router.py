@@ -0,0 +1,46 @@
+import unittest
+
+from livekit.agents import llm
+
+from core.context import SessionContext
+from core.llm_router import TIER_FAST, TIER_STRONG, classify_turn
+from core.prompt import PromptAssembler
+
+
+def _turn_ctx(*messages: tuple) -> llm.ChatContext:
+    chat_ctx = llm.ChatContext()
+    for role, content in messages:
+        chat_ctx.add_message(role=role, content=content)
+    return chat_ctx
+
+
+class ClassifyTurnTest(unittest.TestCase):
+    def test_small_talk_goes_to_fast_tier(self):
+        chat_ctx = _turn_ctx(("assistant", "Done."), ("user", "thanks"))
+        self.assertEqual(classify_turn(chat_ctx), TIER_FAST)
+
+    def test_reasoning_goes_to_strong_tier(self):
+        chat_ctx = _turn_ctx(("user", "why did my order fail"))
+        self.assertEqual(classify_turn(chat_ctx), TIER_STRONG)
+
+    def test_injected_session_state_is_skipped(self):
+        # The order on_user_turn_completed produces: the user's message,
+        # then the session state appended by the prompt assembler
+        chat_ctx = _turn_ctx(("assistant", "Done."), ("user", "thanks"))
+        session_ctx = SessionContext()
+        session_ctx.add_observation("User is looking at the billing page")
+        PromptAssembler().inject_session_state(chat_ctx, session_ctx)
+
+        self.assertEqual(chat_ctx.items[-1].role, "system")
+        self.assertEqual(classify_turn(chat_ctx), TIER_FAST)
+
+    def test_turn_without_user_message_goes_to_strong_tier(self):
+        chat_ctx = _turn_ctx(("user", "ok"))
+        chat_ctx.insert(
+            llm.FunctionCallOutput(call_id="call_1", output="{}", is_error=False)
+        )
+        self.assertEqual(classify_turn(chat_ctx), TIER_STRONG)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import asyncio
+import time
+import unittest
+
+from prometheus_client import REGISTRY
+
+from core.loop_monitor import LoopMonitor
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+class LoopMonitorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_blocking_call_is_exported(self):
+        lag_count = _sample("agent_runtime_event_loop_lag_seconds_count")
+        lag_sum = _sample("agent_runtime_event_loop_lag_seconds_sum")
+        slow = _sample("agent_runtime_event_loop_slow_callbacks_total")
+
+        monitor = LoopMonitor("room", interval=0.01, slow_threshold=0.05)
+        with self.assertLogs("core.loop_monitor", "WARNING") as logs:
+            monitor.start()
+            await asyncio.sleep(0.05)
+            time.sleep(0.1)
+            await asyncio.sleep(0.05)
+            await monitor.aclose()
+
+        self.assertIn("in session room", logs.output[0])
+        self.assertGreater(
+            _sample("agent_runtime_event_loop_lag_seconds_count"), lag_count
+        )
+        self.assertGreaterEqual(
+            _sample("agent_runtime_event_loop_lag_seconds_sum") - lag_sum, 0.05
+        )
+        self.assertEqual(
+            _sample("agent_runtime_event_loop_slow_callbacks_total"), slow + 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+from livekit import rtc
+
+from core.noise_probe import frame_level_dbfs, noise_floor_dbfs
+
+
+def _frame(amplitude: float, seed: int = 0) -> rtc.AudioFrame:
+    rng = np.random.default_rng(seed)
+    samples = (rng.standard_normal(160) * amplitude * 32767).clip(-32768, 32767)
+    return rtc.AudioFrame(
+        data=samples.astype(np.int16).tobytes(),
+        sample_rate=16000,
+        num_channels=1,
+        samples_per_channel=160,
+    )
+
+
+class NoiseProbeTest(unittest.TestCase):
+    def test_speech_over_quiet_room_is_clean(self):
+        # Mostly speech, with the room audible between words
+        levels = [
+            frame_level_dbfs(_frame(0.3 if i % 5 else 0.0003, seed=i))
+            for i in range(100)
+        ]
+        self.assertLess(noise_floor_dbfs(levels), -60)
+
+    def test_street_noise_is_not_clean(self):
+        levels = [frame_level_dbfs(_frame(0.02, seed=i)) for i in range(100)]
+        self.assertGreater(noise_floor_dbfs(levels), -40)
+
+    def test_no_frames_is_unknown(self):
+        self.assertIsNone(noise_floor_dbfs([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
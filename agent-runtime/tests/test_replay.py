@@ -0,0 +1,145 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from livekit import rtc
+from livekit.agents import llm, stt
+from livekit.agents.types import TimedString
+
+from core.recorder import AUDIO_IN, AUDIO_OUT, SessionRecorder, iter_records
+from evals.replay import load_syntheses, load_transcripts, replay
+
+SPEED = 4.0
+
+
+def _silence(sample_rate: int, duration: float) -> rtc.AudioFrame:
+    samples = int(sample_rate * duration)
+    return rtc.AudioFrame(
+        data=bytes(2 * samples),
+        sample_rate=sample_rate,
+        num_channels=1,
+        samples_per_channel=samples,
+    )
+
+
+def _speech_event(event_type: stt.SpeechEventType, *words) -> stt.SpeechEvent:
+    alternatives = []
+    if words:
+        alternatives.append(
+            stt.SpeechData(
+                language="en",
+                text=" ".join(text for text, _, _ in words),
+                start_time=words[0][1],
+                end_time=words[-1][2],
+                words=[TimedString(text, start, end) for text, start, end in words],
+            )
+        )
+    return stt.SpeechEvent(event_type, alternatives=alternatives)
+
+
+def _write_recording(path: str) -> None:
+    """
+    One user turn: 2s of inbound audio, a transcript ending at 1.4s, a reply
+    streamed from 1.6s to 2.1s and 0.4s of synthesized audio.
+    """
+    now = [0.0]
+
+    async def stream(*items):
+        for item in items:
+            yield item
+
+    async def drain(items):
+        return [item async for item in items]
+
+    with mock.patch("core.recorder.time.monotonic", side_effect=lambda: now[0]):
+        recorder = SessionRecorder(path)
+        for i in range(100):
+            now[0] = i * 0.02
+            recorder.audio(AUDIO_IN, _silence(16000, 0.02))
+            if i == 25:
+                events = [_speech_event(stt.SpeechEventType.START_OF_SPEECH)]
+            elif i == 65:
+                events = [
+                    _speech_event(
+                        stt.SpeechEventType.FINAL_TRANSCRIPT,
+                        ("hello", 0.5, 0.8),
+                        ("there", 0.85, 1.2),
+                    )
+                ]
+            elif i == 70:
+                events = [_speech_event(stt.SpeechEventType.END_OF_SPEECH)]
+            else:
+                events = []
+            asyncio.run(drain(recorder.record_stt(stream(*events))))
+
+        chat_ctx = llm.ChatContext()
+        chat_ctx.add_message(role="system", content="Be brief.")
+        chat_ctx.add_message(role="user", content="hello there")
+        now[0] = 1.6
+        recorder.event("llm_request", {"chat_ctx": chat_ctx.to_dict()})
+        now[0] = 1.9
+        recorder.event("llm_chunk", {"text": "Hi, "})
+        now[0] = 1.95
+        recorder.event("tts_text", {"text": "Hi, "})
+        now[0] = 2.0
+        recorder.event("llm_chunk", {"text": "how can I help?"})
+        recorder.event("tts_text", {"text": "how can I help?"})
+        now[0] = 2.1
+        recorder.event("llm_done", {})
+        for i in range(20):
+            now[0] = 2.2 + i * 0.02
+            recorder.audio(AUDIO_OUT, _silence(24000, 0.02))
+        recorder.event("tts_done", {})
+        asyncio.run(recorder.aclose())
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".rec")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        _write_recording(self.path)
+
+    def test_loads_transcripts_with_word_timings(self):
+        events = load_transcripts(iter_records(self.path))
+
+        self.assertEqual(
+            [ev.type for _, ev in events],
+            [
+                stt.SpeechEventType.START_OF_SPEECH,
+                stt.SpeechEventType.FINAL_TRANSCRIPT,
+                stt.SpeechEventType.END_OF_SPEECH,
+            ],
+        )
+        for (timestamp, _), expected in zip(events, (0.5, 1.3, 1.4)):
+            self.assertAlmostEqual(timestamp, expected)
+        words = events[1][1].alternatives[0].words
+        self.assertEqual([str(w) for w in words], ["hello", "there"])
+        self.assertEqual((words[1].start_time, words[1].end_time), (0.85, 1.2))
+
+    def test_loads_syntheses_timed_from_first_text(self):
+        (synthesis,) = load_syntheses(iter_records(self.path))
+
+        self.assertEqual(synthesis.text, "Hi, how can I help?")
+        self.assertEqual(len(synthesis.frames), 20)
+        self.assertAlmostEqual(synthesis.ttfb, 0.25)
+        self.assertEqual(synthesis.frames[0][1:3], (24000, 1))
+
+    def test_replays_voice_session_at_scaled_timing(self):
+        results = asyncio.run(replay(self.path, SPEED))
+
+        (turn,) = results["llm"]
+        self.assertEqual(turn["input"], "hello there")
+        self.assertAlmostEqual(turn["recorded_ttft"], 0.3)
+        self.assertAlmostEqual(turn["recorded_duration"], 0.5)
+        self.assertAlmostEqual(turn["replayed_ttft"], 0.3 / SPEED, delta=0.05)
+        self.assertAlmostEqual(turn["replayed_duration"], 0.5 / SPEED, delta=0.05)
+
+        (synthesis,) = results["tts"]
+        self.assertAlmostEqual(synthesis["replayed_ttfb"], 0.25 / SPEED, delta=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
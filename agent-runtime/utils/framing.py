@@ -0,0 +1,41 @@
+import asyncio
+import struct
+from typing import BinaryIO, Iterator
+
+# Every frame is a 4-byte big-endian length followed by the payload
+HEADER = struct.Struct(">I")
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """Prefix a payload with its length."""
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one length-prefixed frame from a stream.
+
+    Raises:
+        asyncio.IncompleteReadError: If the stream ends mid-frame or before
+            a new frame starts.
+    """
+    header = await reader.readexactly(HEADER.size)
+    (length,) = HEADER.unpack(header)
+    return await reader.readexactly(length)
+
+
+def iter_frames(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Read length-prefixed frames from a file until it ends.
+
+    A truncated trailing frame (e.g. from a crash mid-write) is ignored.
+    """
+    while True:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        (length,) = HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            return
+        yield payload
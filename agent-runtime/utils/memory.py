@@ -0,0 +1,117 @@
+import os
+import sys
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from utils.vad_weights import WEIGHTS_FILENAME
+
+_FIELDS = ("Rss", "Pss", "Shared_Clean", "Private_Clean", "Private_Dirty")
+
+
+def _parse_kb(line: str) -> int:
+    return int(line.split()[1]) * 1024
+
+
+def read_memory(pid: str = "self") -> Dict[str, int]:
+    """
+    Read RSS/PSS figures (bytes) for a process.
+
+    PSS splits shared pages between the processes mapping them, so the gap
+    between RSS and PSS is memory saved by sharing.
+    """
+    usage = dict.fromkeys(_FIELDS, 0)
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key = line.split(":", 1)[0]
+                if key in usage:
+                    usage[key] = _parse_kb(line)
+    except OSError:
+        pass
+    return usage
+
+
+def private_bytes(usage: Dict[str, int]) -> int:
+    return usage["Private_Clean"] + usage["Private_Dirty"]
+
+
+def mapped_file_usage(path_suffix: str, pid: str = "self") -> Dict[str, int]:
+    """Sum RSS/PSS (bytes) of the mappings of files ending in path_suffix."""
+    usage = {"Rss": 0, "Pss": 0}
+    in_mapping = False
+    try:
+        with open(f"/proc/{pid}/smaps") as f:
+            for line in f:
+                key = line.split(":", 1)[0]
+                if "-" in key and " " in line:
+                    # Mapping header: "start-end perms offset dev inode [path]"
+                    in_mapping = line.rstrip().endswith(path_suffix)
+                elif in_mapping and key in usage:
+                    usage[key] += _parse_kb(line)
+    except OSError:
+        pass
+    return usage
+
+
+def _find_processes(match: str) -> List[int]:
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+        except OSError:
+            continue
+        if match in cmdline:
+            pids.append(int(entry))
+    return pids
+
+
+def _mib(value: int) -> str:
+    return f"{value / (1024 * 1024):8.1f}"
+
+
+def print_report(match: str = "main.py", weights_suffix: Optional[str] = None):
+    """
+    Print a per-node memory report for agent runtime processes.
+
+    "Saved" is the part of each process's VAD weight pages that is shared
+    with other processes (RSS - PSS), i.e. what per-process loading would
+    have kept as a private copy.
+    """
+    weights_suffix = weights_suffix or WEIGHTS_FILENAME
+    pids = _find_processes(match)
+    if not pids:
+        print(f"No processes matching '{match}'")
+        return
+
+    print(
+        f"{'PID':>8} {'RSS MiB':>8} {'PSS MiB':>8} {'Priv MiB':>8} "
+        f"{'VAD RSS':>8} {'VAD PSS':>8} {'Saved':>8}"
+    )
+    total_saved = 0
+    for pid in pids:
+        usage = read_memory(str(pid))
+        weights = mapped_file_usage(weights_suffix, str(pid))
+        saved = weights["Rss"] - weights["Pss"]
+        total_saved += saved
+        private = private_bytes(usage)
+        print(
+            f"{pid:>8} {_mib(usage['Rss'])} {_mib(usage['Pss'])} {_mib(private)} "
+            f"{_mib(weights['Rss'])} {_mib(weights['Pss'])} {_mib(saved)}"
+        )
+
+    print(
+        f"\n{len(pids)} processes, VAD weights sharing saved "
+        f"{_mib(total_saved).strip()} MiB in total, "
+        f"{_mib(total_saved // len(pids)).strip()} MiB per process"
+    )
+
+
+if __name__ == "__main__":
+    match = sys.argv[1] if len(sys.argv) > 1 else "main.py"
+    weights_suffix = None
+    if settings.VAD_SHARED_MODEL_DIR:
+        weights_suffix = os.path.join(settings.VAD_SHARED_MODEL_DIR, WEIGHTS_FILENAME)
+    print_report(match, weights_suffix)
@@ -0,0 +1,71 @@
+import importlib.resources
+import os
+import sys
+from typing import Optional
+
+from config.settings import settings
+
+MODEL_FILENAME = "silero_vad.onnx"
+WEIGHTS_FILENAME = "silero_vad.weights"
+
+
+def shared_model_path(model_dir: str) -> Optional[str]:
+    """Return the exported model path if both graph and weights exist."""
+    model_path = os.path.join(model_dir, MODEL_FILENAME)
+    weights_path = os.path.join(model_dir, WEIGHTS_FILENAME)
+    if os.path.isfile(model_path) and os.path.isfile(weights_path):
+        return model_path
+    return None
+
+
+def export_shared_model(model_dir: str) -> str:
+    """
+    Split the bundled Silero model into a graph and an external weights file.
+
+    Requires the optional `onnx` package.
+    """
+    import onnx
+
+    source = (
+        importlib.resources.files("livekit.plugins.silero.resources") / MODEL_FILENAME
+    )
+    with importlib.resources.as_file(source) as path:
+        model = onnx.load(str(path))
+
+    os.makedirs(model_dir, exist_ok=True)
+    model_path = os.path.join(model_dir, MODEL_FILENAME)
+    onnx.save_model(
+        model,
+        model_path,
+        save_as_external_data=True,
+        all_tensors_to_one_file=True,
+        location=WEIGHTS_FILENAME,
+        # Silero keeps its weights in Constant nodes rather than initializers.
+        # Small constants stay inline: shape inference has to read them
+        size_threshold=1024,
+        convert_attribute=True,
+    )
+    return model_path
+
+
+if __name__ == "__main__":
+    model_dir = sys.argv[1] if len(sys.argv) > 1 else settings.VAD_SHARED_MODEL_DIR
+    if not model_dir:
+        print(
+            "Usage: python -m utils.vad_weights <model_dir> (or VAD_SHARED_MODEL_DIR)"
+        )
+        sys.exit(1)
+
+    try:
+        import onnx  # noqa: F401
+    except ImportError:
+        print("Error: the `onnx` package is required. Run `pip install onnx`.")
+        sys.exit(1)
+
+    print(f"Exported shared VAD model to {export_shared_model(model_dir)}")
+
+    # Load it the way job processes do, so an export they cannot use fails here
+    from core.plugins import create_vad
+
+    create_vad(model_dir)
+    print("Loaded the VAD from the shared model")
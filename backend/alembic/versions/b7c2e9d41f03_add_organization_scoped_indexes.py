@@ -0,0 +1,81 @@
+"""add_organization_scoped_indexes
+
+Revision ID: b7c2e9d41f03
+Revises: f433a5cffc1c
+Create Date: 2026-10-19 10:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c2e9d41f03"
+down_revision: Union[str, Sequence[str], None] = "f433a5cffc1c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building
+    # concurrently keeps the tables writable while the indexes are built.
+    # If a build fails it leaves an INVALID index behind: drop it and re-run.
+    with op.get_context().autocommit_block():
+        # get_organization_members
+        op.create_index(
+            "ix_users_organization_id",
+            "users",
+            ["organization_id"],
+            postgresql_concurrently=True,
+        )
+        # list_sessions: newest first within an organization
+        op.create_index(
+            "ix_sessions_organization_id_created_at",
+            "sessions",
+            ["organization_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        # Every agent query filters on organization and active; listing is
+        # newest first
+        op.create_index(
+            "ix_agents_organization_id_created_at_active",
+            "agents",
+            ["organization_id", sa.text("created_at DESC")],
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_session_templates_organization_id_created_at_active",
+            "session_templates",
+            ["organization_id", sa.text("created_at DESC")],
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+        # Version history and single-version lookups; a version number is
+        # only ever written once per agent
+        op.create_index(
+            "ux_agent_versions_agent_id_version",
+            "agent_versions",
+            ["agent_id", "version"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in (
+            ("ux_agent_versions_agent_id_version", "agent_versions"),
+            (
+                "ix_session_templates_organization_id_created_at_active",
+                "session_templates",
+            ),
+            ("ix_agents_organization_id_created_at_active", "agents"),
+            ("ix_sessions_organization_id_created_at", "sessions"),
+            ("ix_users_organization_id", "users"),
+        ):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
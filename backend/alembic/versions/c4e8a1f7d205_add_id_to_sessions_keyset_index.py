@@ -0,0 +1,53 @@
+"""add_id_to_sessions_keyset_index
+
+Revision ID: c4e8a1f7d205
+Revises: b7c2e9d41f03
+Create Date: 2026-10-19 14:36:08.512930
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a1f7d205"
+down_revision: Union[str, Sequence[str], None] = "b7c2e9d41f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # list_sessions pages on (created_at, id); with id in the index the
+    # cursor comparison is an index condition instead of a filter step.
+    # Built before the old index is dropped, so listing always has one.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_sessions_organization_id_created_at_id",
+            "sessions",
+            ["organization_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_sessions_organization_id_created_at",
+            table_name="sessions",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_sessions_organization_id_created_at",
+            "sessions",
+            ["organization_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_sessions_organization_id_created_at_id",
+            table_name="sessions",
+            postgresql_concurrently=True,
+        )
@@ -3,20 +3,22 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etag import org_etag
 from app.core.permissions import require_admin
 from app.core.security import get_current_user
 from app.db.session import get_db
 from app.exceptions.base import NotFoundException
-from app.models.user import User
 from app.schemas.agent import (
     AgentCreate,
     AgentExport,
     AgentImportRequest,
     AgentImportResponse,
+    AgentListItem,
     AgentRead,
     AgentUpdate,
     AgentVersionRead,
 )
+from app.schemas.auth import AuthUser
 from app.services.agent import (
     create_agent,
     delete_agent,
@@ -36,7 +38,7 @@ router = APIRouter()
 @router.post("/", response_model=AgentRead, status_code=status.HTTP_201_CREATED)
 async def create_agent_endpoint(
     data: AgentCreate,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -48,9 +50,9 @@ async def create_agent_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/", response_model=list[AgentRead])
+@router.get("/", response_model=list[AgentListItem])
 async def list_agents_endpoint(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(org_etag("agents")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -61,7 +63,7 @@ async def list_agents_endpoint(
 
 @router.get("/export", response_model=list[AgentExport])
 async def export_agents_endpoint(
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -73,7 +75,7 @@ async def export_agents_endpoint(
 @router.post("/import", response_model=AgentImportResponse)
 async def import_agents_endpoint(
     data: AgentImportRequest,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -88,7 +90,7 @@ async def import_agents_endpoint(
 @router.get("/{agent_id}", response_model=AgentRead)
 async def get_agent_endpoint(
     agent_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(org_etag("agent")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -104,7 +106,7 @@ async def get_agent_endpoint(
 async def update_agent_endpoint(
     agent_id: UUID,
     data: AgentUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -120,7 +122,7 @@ async def update_agent_endpoint(
 @router.delete("/{agent_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_agent_endpoint(
     agent_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -135,7 +137,7 @@ async def delete_agent_endpoint(
 @router.get("/{agent_id}/versions", response_model=list[AgentVersionRead])
 async def list_agent_versions_endpoint(
     agent_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -151,7 +153,7 @@ async def list_agent_versions_endpoint(
 async def get_agent_version_endpoint(
     agent_id: UUID,
     version: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -172,7 +174,7 @@ async def get_agent_version_endpoint(
 )
 async def duplicate_agent_endpoint(
     agent_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
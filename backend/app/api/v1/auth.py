@@ -13,8 +13,14 @@ from app.core.security import (
 from app.db.session import get_db
 from app.exceptions.base import ForbiddenException, UnauthorizedException
 from app.models.user import User
-from app.schemas.auth import GenericMessageSchema, LoginSchema, SignupSchema, UserSchema
-from app.services.auth import authenticate_user, register_user
+from app.schemas.auth import (
+    AuthUser,
+    GenericMessageSchema,
+    LoginSchema,
+    SignupSchema,
+    UserSchema,
+)
+from app.services.auth import authenticate_user, get_user, register_user
 
 router = APIRouter()
 
@@ -121,8 +127,11 @@ async def logout(response: Response):
 
 
 @router.get("/user", response_model=UserSchema)
-async def get_current_user_profile(current_user: User = Depends(get_current_user)):
+async def get_current_user_profile(
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Get current user profile.
     """
-    return current_user
+    return await get_user(db, current_user.id)
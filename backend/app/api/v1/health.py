@@ -3,8 +3,10 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cache.redis import ping as redis_ping
+from app.cache.redis import pool_stats as redis_pool_stats
+from app.core.security import password_hash_stats
 from app.db.session import get_db
-from app.schemas.health import HealthResponse, ReadinessResponse
+from app.schemas.health import HealthResponse, MetricsResponse, ReadinessResponse
 
 router = APIRouter()
 
@@ -50,3 +52,16 @@ async def readiness_check(response: Response, db: AsyncSession = Depends(get_db)
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     return status_data
+
+
+@router.get(
+    "/health/metrics", status_code=status.HTTP_200_OK, response_model=MetricsResponse
+)
+async def metrics():
+    """
+    Resource utilization of this worker process.
+    """
+    return {
+        "redis_pool": redis_pool_stats(),
+        "password_hash": password_hash_stats(),
+    }
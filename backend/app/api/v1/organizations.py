@@ -1,14 +1,17 @@
 from typing import List
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etag import org_etag
 from app.core.permissions import require_admin
-from app.core.security import get_current_user
 from app.db.session import get_db
-from app.models.user import User
+from app.exceptions.base import BadRequestException
+from app.schemas.auth import AuthUser
 from app.schemas.organization import (
     MemberSchema,
+    MemberUpdateSchema,
     OrganizationSchema,
     OrganizationUpdateSchema,
 )
@@ -16,6 +19,7 @@ from app.services.organization import (
     get_organization,
     get_organization_members,
     update_organization,
+    update_organization_member,
 )
 
 router = APIRouter()
@@ -23,7 +27,7 @@ router = APIRouter()
 
 @router.get("/", response_model=OrganizationSchema)
 async def get_current_organization(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(org_etag("organization")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -35,7 +39,7 @@ async def get_current_organization(
 @router.put("/", response_model=OrganizationSchema)
 async def update_current_organization(
     org_in: OrganizationUpdateSchema,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -46,10 +50,31 @@ async def update_current_organization(
 
 @router.get("/members", response_model=List[MemberSchema])
 async def list_organization_members(
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(org_etag("members", require_admin)),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List members of current user's organization (Admin only).
     """
     return await get_organization_members(db, current_user.organization_id)
+
+
+@router.patch("/members/{user_id}", response_model=MemberSchema)
+async def update_member(
+    user_id: UUID,
+    member_in: MemberUpdateSchema,
+    current_user: AuthUser = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Change a member's role or deactivate them (Admin only).
+    """
+    if user_id == current_user.id:
+        raise BadRequestException("You cannot change your own role or status")
+    return await update_organization_member(
+        db,
+        current_user.organization_id,
+        user_id,
+        role=member_in.role,
+        is_active=member_in.is_active,
+    )
@@ -1,6 +1,14 @@
 from fastapi import APIRouter
 
-from app.api.v1 import agents, auth, health, organizations, session_templates, sessions
+from app.api.v1 import (
+    agents,
+    auth,
+    health,
+    organizations,
+    session_templates,
+    sessions,
+    webhooks,
+)
 
 api_router = APIRouter()
 
@@ -14,3 +22,4 @@ api_router.include_router(
     session_templates.router, prefix="/session-templates", tags=["session-templates"]
 )
 api_router.include_router(sessions.router, prefix="/sessions", tags=["sessions"])
+api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
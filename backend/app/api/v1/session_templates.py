@@ -3,13 +3,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.etag import org_etag
 from app.core.permissions import require_admin
-from app.core.security import get_current_user
 from app.db.session import get_db
 from app.exceptions.base import NotFoundException
-from app.models.user import User
+from app.schemas.auth import AuthUser
 from app.schemas.session_template import (
     SessionTemplateCreate,
+    SessionTemplateListItem,
     SessionTemplateRead,
     SessionTemplateUpdate,
 )
@@ -30,7 +31,7 @@ router = APIRouter()
 )
 async def create_session_template_endpoint(
     data: SessionTemplateCreate,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -42,9 +43,9 @@ async def create_session_template_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/", response_model=list[SessionTemplateRead])
+@router.get("/", response_model=list[SessionTemplateListItem])
 async def list_session_templates_endpoint(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(org_etag("session-templates")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -56,7 +57,7 @@ async def list_session_templates_endpoint(
 @router.get("/{template_id}", response_model=SessionTemplateRead)
 async def get_session_template_endpoint(
     template_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(org_etag("session-template")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -72,7 +73,7 @@ async def get_session_template_endpoint(
 async def update_session_template_endpoint(
     template_id: UUID,
     data: SessionTemplateUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -90,7 +91,7 @@ async def update_session_template_endpoint(
 @router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session_template_endpoint(
     template_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -109,7 +110,7 @@ async def delete_session_template_endpoint(
 )
 async def clone_session_template_endpoint(
     template_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -1,18 +1,29 @@
-from typing import List
+import asyncio
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_current_user
+from app.core.config import settings
+from app.core.security import get_current_user, get_streaming_user
 from app.db.session import get_db
-from app.models.user import User
+from app.schemas.auth import AuthUser
 from app.schemas.session import (
+    SessionListResponse,
     SessionStartRequest,
     SessionStartResponse,
     SessionStatusResponse,
 )
 from app.services.session_service import SessionService
+from app.services.session_status import (
+    StatusSubscription,
+    format_sse,
+    is_final,
+    status_hub,
+)
 
 router = APIRouter()
 
@@ -26,7 +37,7 @@ router = APIRouter()
 )
 async def start_session(
     data: SessionStartRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     try:
@@ -47,18 +58,30 @@ async def start_session(
 
 @router.get(
     "/",
-    response_model=List[SessionStatusResponse],
+    response_model=SessionListResponse,
     summary="List sessions",
-    description="List all sessions for the current organization.",
+    description=(
+        "List sessions for the current organization, newest first. Pass "
+        "`next_cursor` from the previous page as `cursor` to get the next one."
+    ),
 )
 async def list_sessions_endpoint(
     limit: int = Query(50, gt=0, le=100),
-    offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    statuses: Optional[List[str]] = Query(None, alias="status"),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    current_user: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     return await SessionService.list_sessions(
-        db=db, organization_id=current_user.organization_id, limit=limit, offset=offset
+        db=db,
+        organization_id=current_user.organization_id,
+        limit=limit,
+        cursor=cursor,
+        statuses=statuses,
+        created_after=created_after,
+        created_before=created_before,
     )
 
 
@@ -70,7 +93,7 @@ async def list_sessions_endpoint(
 )
 async def get_session_endpoint(
     session_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     session = await SessionService.get_session_status(
@@ -81,3 +104,62 @@ async def get_session_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
         )
     return session
+
+
+async def _stream_status(subscription: StatusSubscription, initial: str):
+    try:
+        yield format_sse(initial)
+        if is_final(initial):
+            return
+        while True:
+            try:
+                data = await asyncio.wait_for(
+                    subscription.queue.get(), settings.SSE_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": heartbeat\n\n"
+                continue
+            yield format_sse(data)
+            if is_final(data):
+                return
+    finally:
+        await subscription.aclose()
+
+
+@router.get(
+    "/{session_id}/events",
+    summary="Stream session status",
+    description=(
+        "Server-Sent Events stream of the session's status: the current status "
+        "first, then every change until the session ends."
+    ),
+    response_class=StreamingResponse,
+)
+async def session_events_endpoint(
+    session_id: UUID,
+    current_user: AuthUser = Depends(get_streaming_user),
+    # Function scope releases the connection before streaming starts; the
+    # stream itself only reads from Redis pub/sub
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    # Subscribe before reading the current status so no change is missed
+    subscription = await status_hub.subscribe(session_id)
+    try:
+        session = await SessionService.get_session_status(
+            db=db, session_id=session_id, organization_id=current_user.organization_id
+        )
+    except Exception:
+        await subscription.aclose()
+        raise
+    if not session:
+        await subscription.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
+        )
+
+    return StreamingResponse(
+        _stream_status(subscription, session.model_dump_json()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
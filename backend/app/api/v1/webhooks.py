@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Request, status
+from livekit import api
+
+from app.core.config import settings
+from app.exceptions.base import UnauthorizedException
+from app.schemas.auth import GenericMessageSchema
+from app.services.session_events import enqueue_livekit_event
+
+router = APIRouter()
+
+receiver = api.WebhookReceiver(
+    api.TokenVerifier(settings.LIVEKIT_API_KEY, settings.LIVEKIT_API_SECRET)
+)
+
+
+@router.post(
+    "/livekit",
+    response_model=GenericMessageSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def livekit_webhook(request: Request):
+    """
+    Receive LiveKit room and participant events.
+    The request is signed with the LiveKit API secret; events are only
+    queued here and applied to sessions in batches by the lifecycle consumer.
+    """
+    body = (await request.body()).decode()
+    try:
+        event = receiver.receive(body, request.headers.get("Authorization", ""))
+    except Exception:
+        raise UnauthorizedException("Invalid webhook signature")
+
+    queued = await enqueue_livekit_event(event)
+    return GenericMessageSchema(message="queued" if queued else "ignored")
@@ -0,0 +1,53 @@
+import logging
+import time
+from typing import Optional
+from uuid import UUID
+
+from app.cache.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "org_version"
+
+
+def _key(organization_id: UUID) -> str:
+    return f"{KEY_PREFIX}:{organization_id}"
+
+
+def _initial_version() -> int:
+    # Counters start from the clock so a counter lost with Redis never
+    # restarts at a value an old ETag was built from
+    return time.time_ns() // 1_000_000
+
+
+async def get_org_version(organization_id: UUID) -> Optional[int]:
+    """
+    Current change counter of an organization's dashboard data (agents,
+    session templates, organization and members). None if Redis is
+    unavailable.
+    """
+    redis = get_redis_client()
+    try:
+        await redis.set(_key(organization_id), _initial_version(), nx=True)
+        return int(await redis.get(_key(organization_id)))
+    except Exception as e:
+        logger.warning(f"Reading organization version failed: {e}")
+        return None
+
+
+async def bump_org_version(organization_id: UUID) -> None:
+    """
+    Call after committing a change to the organization's data. If the
+    counter cannot be bumped it is deleted, so the next read starts a new one
+    from the clock; if that fails too, the error propagates rather than
+    leaving clients revalidating against a counter that missed a change.
+    """
+    redis = get_redis_client()
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(_key(organization_id), _initial_version(), nx=True)
+            pipe.incr(_key(organization_id))
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Bumping organization version failed: {e}")
+        await redis.delete(_key(organization_id))
@@ -1,35 +1,75 @@
-import os
-from typing import AsyncGenerator
+import logging
+from typing import AsyncGenerator, Optional
 
-from dotenv import load_dotenv
-from redis.asyncio import Redis, from_url
+from redis.asyncio import BlockingConnectionPool, Redis
 
-load_dotenv()
+from app.core.config import settings
 
-REDIS_URL = os.environ.get("REDIS_URL")
+logger = logging.getLogger(__name__)
 
+_client: Optional[Redis] = None
 
-async def get_redis_client() -> Redis:
-    if not REDIS_URL:
-        raise ValueError("REDIS_URL must be set")
-    return from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
+
+def init_redis() -> Redis:
+    """
+    Create the process-wide Redis client backed by a bounded connection pool.
+    Called from the application lifespan; callers that run outside the app
+    (scripts) get it created lazily by get_redis_client().
+    """
+    global _client
+    if _client is None:
+        if not settings.REDIS_URL:
+            raise ValueError("REDIS_URL must be set")
+        pool = BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            # Seconds to wait for a free connection when the pool is exhausted
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        _client = Redis.from_pool(pool)
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_redis_client() -> Redis:
+    return init_redis()
 
 
 async def get_redis() -> AsyncGenerator[Redis, None]:
-    client = await get_redis_client()
-    try:
-        yield client
-    finally:
-        await client.aclose()
+    # Connections are returned to the shared pool after each command
+    yield get_redis_client()
+
+
+def pool_stats() -> dict[str, int]:
+    """Connection pool utilization of the shared client."""
+    if _client is None:
+        return {"max_connections": settings.REDIS_MAX_CONNECTIONS}
+    pool = _client.connection_pool
+    in_use = len(pool._in_use_connections)
+    idle = len(pool._available_connections)
+    return {
+        "max_connections": pool.max_connections,
+        "in_use": in_use,
+        "idle": idle,
+        "created": in_use + idle,
+    }
 
 
 async def ping() -> bool:
-    client = await get_redis_client()
     try:
-        await client.ping()
+        await get_redis_client().ping()
         return True
     except Exception as e:
-        print(f"Redis Ping Error: {e}")
+        logger.warning(f"Redis Ping Error: {e}")
         return False
-    finally:
-        await client.aclose()
@@ -0,0 +1,45 @@
+from typing import Optional
+from uuid import UUID
+
+from app.cache.tiered import TieredCache
+from app.core.config import settings
+from app.schemas.session_template import SessionTemplateLaunch
+
+_templates: TieredCache[SessionTemplateLaunch] = TieredCache(
+    "session_template",
+    SessionTemplateLaunch,
+    local_ttl=settings.TEMPLATE_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.TEMPLATE_CACHE_REDIS_TTL_SECONDS,
+    max_entries=settings.TEMPLATE_CACHE_MAX_ENTRIES,
+)
+
+
+def _key(organization_id: UUID, template_id: UUID) -> str:
+    # Scoped by organization so a lookup can never cross tenants
+    return f"{organization_id}:{template_id}"
+
+
+async def get_cached_template(
+    organization_id: UUID, template_id: UUID
+) -> Optional[SessionTemplateLaunch]:
+    return await _templates.get(_key(organization_id, template_id))
+
+
+async def template_generation(
+    organization_id: UUID, template_id: UUID
+) -> Optional[str]:
+    """Read before loading the template, and pass to cache_template()."""
+    return await _templates.generation(_key(organization_id, template_id))
+
+
+async def cache_template(
+    template: SessionTemplateLaunch, generation: Optional[str]
+) -> None:
+    await _templates.set(
+        _key(template.organization_id, template.id), template, generation
+    )
+
+
+async def invalidate_template(organization_id: UUID, template_id: UUID) -> None:
+    """Drop a template after it was updated or deleted."""
+    await _templates.invalidate(_key(organization_id, template_id))
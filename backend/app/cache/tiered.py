@@ -0,0 +1,117 @@
+import logging
+from typing import Generic, Hashable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.cache.local import TTLCache
+from app.cache.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Write the value only if the key's generation is still the one the caller
+# read before loading it from the database
+_SET_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+class TieredCache(Generic[M]):
+    """
+    Two-level cache for pydantic models: an in-process TTL-LRU in front of
+    Redis. Redis errors are logged and treated as misses, so callers always
+    fall back to the database.
+
+    Invalidation removes the Redis entry and this process's local copy;
+    other processes keep theirs for at most `local_ttl` seconds. It also
+    bumps the key's generation. A caller that reads `generation()` before
+    loading from the database and passes it to `set()` therefore cannot
+    write back a value loaded before the invalidation.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        model: Type[M],
+        *,
+        local_ttl: float,
+        redis_ttl: int,
+        max_entries: int,
+    ):
+        self._prefix = prefix
+        self._model = model
+        self._redis_ttl = redis_ttl
+        self._local: TTLCache[M] = TTLCache(max_entries=max_entries, ttl=local_ttl)
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self._prefix}:{key}"
+
+    def _generation_key(self, key: Hashable) -> str:
+        return f"{self._prefix}:gen:{key}"
+
+    async def get(self, key: Hashable) -> Optional[M]:
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            data = await get_redis_client().get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self._key(key)}: {e}")
+            return None
+        if data is None:
+            return None
+
+        value = self._model.model_validate_json(data)
+        self._local.set(key, value)
+        return value
+
+    async def generation(self, key: Hashable) -> Optional[str]:
+        """
+        Read before loading the value from the database. None if Redis is
+        unavailable.
+        """
+        try:
+            return await get_redis_client().get(self._generation_key(key)) or "0"
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self._generation_key(key)}: {e}")
+            return None
+
+    async def set(self, key: Hashable, value: M, generation: Optional[str]) -> None:
+        """
+        Cache a value loaded from the database after reading `generation`.
+        Skipped if the key was invalidated in between.
+        """
+        if generation is None:
+            # Redis is unavailable: a local copy is stale for at most local_ttl
+            self._local.set(key, value)
+            return
+
+        try:
+            set_if_generation = get_redis_client().register_script(_SET_IF_GENERATION)
+            written = await set_if_generation(
+                keys=[self._key(key), self._generation_key(key)],
+                args=[generation, value.model_dump_json(), self._redis_ttl],
+            )
+        except Exception as e:
+            logger.warning(f"Cache write failed for {self._key(key)}: {e}")
+            return
+        if written:
+            self._local.set(key, value)
+
+    async def invalidate(self, key: Hashable) -> None:
+        self._local.delete(key)
+        try:
+            async with get_redis_client().pipeline(transaction=True) as pipe:
+                pipe.incr(self._generation_key(key))
+                # Only has to outlive reads in flight
+                pipe.expire(self._generation_key(key), self._redis_ttl)
+                pipe.delete(self._key(key))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {self._key(key)}: {e}")
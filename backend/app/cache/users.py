@@ -0,0 +1,40 @@
+from typing import Optional
+from uuid import UUID
+
+from app.cache.tiered import TieredCache
+from app.core.config import settings
+from app.schemas.auth import AuthUser
+
+_users: TieredCache[AuthUser] = TieredCache(
+    "auth_user",
+    AuthUser,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+)
+
+
+async def get_cached_user(user_id: UUID) -> Optional[AuthUser]:
+    """
+    Look the user up in the in-process cache, then in Redis.
+    Returns None on a miss or if Redis is unavailable.
+    """
+    return await _users.get(user_id)
+
+
+async def user_generation(user_id: UUID) -> Optional[str]:
+    """Read before loading the user, and pass to cache_user()."""
+    return await _users.generation(user_id)
+
+
+async def cache_user(user: AuthUser, generation: Optional[str]) -> None:
+    await _users.set(user.id, user, generation)
+
+
+async def invalidate_user(user_id: UUID) -> None:
+    """
+    Drop a user from the cache after their role or active flag changed.
+    Other processes keep their local copy for at most
+    USER_CACHE_LOCAL_TTL_SECONDS.
+    """
+    await _users.invalidate(user_id)
@@ -14,6 +14,11 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5.0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
 
     # LiveKit
     LIVEKIT_URL: str
@@ -21,6 +26,19 @@ class Settings(BaseSettings):
     LIVEKIT_API_SECRET: str
     LIVEKIT_TOKEN_TTL_SECONDS: int = 3600
 
+    # LiveKit webhooks (queued in a Redis stream, applied to sessions in batches)
+    WEBHOOK_CONSUMER_ENABLED: bool = True
+    WEBHOOK_STREAM: str = "livekit:webhook_events"
+    WEBHOOK_STREAM_MAXLEN: int = 100000
+    WEBHOOK_BATCH_SIZE: int = 500
+    WEBHOOK_BLOCK_MS: int = 1000
+    WEBHOOK_CLAIM_IDLE_SECONDS: int = 60
+    WEBHOOK_DEDUP_TTL_SECONDS: int = 86400
+
+    # Session status streaming (SSE)
+    SSE_HEARTBEAT_SECONDS: float = 15.0
+    SSE_QUEUE_SIZE: int = 8
+
     # Security
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
     JWT_SECRET_KEY: str
@@ -30,6 +48,21 @@ class Settings(BaseSettings):
     COOKIE_DOMAIN: str = "localhost"
     COOKIE_SECURE: bool = False
 
+    # Password hashing (bcrypt runs in a bounded thread pool; requests beyond
+    # PASSWORD_HASH_MAX_PENDING get a 503)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Authenticated-user cache (in-process LRU in front of Redis)
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 10
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # Session template cache used by session start
+    TEMPLATE_CACHE_LOCAL_TTL_SECONDS: int = 10
+    TEMPLATE_CACHE_REDIS_TTL_SECONDS: int = 600
+    TEMPLATE_CACHE_MAX_ENTRIES: int = 1000
+
     @validator("CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
         if isinstance(v, str) and not v.startswith("["):
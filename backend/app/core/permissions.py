@@ -4,7 +4,7 @@ from fastapi import Depends
 
 from app.core.security import get_current_user
 from app.exceptions.base import ForbiddenException
-from app.models.user import User
+from app.schemas.auth import AuthUser
 
 
 def require_role(required_role: str) -> Callable:
@@ -13,7 +13,9 @@ def require_role(required_role: str) -> Callable:
     Roles: admin > member
     """
 
-    async def check_role(current_user: User = Depends(get_current_user)) -> User:
+    async def check_role(
+        current_user: AuthUser = Depends(get_current_user),
+    ) -> AuthUser:
         if current_user.role == "admin":
             return current_user  # Admin has access to everything
 
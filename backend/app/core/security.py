@@ -1,5 +1,8 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Union
+from uuid import UUID
 
 import jwt
 from fastapi import Depends, Request, Response
@@ -7,10 +10,16 @@ from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.users import cache_user, get_cached_user, user_generation
 from app.core.config import settings
 from app.db.session import get_db
-from app.exceptions.base import ForbiddenException, UnauthorizedException
+from app.exceptions.base import (
+    ForbiddenException,
+    ServiceUnavailableException,
+    UnauthorizedException,
+)
 from app.models.user import User
+from app.schemas.auth import AuthUser
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -23,6 +32,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# bcrypt is CPU-bound and takes tens to hundreds of milliseconds, so request
+# handlers run it here instead of on the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+# Hash calls queued or running in the executor
+_hash_pending = 0
+_hash_rejected = 0
+
+
+async def _run_password_hash(func, *args):
+    global _hash_pending, _hash_rejected
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        _hash_rejected += 1
+        raise ServiceUnavailableException(
+            "Too many authentication requests, please retry shortly"
+        )
+
+    _hash_pending += 1
+    loop = asyncio.get_running_loop()
+    future = _hash_executor.submit(func, *args)
+    # Release the slot when the hash is done, not when the caller stops
+    # waiting: a cancelled request leaves its hash running in the pool
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(_release_hash_slot))
+    return await asyncio.wrap_future(future)
+
+
+def _release_hash_slot() -> None:
+    global _hash_pending
+    _hash_pending -= 1
+
+
+async def ahash_password(password: str) -> str:
+    return await _run_password_hash(hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_hash(verify_password, plain_password, hashed_password)
+
+
+def password_hash_stats() -> dict[str, int]:
+    """Queue depth of the password hashing pool in this worker process."""
+    workers = settings.PASSWORD_HASH_WORKERS
+    return {
+        "workers": workers,
+        "in_flight": min(_hash_pending, workers),
+        "queued": max(0, _hash_pending - workers),
+        "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+        "rejected": _hash_rejected,
+    }
+
+
 def create_access_token(
     data: dict[str, Any], expires_delta: Union[timedelta, None] = None
 ) -> str:
@@ -91,28 +152,50 @@ def clear_auth_cookies(response: Response) -> None:
     )
 
 
-async def get_current_user(
-    request: Request, db: AsyncSession = Depends(get_db)
-) -> User:
+async def _authenticate(request: Request, db: AsyncSession) -> AuthUser:
     token = request.cookies.get("access_token")
     if not token:
         raise UnauthorizedException("Not authenticated")
 
     try:
         payload = decode_token(token)
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise UnauthorizedException("Invalid token")
+        user_id = UUID(payload.get("sub"))
     except Exception:
         raise UnauthorizedException("Invalid token")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise UnauthorizedException("User not found")
+    user = await get_cached_user(user_id)
+    if user is None:
+        generation = await user_generation(user_id)
+        result = await db.execute(
+            select(User.id, User.organization_id, User.role, User.is_active).where(
+                User.id == user_id
+            )
+        )
+        row = result.one_or_none()
+        if not row:
+            raise UnauthorizedException("User not found")
+        user = AuthUser.model_validate(row)
+        await cache_user(user, generation)
 
     if not user.is_active:
         raise ForbiddenException("Inactive user")
 
     return user
+
+
+async def get_current_user(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> AuthUser:
+    return await _authenticate(request, db)
+
+
+async def get_streaming_user(
+    request: Request, db: AsyncSession = Depends(get_db, scope="function")
+) -> AuthUser:
+    """
+    get_current_user for endpoints that return a long-lived streaming
+    response. Its database session is closed when the endpoint returns, before
+    the stream starts, instead of when the response ends. Pair it with
+    Depends(get_db, scope="function") so the endpoint shares that session.
+    """
+    return await _authenticate(request, db)
@@ -10,11 +10,13 @@ class AppException(Exception):
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         code: str = "internal_error",
         details: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         self.message = message
         self.status_code = status_code
         self.code = code
         self.details = details or {}
+        self.headers = headers
         super().__init__(self.message)
 
 
@@ -70,3 +72,19 @@ class UnauthorizedException(AppException):
             code="unauthorized",
             details=details,
         )
+
+
+class ServiceUnavailableException(AppException):
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        retry_after: int = 1,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            message=message,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            code="service_unavailable",
+            details=details,
+            headers={"Retry-After": str(retry_after)},
+        )
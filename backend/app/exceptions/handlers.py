@@ -20,6 +20,7 @@ async def app_exception_handler(request: Request, exc: AppException):
                 "details": exc.details,
             }
         },
+        headers=exc.headers,
     )
 
 
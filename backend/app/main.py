@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 
 from app.api.v1.router import api_router
+from app.cache.redis import close_redis, init_redis
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.session import engine
@@ -15,6 +16,8 @@ from app.exceptions.handlers import (
 )
 from app.middleware.cors import setup_cors
 from app.middleware.request_id import RequestIDMiddleware
+from app.services.session_events import SessionEventConsumer
+from app.services.session_status import status_hub
 
 
 @asynccontextmanager
@@ -26,12 +29,23 @@ async def lifespan(app: FastAPI):
     setup_logging()
 
     # Database engine is initialized at module level in app.db.session
+    # Shared Redis client; connections are opened lazily by its pool
+    init_redis()
+    status_hub.start()
+
+    session_events = None
+    if settings.WEBHOOK_CONSUMER_ENABLED:
+        session_events = SessionEventConsumer()
+        session_events.start()
 
     yield
 
     # Shutdown logic here
+    if session_events:
+        await session_events.aclose()
+    await status_hub.aclose()
     await engine.dispose()
-    # If using a global Redis client, close it here. Currently Redis is per-dependency.
+    await close_redis()
 
 
 def create_app() -> FastAPI:
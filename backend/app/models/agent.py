@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -74,3 +75,12 @@ class Agent(Base):
         cascade="all, delete-orphan",
         order_by="desc(AgentVersion.version)",
     )
+
+
+# All agent queries are scoped to an organization's active agents
+Index(
+    "ix_agents_organization_id_created_at_active",
+    Agent.organization_id,
+    Agent.created_at.desc(),
+    postgresql_where=Agent.is_active,
+)
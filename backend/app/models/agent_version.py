@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, Uuid, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -23,3 +23,11 @@ class AgentVersion(Base):
 
     # Relationships
     agent = relationship("Agent", back_populates="versions")
+
+
+Index(
+    "ux_agent_versions_agent_id_version",
+    AgentVersion.agent_id,
+    AgentVersion.version,
+    unique=True,
+)
@@ -23,3 +23,4 @@ class ModalityProfile(str, Enum):
     AUDIO_CAMERA = "audio_camera"
     AUDIO_SCREENSHARE = "audio_screenshare"
     AUDIO_CAMERA_SCREENSHARE = "audio_camera_screenshare"
+    TEXT_CHAT = "text_chat"
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -43,3 +43,12 @@ class Session(Base):
 
     organization = relationship("Organization", back_populates="sessions")
     session_template = relationship("SessionTemplate")
+
+
+# Organization session listing, newest first, paged on (created_at, id)
+Index(
+    "ix_sessions_organization_id_created_at_id",
+    Session.organization_id,
+    Session.created_at.desc(),
+    Session.id.desc(),
+)
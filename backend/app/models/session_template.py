@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -62,3 +62,12 @@ class SessionTemplate(Base):
 
     # Relationship
     organization = relationship("Organization", back_populates="session_templates")
+
+
+# All template queries are scoped to an organization's active templates
+Index(
+    "ix_session_templates_organization_id_created_at_active",
+    SessionTemplate.organization_id,
+    SessionTemplate.created_at.desc(),
+    postgresql_where=SessionTemplate.is_active,
+)
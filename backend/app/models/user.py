@@ -16,7 +16,7 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     full_name: Mapped[str] = mapped_column(String, nullable=True)
     organization_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("organizations.id"), nullable=False
+        ForeignKey("organizations.id"), nullable=False, index=True
     )
     role: Mapped[str] = mapped_column(String, default="member")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
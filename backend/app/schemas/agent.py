@@ -74,6 +74,21 @@ class AgentRead(TimestampSchema):
     is_active: bool
 
 
+class AgentListItem(TimestampSchema):
+    """An agent in a list. Load the agent by id for its instructions."""
+
+    id: UUID
+    organization_id: UUID
+    name: str
+    model: str
+    voice: Optional[str] = None
+    handoff_targets: List[UUID]
+    tools: List[str]
+    modality: AgentModality
+    panels: List[str]
+    is_active: bool
+
+
 class AgentVersionRead(TimestampSchema):
     id: UUID
     agent_id: UUID
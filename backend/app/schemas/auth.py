@@ -33,5 +33,19 @@ class UserSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AuthUser(BaseModel):
+    """
+    The fields of the authenticated user needed for authorization. Cached
+    per user so most requests need no users table lookup.
+    """
+
+    id: UUID
+    organization_id: UUID
+    role: str
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class GenericMessageSchema(BaseModel):
     message: str
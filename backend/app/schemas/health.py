@@ -10,3 +10,23 @@ class HealthResponse(BaseSchema):
 class ReadinessResponse(HealthResponse):
     database: Optional[str] = "unknown"
     redis: Optional[str] = "unknown"
+
+
+class RedisPoolMetrics(BaseSchema):
+    max_connections: int
+    in_use: int = 0
+    idle: int = 0
+    created: int = 0
+
+
+class PasswordHashMetrics(BaseSchema):
+    workers: int
+    in_flight: int
+    queued: int
+    max_pending: int
+    rejected: int
+
+
+class MetricsResponse(BaseSchema):
+    redis_pool: RedisPoolMetrics
+    password_hash: PasswordHashMetrics
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr
@@ -27,3 +27,8 @@ class MemberSchema(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class MemberUpdateSchema(BaseModel):
+    role: Optional[Literal["admin", "member"]] = None
+    is_active: Optional[bool] = None
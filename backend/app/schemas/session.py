@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from app.schemas.base import BaseSchema
@@ -24,3 +24,11 @@ class SessionStatusResponse(BaseSchema):
     status: str
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
+
+
+class SessionListResponse(BaseSchema):
+    items: List[SessionStatusResponse]
+    # Opaque cursor for the next (older) page; None on the last page
+    next_cursor: Optional[str] = None
+    # Planner estimate of all matching sessions, only on the first page
+    estimated_total: Optional[int] = None
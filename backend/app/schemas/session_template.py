@@ -95,3 +95,31 @@ class SessionTemplateRead(SessionTemplateBase, TimestampSchema):
     id: UUID
     organization_id: UUID
     is_active: bool
+
+
+class SessionTemplateListItem(TimestampSchema):
+    """A template in a list. Load the template by id for its description."""
+
+    id: UUID
+    organization_id: UUID
+    name: str
+    agent_ids: List[UUID]
+    initial_agent_id: Optional[UUID] = None
+    modality_profile: ModalityProfile
+    enabled_panels: List[str]
+    max_duration_seconds: Optional[int] = None
+    idle_timeout_seconds: int
+    is_active: bool
+
+
+class SessionTemplateLaunch(BaseSchema):
+    """
+    The fields of a template needed to start a session. Cached per template
+    so session start does not have to select the template row.
+    """
+
+    id: UUID
+    organization_id: UUID
+    modality_profile: str
+    enabled_panels: List[str]
+    max_duration_seconds: Optional[int] = None
@@ -1,12 +1,13 @@
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import Select, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.org_versions import bump_org_version
 from app.exceptions.base import NotFoundException
 from app.models.agent import Agent
 from app.models.agent_version import AgentVersion
-from app.schemas.agent import AgentCreate, AgentExport, AgentUpdate
+from app.schemas.agent import AgentCreate, AgentExport, AgentListItem, AgentUpdate
 
 
 async def validate_handoff_targets(
@@ -64,6 +65,7 @@ async def create_agent(
     db.add(agent)
     await db.commit()
     await db.refresh(agent)
+    await bump_org_version(organization_id)
     return agent
 
 
@@ -80,17 +82,42 @@ async def get_agent(db: AsyncSession, agent_id: UUID, organization_id: UUID) ->
     return agent
 
 
-async def list_agents(db: AsyncSession, organization_id: UUID) -> list[Agent]:
-    query = (
-        select(Agent)
+# Every column except instructions, which is unbounded and only shown on the
+# agent's own page
+_LIST_COLUMNS = (
+    Agent.id,
+    Agent.organization_id,
+    Agent.name,
+    Agent.model,
+    Agent.voice,
+    Agent.handoff_targets,
+    Agent.tools,
+    Agent.modality,
+    Agent.panels,
+    Agent.is_active,
+    Agent.created_at,
+    Agent.updated_at,
+)
+
+
+def agent_list_query(organization_id: UUID) -> Select:
+    """
+    The agents listing query: active agents, newest first, to match
+    ix_agents_organization_id_created_at_active.
+    """
+    return (
+        select(*_LIST_COLUMNS)
         .where(
             Agent.organization_id == organization_id,
             Agent.is_active == True,  # noqa: E712
         )
         .order_by(desc(Agent.created_at))
     )
-    result = await db.execute(query)
-    return list(result.scalars().all())
+
+
+async def list_agents(db: AsyncSession, organization_id: UUID) -> list[AgentListItem]:
+    result = await db.execute(agent_list_query(organization_id))
+    return [AgentListItem.model_validate(row) for row in result]
 
 
 async def update_agent(
@@ -146,6 +173,7 @@ async def update_agent(
 
     await db.commit()
     await db.refresh(agent)
+    await bump_org_version(organization_id)
     return agent
 
 
@@ -153,6 +181,7 @@ async def delete_agent(db: AsyncSession, agent_id: UUID, organization_id: UUID)
     agent = await get_agent(db, agent_id, organization_id)
     agent.is_active = False
     await db.commit()
+    await bump_org_version(organization_id)
 
 
 async def list_agent_versions(
@@ -206,6 +235,7 @@ async def duplicate_agent(
     db.add(new_agent)
     await db.commit()
     await db.refresh(new_agent)
+    await bump_org_version(organization_id)
     return new_agent
 
 
@@ -257,5 +287,6 @@ async def import_agents(
         await db.commit()
         for agent in created_agents:
             await db.refresh(agent)
+        await bump_org_version(organization_id)
 
     return len(created_agents), skipped_count, created_agents
@@ -1,8 +1,14 @@
+from uuid import UUID
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password, verify_password
-from app.exceptions.base import BadRequestException, ForbiddenException
+from app.core.security import ahash_password, averify_password
+from app.exceptions.base import (
+    BadRequestException,
+    ForbiddenException,
+    UnauthorizedException,
+)
 from app.models.organization import Organization
 from app.models.user import User
 
@@ -14,6 +20,10 @@ async def register_user(
     organization_name: str,
     full_name: str | None = None,
 ) -> User:
+    # Hash before touching the database, so the connection is not held while
+    # the hash waits for the thread pool
+    hashed_pwd = await ahash_password(password)
+
     # Check for existing user
     result = await db.execute(select(User).where(User.email == email))
     existing_user = result.scalar_one_or_none()
@@ -26,7 +36,6 @@ async def register_user(
     await db.flush()  # flush to get org.id
 
     # Create user
-    hashed_pwd = hash_password(password)
     user = User(
         email=email,
         hashed_password=hashed_pwd,
@@ -49,10 +58,22 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> User
     if not user:
         raise BadRequestException("Invalid credentials")
 
-    if not verify_password(password, user.hashed_password):
+    # End the read transaction so the connection goes back to the pool while
+    # the password is verified
+    await db.commit()
+
+    if not await averify_password(password, user.hashed_password):
         raise BadRequestException("Invalid credentials")
 
     if not user.is_active:
         raise ForbiddenException("Account is disabled")
 
     return user
+
+
+async def get_user(db: AsyncSession, user_id: UUID) -> User:
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    if not user:
+        raise UnauthorizedException("User not found")
+    return user
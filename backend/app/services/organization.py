@@ -1,8 +1,11 @@
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.org_versions import bump_org_version
+from app.cache.users import invalidate_user
 from app.exceptions.base import NotFoundException
 from app.models.organization import Organization
 from app.models.user import User
@@ -23,6 +26,7 @@ async def update_organization(
     org.name = name
     await db.commit()
     await db.refresh(org)
+    await bump_org_version(org_id)
     return org
 
 
@@ -32,3 +36,30 @@ async def get_organization_members(db: AsyncSession, org_id: UUID) -> list[User]
 
     result = await db.execute(select(User).where(User.organization_id == org_id))
     return list(result.scalars().all())
+
+
+async def update_organization_member(
+    db: AsyncSession,
+    org_id: UUID,
+    user_id: UUID,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> User:
+    result = await db.execute(
+        select(User).where(User.id == user_id, User.organization_id == org_id)
+    )
+    user = result.scalar_one_or_none()
+    if not user:
+        raise NotFoundException("Member not found")
+
+    if role is not None:
+        user.role = role
+    if is_active is not None:
+        user.is_active = is_active
+    await db.commit()
+    await db.refresh(user)
+
+    # Role and active flag are served from the auth cache
+    await invalidate_user(user.id)
+    await bump_org_version(org_id)
+    return user
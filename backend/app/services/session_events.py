@@ -0,0 +1,253 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from livekit import api
+from sqlalchemy import DateTime, bindparam, case, func, select, update
+
+from app.cache.redis import get_redis_client
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.session import Session
+from app.schemas.session import SessionStatusResponse
+from app.services.session_status import publish_session_statuses
+
+logger = logging.getLogger(__name__)
+
+CONSUMER_GROUP = "session-lifecycle"
+DEDUP_PREFIX = "livekit_webhook"
+
+
+def _is_session_start(event: api.WebhookEvent) -> bool:
+    # The session starts when the end user joins, not when the room is
+    # created or the agent joins
+    return (
+        event.event == "participant_joined"
+        and event.participant.kind != api.ParticipantInfo.Kind.AGENT
+    )
+
+
+# Marks the event as seen and queues it in one step, so an event is only
+# marked once it is queued and a retried delivery after a failure is not
+# dropped as a duplicate
+_ENQUEUE_ONCE = """
+if not redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+local reply = redis.pcall('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*',
+    'kind', ARGV[3], 'room', ARGV[4], 'at', ARGV[5])
+if type(reply) == 'table' and reply.err then
+    redis.call('DEL', KEYS[1])
+    return reply
+end
+return 1
+"""
+
+
+async def enqueue_livekit_event(event: api.WebhookEvent) -> bool:
+    """
+    Queue a verified webhook event for the lifecycle consumer.
+    Returns False for events that are irrelevant or were already received
+    (LiveKit retries deliveries, so the same event id can arrive twice).
+    """
+    if _is_session_start(event):
+        kind = "started"
+    elif event.event == "room_finished":
+        kind = "ended"
+    else:
+        return False
+
+    enqueue = get_redis_client().register_script(_ENQUEUE_ONCE)
+    queued = await enqueue(
+        keys=[f"{DEDUP_PREFIX}:{event.id}", settings.WEBHOOK_STREAM],
+        args=[
+            settings.WEBHOOK_DEDUP_TTL_SECONDS,
+            settings.WEBHOOK_STREAM_MAXLEN,
+            kind,
+            event.room.name,
+            str(event.created_at or int(time.time())),
+        ],
+    )
+    return bool(queued)
+
+
+@dataclass
+class RoomLifecycle:
+    """The net effect of a batch of events on one session."""
+
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+
+
+def collapse_events(
+    entries: List[Tuple[str, Dict[str, str]]],
+) -> Dict[str, RoomLifecycle]:
+    """Reduce a batch of stream entries to one update per room."""
+    rooms: Dict[str, RoomLifecycle] = {}
+    for _, fields in entries:
+        room = rooms.setdefault(fields["room"], RoomLifecycle())
+        at = datetime.fromtimestamp(int(fields["at"]), tz=timezone.utc)
+        if fields["kind"] == "started":
+            room.started_at = min(room.started_at or at, at)
+        elif fields["kind"] == "ended":
+            room.ended_at = max(room.ended_at or at, at)
+    return rooms
+
+
+# Both statements run as one executemany per batch. COALESCE keeps the first
+# recorded time, so re-applying a batch after a crash changes nothing, and a
+# late start event cannot reopen an ended session.
+_sessions = Session.__table__
+_mark_started = (
+    update(_sessions)
+    .where(_sessions.c.room_name == bindparam("b_room"))
+    .values(
+        started_at=func.coalesce(
+            _sessions.c.started_at, bindparam("b_at", type_=DateTime(timezone=True))
+        ),
+        status=case(
+            (_sessions.c.status == "created", "active"), else_=_sessions.c.status
+        ),
+    )
+)
+_mark_ended = (
+    update(_sessions)
+    .where(_sessions.c.room_name == bindparam("b_room"))
+    .values(
+        started_at=func.coalesce(
+            _sessions.c.started_at,
+            bindparam("b_started_at", type_=DateTime(timezone=True)),
+        ),
+        ended_at=func.coalesce(
+            _sessions.c.ended_at, bindparam("b_at", type_=DateTime(timezone=True))
+        ),
+        status="ended",
+    )
+)
+
+
+async def apply_lifecycle_updates(
+    rooms: Dict[str, RoomLifecycle],
+) -> List[SessionStatusResponse]:
+    """Apply a collapsed batch and return the resulting session statuses."""
+    started = [
+        {"b_room": room, "b_at": state.started_at}
+        for room, state in rooms.items()
+        if state.started_at and not state.ended_at
+    ]
+    ended = [
+        {"b_room": room, "b_at": state.ended_at, "b_started_at": state.started_at}
+        for room, state in rooms.items()
+        if state.ended_at
+    ]
+    async with AsyncSessionLocal() as db:
+        if started:
+            await db.execute(_mark_started, started)
+        if ended:
+            await db.execute(_mark_ended, ended)
+        await db.commit()
+
+        result = await db.execute(
+            select(
+                Session.id,
+                Session.room_name,
+                Session.status,
+                Session.started_at,
+                Session.ended_at,
+            ).where(Session.room_name.in_(list(rooms)))
+        )
+        return [SessionStatusResponse.model_validate(row) for row in result]
+
+
+class SessionEventConsumer:
+    """
+    Applies queued LiveKit webhook events to session rows in batches.
+
+    Every API worker runs one consumer in the same Redis consumer group, so
+    the stream is shared between them. Entries are acknowledged only after
+    their batch is committed; entries left pending by a crashed worker are
+    claimed by another one after WEBHOOK_CLAIM_IDLE_SECONDS.
+    """
+
+    def __init__(self):
+        self._name = f"{socket.gethostname()}-{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        redis = get_redis_client()
+        stream = settings.WEBHOOK_STREAM
+        group_ready = False
+        last_claim = 0.0
+        while True:
+            try:
+                if not group_ready:
+                    await self._create_group()
+                    group_ready = True
+
+                entries: List[Tuple[str, Dict[str, str]]] = []
+                if time.monotonic() - last_claim > settings.WEBHOOK_CLAIM_IDLE_SECONDS:
+                    last_claim = time.monotonic()
+                    _, claimed, _ = await redis.xautoclaim(
+                        stream,
+                        CONSUMER_GROUP,
+                        self._name,
+                        min_idle_time=settings.WEBHOOK_CLAIM_IDLE_SECONDS * 1000,
+                        count=settings.WEBHOOK_BATCH_SIZE,
+                    )
+                    # Entries trimmed from the stream come back without fields
+                    entries = [entry for entry in claimed if entry[1]]
+                if not entries:
+                    response = await redis.xreadgroup(
+                        CONSUMER_GROUP,
+                        self._name,
+                        {stream: ">"},
+                        count=settings.WEBHOOK_BATCH_SIZE,
+                        block=settings.WEBHOOK_BLOCK_MS,
+                    )
+                    entries = response[0][1] if response else []
+                if entries:
+                    await self._process(entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Session event consumer failed: {e}")
+                await asyncio.sleep(1)
+
+    async def _create_group(self) -> None:
+        try:
+            await get_redis_client().xgroup_create(
+                settings.WEBHOOK_STREAM, CONSUMER_GROUP, id="0", mkstream=True
+            )
+        except Exception as e:
+            # BUSYGROUP: another worker created it first
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _process(self, entries: List[Tuple[str, Dict[str, str]]]) -> None:
+        rooms = collapse_events(entries)
+        statuses = await apply_lifecycle_updates(rooms)
+        await get_redis_client().xack(
+            settings.WEBHOOK_STREAM,
+            CONSUMER_GROUP,
+            *[entry_id for entry_id, _ in entries],
+        )
+        await publish_session_statuses(statuses)
+        logger.debug(f"Applied {len(entries)} webhook events to {len(rooms)} sessions")
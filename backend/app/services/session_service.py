@@ -1,17 +1,96 @@
+import base64
 import json
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from app.core.config import settings
+from app.exceptions.base import BadRequestException
 from app.models.session import Session
-from app.models.session_template import SessionTemplate
-from app.schemas.session import SessionStartResponse, SessionStatusResponse
+from app.schemas.session import (
+    SessionListResponse,
+    SessionStartResponse,
+    SessionStatusResponse,
+)
 from app.services.livekit_token_service import generate_access_token
 from app.services.room_name_generator import generate_room_name
+from app.services.session_template import get_session_template_for_launch
+
+
+def encode_cursor(created_at: datetime, session_id: UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(session_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(session_id)
+    except (ValueError, TypeError):
+        raise BadRequestException("Invalid cursor")
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+async def estimate_row_count(db: AsyncSession, stmt: Select) -> int:
+    """
+    Row count estimate from the query planner's statistics, which costs a
+    planning pass instead of the full scan COUNT(*) needs.
+    """
+    result = await db.execute(Explain(stmt))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def session_list_filters(
+    organization_id: UUID,
+    statuses: Optional[List[str]] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> list:
+    filters = [Session.organization_id == organization_id]
+    if statuses:
+        filters.append(Session.status.in_(statuses))
+    if created_after:
+        filters.append(Session.created_at >= created_after)
+    if created_before:
+        filters.append(Session.created_at < created_before)
+    return filters
+
+
+def session_page_query(
+    filters: list,
+    limit: int,
+    after: Optional[tuple[datetime, UUID]] = None,
+) -> Select:
+    """
+    The sessions listing query: newest first, keyed on (created_at, id) to
+    match ix_sessions_organization_id_created_at_id.
+    """
+    stmt = select(Session).where(*filters)
+    if after:
+        stmt = stmt.where(tuple_(Session.created_at, Session.id) < tuple_(*after))
+    return stmt.order_by(Session.created_at.desc(), Session.id.desc()).limit(limit)
 
 
 class SessionService:
@@ -26,12 +105,10 @@ class SessionService:
         Creates a new session from a template.
         """
         # Validate template exists and belongs to the organization
-        stmt = select(SessionTemplate).where(
-            SessionTemplate.id == session_template_id,
-            SessionTemplate.organization_id == organization_id,
+        # (served from the template cache on the hot path)
+        template = await get_session_template_for_launch(
+            db, session_template_id, organization_id
         )
-        result = await db.execute(stmt)
-        template = result.scalar_one_or_none()
 
         if not template:
             # Raise appropriate error (FastAPI router should catch and return 400/404)
@@ -85,26 +162,30 @@ class SessionService:
         # Calculate absolute expiry time
         token_expiry = datetime.now(timezone.utc) + timedelta(seconds=ttl)
 
-        # Create Session record in DB
-        new_session = Session(
-            organization_id=organization_id,
-            session_template_id=session_template_id,
-            user_id=user_id,
-            modality_profile=modality_profile_str,
-            enabled_panels=template.enabled_panels,
-            token_expiry=token_expiry,
-            room_name=room_name,
-            status="created",  # Initial status
-            started_at=None,
-            ended_at=None,
+        # Create Session record in DB in a single round trip; nothing else
+        # of the new row is needed, so there is no refresh
+        stmt = (
+            insert(Session)
+            .values(
+                organization_id=organization_id,
+                session_template_id=session_template_id,
+                user_id=user_id,
+                modality_profile=modality_profile_str,
+                enabled_panels=template.enabled_panels,
+                token_expiry=token_expiry,
+                room_name=room_name,
+                status="created",  # Initial status
+                started_at=None,
+                ended_at=None,
+            )
+            .returning(Session.id)
         )
-
-        db.add(new_session)
+        result = await db.execute(stmt)
+        session_id = result.scalar_one()
         await db.commit()
-        await db.refresh(new_session)
 
         return SessionStartResponse(
-            session_id=new_session.id,
+            session_id=session_id,
             room_name=room_name,
             access_token=token,
             livekit_url=settings.LIVEKIT_URL,
@@ -137,29 +218,53 @@ class SessionService:
 
     @staticmethod
     async def list_sessions(
-        db: AsyncSession, organization_id: UUID, limit: int = 50, offset: int = 0
-    ) -> List[SessionStatusResponse]:
+        db: AsyncSession,
+        organization_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> SessionListResponse:
         """
-        Lists sessions for an organization.
+        Lists sessions for an organization, newest first.
+
+        Pages are keyed on (created_at, id) rather than an offset, so every
+        page is an index range scan no matter how deep it is.
         """
-        stmt = (
-            select(Session)
-            .where(Session.organization_id == organization_id)
-            .order_by(Session.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        filters = session_list_filters(
+            organization_id, statuses, created_after, created_before
         )
+        after = decode_cursor(cursor) if cursor else None
+        # One extra row tells whether there is a next page
+        stmt = session_page_query(filters, limit + 1, after)
 
         result = await db.execute(stmt)
-        sessions = result.scalars().all()
-
-        return [
-            SessionStatusResponse(
-                id=s.id,
-                room_name=s.room_name,
-                status=s.status,
-                started_at=s.started_at,
-                ended_at=s.ended_at,
+        sessions = list(result.scalars().all())
+
+        next_cursor = None
+        if len(sessions) > limit:
+            sessions = sessions[:limit]
+            last = sessions[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        estimated_total = None
+        if cursor is None:
+            estimated_total = await estimate_row_count(
+                db, select(Session.id).where(*filters)
             )
-            for s in sessions
-        ]
+
+        return SessionListResponse(
+            items=[
+                SessionStatusResponse(
+                    id=s.id,
+                    room_name=s.room_name,
+                    status=s.status,
+                    started_at=s.started_at,
+                    ended_at=s.ended_at,
+                )
+                for s in sessions
+            ],
+            next_cursor=next_cursor,
+            estimated_total=estimated_total,
+        )
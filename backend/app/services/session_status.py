@@ -0,0 +1,132 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from redis.asyncio.client import PubSub
+
+from app.cache.redis import get_redis_client
+from app.core.config import settings
+from app.schemas.session import SessionStatusResponse
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "session_status"
+
+
+def status_channel(session_id: UUID) -> str:
+    return f"{CHANNEL_PREFIX}:{session_id}"
+
+
+async def publish_session_statuses(statuses: Iterable[SessionStatusResponse]) -> None:
+    """
+    Publish the current status of sessions whose state just changed. Call
+    this after the change is committed.
+    """
+    async with get_redis_client().pipeline(transaction=False) as pipe:
+        for status in statuses:
+            pipe.publish(status_channel(status.id), status.model_dump_json())
+        await pipe.execute()
+
+
+class StatusSubscription:
+    """One client's view of a session's status channel."""
+
+    def __init__(self, hub: "SessionStatusHub", channel: str):
+        self._hub = hub
+        self.channel = channel
+        # Only the latest statuses matter, so a slow client drops old ones
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE)
+
+    def deliver(self, data: str) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(data)
+
+    async def aclose(self) -> None:
+        await self._hub._unsubscribe(self)
+
+
+class SessionStatusHub:
+    """
+    Fans session status messages from Redis out to SSE connections.
+
+    A worker process holds a single pub/sub connection and subscribes to a
+    session's channel while at least one client is listening to it, so an
+    open SSE stream costs a small queue rather than a Redis connection.
+    """
+
+    def __init__(self):
+        self._pubsub: Optional[PubSub] = None
+        self._subscriptions: Dict[str, Set[StatusSubscription]] = {}
+        self._has_channels = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    async def subscribe(self, session_id: UUID) -> StatusSubscription:
+        if self._pubsub is None:
+            raise RuntimeError("SessionStatusHub is not started")
+        subscription = StatusSubscription(self, status_channel(session_id))
+        subscribers = self._subscriptions.setdefault(subscription.channel, set())
+        subscribers.add(subscription)
+        if len(subscribers) == 1:
+            await self._pubsub.subscribe(subscription.channel)
+            self._has_channels.set()
+        return subscription
+
+    async def _unsubscribe(self, subscription: StatusSubscription) -> None:
+        subscribers = self._subscriptions.get(subscription.channel)
+        if not subscribers or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.channel]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(subscription.channel)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not self._subscriptions:
+                    self._has_channels.clear()
+                    await self._has_channels.wait()
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is None or message["type"] != "message":
+                    continue
+                for subscription in self._subscriptions.get(message["channel"], ()):
+                    subscription.deliver(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Session status subscription failed: {e}")
+                await asyncio.sleep(1)
+
+
+status_hub = SessionStatusHub()
+
+
+def format_sse(data: str, event: str = "status") -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def is_final(data: str) -> bool:
+    return json.loads(data).get("status") == "ended"
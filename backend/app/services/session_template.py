@@ -1,12 +1,25 @@
+from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import Select, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.org_versions import bump_org_version
+from app.cache.session_templates import (
+    cache_template,
+    get_cached_template,
+    invalidate_template,
+    template_generation,
+)
 from app.exceptions.base import NotFoundException
 from app.models.agent import Agent
 from app.models.session_template import SessionTemplate
-from app.schemas.session_template import SessionTemplateCreate, SessionTemplateUpdate
+from app.schemas.session_template import (
+    SessionTemplateCreate,
+    SessionTemplateLaunch,
+    SessionTemplateListItem,
+    SessionTemplateUpdate,
+)
 
 
 async def validate_agent_ids(
@@ -103,6 +116,7 @@ async def create_session_template(
     db.add(session_template)
     await db.commit()
     await db.refresh(session_template)
+    await bump_org_version(organization_id)
     return session_template
 
 
@@ -123,19 +137,77 @@ async def get_session_template(
     return template
 
 
-async def list_session_templates(
-    db: AsyncSession, organization_id: UUID
-) -> list[SessionTemplate]:
-    query = (
-        select(SessionTemplate)
+async def get_session_template_for_launch(
+    db: AsyncSession, template_id: UUID, organization_id: UUID
+) -> Optional[SessionTemplateLaunch]:
+    """
+    Resolve an active template for session start, from the cache when
+    possible. Returns None if it does not exist in this organization.
+    """
+    template = await get_cached_template(organization_id, template_id)
+    if template is not None:
+        return template
+
+    generation = await template_generation(organization_id, template_id)
+    query = select(
+        SessionTemplate.id,
+        SessionTemplate.organization_id,
+        SessionTemplate.modality_profile,
+        SessionTemplate.enabled_panels,
+        SessionTemplate.max_duration_seconds,
+    ).where(
+        SessionTemplate.id == template_id,
+        SessionTemplate.organization_id == organization_id,
+        SessionTemplate.is_active == True,  # noqa: E712
+    )
+    result = await db.execute(query)
+    row = result.one_or_none()
+    if not row:
+        return None
+
+    template = SessionTemplateLaunch.model_validate(row)
+    await cache_template(template, generation)
+    return template
+
+
+# Every column except description, which is free text and only shown on the
+# template's own page
+_LIST_COLUMNS = (
+    SessionTemplate.id,
+    SessionTemplate.organization_id,
+    SessionTemplate.name,
+    SessionTemplate.agent_ids,
+    SessionTemplate.initial_agent_id,
+    SessionTemplate.modality_profile,
+    SessionTemplate.enabled_panels,
+    SessionTemplate.max_duration_seconds,
+    SessionTemplate.idle_timeout_seconds,
+    SessionTemplate.is_active,
+    SessionTemplate.created_at,
+    SessionTemplate.updated_at,
+)
+
+
+def session_template_list_query(organization_id: UUID) -> Select:
+    """
+    The session templates listing query: active templates, newest first, to
+    match ix_session_templates_organization_id_created_at_active.
+    """
+    return (
+        select(*_LIST_COLUMNS)
         .where(
             SessionTemplate.organization_id == organization_id,
             SessionTemplate.is_active == True,  # noqa: E712
         )
         .order_by(desc(SessionTemplate.created_at))
     )
-    result = await db.execute(query)
-    return list(result.scalars().all())
+
+
+async def list_session_templates(
+    db: AsyncSession, organization_id: UUID
+) -> list[SessionTemplateListItem]:
+    result = await db.execute(session_template_list_query(organization_id))
+    return [SessionTemplateListItem.model_validate(row) for row in result]
 
 
 async def update_session_template(
@@ -187,6 +259,8 @@ async def update_session_template(
 
     await db.commit()
     await db.refresh(template)
+    await invalidate_template(organization_id, template_id)
+    await bump_org_version(organization_id)
     return template
 
 
@@ -196,6 +270,8 @@ async def delete_session_template(
     template = await get_session_template(db, template_id, organization_id)
     template.is_active = False
     await db.commit()
+    await invalidate_template(organization_id, template_id)
+    await bump_org_version(organization_id)
 
 
 async def clone_session_template(
@@ -217,4 +293,5 @@ async def clone_session_template(
     db.add(new_template)
     await db.commit()
     await db.refresh(new_template)
+    await bump_org_version(organization_id)
     return new_template
@@ -0,0 +1,87 @@
+"""
+Benchmark POST /sessions/start: latency percentiles and throughput.
+
+Logs in once (seeded admin by default), then fires REQUESTS session starts
+with CONCURRENCY requests in flight, all sharing the login cookies.
+
+    poetry run python scripts/benchmark_session_start.py \
+        --template-id <uuid> --requests 500 --concurrency 20
+"""
+
+import argparse
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+API_URL = os.getenv("API_URL", "http://localhost:8000/api/v1")
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[max(index, 0)]
+
+
+def login(email: str, password: str) -> requests.cookies.RequestsCookieJar:
+    response = requests.post(
+        f"{API_URL}/auth/login", json={"email": email, "password": password}
+    )
+    response.raise_for_status()
+    return response.cookies
+
+
+def run(args: argparse.Namespace) -> None:
+    cookies = login(args.email, args.password)
+    payload = {"session_template_id": args.template_id, "user_id": "benchmark"}
+    url = f"{API_URL}/sessions/start"
+
+    # One HTTP session per worker thread so connections are kept alive
+    local = threading.local()
+
+    def start_session(_: int) -> tuple[float, int]:
+        if not hasattr(local, "http"):
+            local.http = requests.Session()
+            local.http.cookies.update(cookies)
+        started = time.perf_counter()
+        response = local.http.post(url, json=payload)
+        return time.perf_counter() - started, response.status_code
+
+    # Warm up connections and caches before measuring
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(start_session, range(args.warmup)))
+
+        started = time.perf_counter()
+        results = list(pool.map(start_session, range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, code in results if code == 201)
+    errors = len(results) - len(latencies)
+    if not latencies:
+        print(f"All {errors} requests failed")
+        return
+
+    print(f"Requests:    {len(results)} ({errors} failed)")
+    print(f"Concurrency: {args.concurrency}")
+    print(f"Throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"Mean:        {statistics.mean(latencies) * 1000:.1f} ms")
+    for pct in (50, 90, 99):
+        print(f"p{pct}:         {percentile(latencies, pct) * 1000:.1f} ms")
+    print(f"Max:         {latencies[-1] * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--template-id", required=True)
+    parser.add_argument("--email", default="admin@test.com")
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()